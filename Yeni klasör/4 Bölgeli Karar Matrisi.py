@@ -6,10 +6,17 @@ from scipy import stats
 # Ders notlarında (dersnot_5744_1765368721.pdf) regresyon için scikit-learn kullanıldığı için eklenmiştir[cite: 355, 357].
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
+from segmentasyon import segment_ata
+from yeniden_ornekleme import grup_karsilastir
+from korelasyon_matrisi import korelasyon_matrisi
+from etiket_yerlesimi import etiketle
+from grafik_cikti import goster
+from profil import bolum
 
 # ---------------------------------------------------------
 # 1. VERİ SETİ OLUŞTURMA
 # ---------------------------------------------------------
+bolum('VERİ YÜKLEME')
 # message.txt dosyası olmadığı için örnek veri seti oluşturuluyor.
 data = {
     'Il': ['İstanbul', 'Ankara', 'İzmir', 'Bursa', 'Antalya', 'Adana', 'Konya', 'Gaziantep', 'Mersin', 'Kayseri', 'Eskişehir', 'Trabzon', 'Samsun', 'Denizli', 'Şanlıurfa', 'Malatya', 'Erzurum', 'Diyarbakır', 'Kocaeli', 'Manisa'],
@@ -23,33 +30,37 @@ df = df.rename(columns={'Il': 'Sehir'})
 # ---------------------------------------------------------
 # 2. HESAPLAMALAR VE KATEGORİZASYON
 # ---------------------------------------------------------
+bolum('HESAPLAMALAR', satir=len(df))
 df['Tasarruf'] = df['Maas'] - df['Kira']
 
-avg_tasarruf = df['Tasarruf'].mean()
-avg_suc = df['Suc_Orani'].mean()
-
-def kategori_belirle(row):
-    if row['Tasarruf'] >= avg_tasarruf and row['Suc_Orani'] <= avg_suc:
-        return 'İdeal (Zengin & Güvenli)'
-    elif row['Tasarruf'] >= avg_tasarruf and row['Suc_Orani'] > avg_suc:
-        return 'Riskli Cazibe (Zengin ama Tehlikeli)'
-    elif row['Tasarruf'] < avg_tasarruf and row['Suc_Orani'] <= avg_suc:
-        return 'Mütevazı Liman (Fakir ama Güvenli)'
-    else:
-        return 'Alarm Veren (Fakir & Tehlikeli)'
+# (Tasarruf yüksek mi?, Suç yüksek mi?) -> Kategori
+kategori_tablosu = {
+    (True, False): 'İdeal (Zengin & Güvenli)',
+    (True, True): 'Riskli Cazibe (Zengin ama Tehlikeli)',
+    (False, False): 'Mütevazı Liman (Fakir ama Güvenli)',
+    (False, True): 'Alarm Veren (Fakir & Tehlikeli)',
+}
 
-df['Kategori'] = df.apply(kategori_belirle, axis=1)
+# Tasarruf ortalamaya eşitse "zengin", suç ortalamaya eşitse "güvenli" sayılır
+df['Kategori'], (avg_tasarruf, avg_suc) = segment_ata(
+    df['Tasarruf'], df['Suc_Orani'], kategori_tablosu,
+    x_esik='ortalama', y_esik='ortalama', x_esit_yuksek=True, y_esit_yuksek=False)
 
 # ---------------------------------------------------------
 # 3. İSTATİSTİKSEL ANALİZLER (DERS NOTLARINA UYGUN)
 # ---------------------------------------------------------
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
 print("--- İSTATİSTİKSEL ANALİZ RAPORU ---\n")
 
 # A) KORELASYON ANALİZİ (Dosya: dersnot...8705.pdf)
 # Değişkenler arasındaki ilişkinin yönünü ve gücünü ölçer (Pearson r).
-corr_matrix = df[['Maas', 'Kira', 'Tasarruf', 'Suc_Orani']].corr()
+# r ve p-değeri matrisleri tek seferde (korelasyon_matrisi.py)
+korelasyon = korelasyon_matrisi(df, ['Maas', 'Kira', 'Tasarruf', 'Suc_Orani'])
+corr_matrix = korelasyon['r']
 print("1. KORELASYON MATRİSİ:")
 print(corr_matrix)
+print("\nP-DEĞERİ MATRİSİ (H0: r = 0):")
+print(korelasyon['p'].round(4))
 print("\nNot: Korelasyon nedensellik belirtmez, sadece ilişkiyi gösterir[cite: 473].\n")
 
 # B) HİPOTEZ TESTİ (Dosya: dersnot...8749.pdf)
@@ -73,7 +84,16 @@ if p_y > 0.05 and p_d > 0.05:
     else:
         print("Karar: H0 Reddedilemedi. Anlamlı bir fark yok.")
 else:
-    print("Veriler normal dağılım göstermediği için parametrik olmayan Mann-Whitney U testi önerilir[cite: 922].")
+    # Veriler normal dağılmıyorsa parametrik olmayan test gerekir[cite: 922].
+    # Dağılım varsayımı yapmayan permütasyon testi ve bootstrap güven aralığı:
+    yo = grup_karsilastir(yuksek_suc, dusuk_suc)
+    print("Veriler normal dağılım göstermediği için permütasyon testi uygulandı.")
+    print(f"Permütasyon p-değeri = {yo['p']:.4f} ({yo['ornek_sayisi']:,} örnek)")
+    print(f"Ortalama Tasarruf Farkı %95 Bootstrap GA: [{yo['alt']:.0f}, {yo['ust']:.0f}] TL")
+    if yo['p'] < 0.05:
+        print("Karar: H0 Reddedildi. Gruplar arasında anlamlı fark var.")
+    else:
+        print("Karar: H0 Reddedilemedi. Anlamlı bir fark yok.")
 
 # C) REGRESYON ANALİZİ (Dosya: dersnot...8721.pdf)
 # Tasarruf miktarını kullanarak Suç Oranını tahmin eden model.
@@ -96,6 +116,7 @@ print("-" * 40)
 # ---------------------------------------------------------
 # 4. GÖRSELLEŞTİRME
 # ---------------------------------------------------------
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 plt.figure(figsize=(14, 10))
 
 # Veri Noktaları
@@ -109,11 +130,11 @@ plt.axvline(x=avg_tasarruf, color='gray', linestyle='--', linewidth=1)
 plt.axhline(y=avg_suc, color='gray', linestyle='--', linewidth=1)
 
 # Etiketler ve Açıklamalar
-for k in df['Kategori'].unique():
-    subset = df[df['Kategori'] == k]
-    head_tail = pd.concat([subset.head(2), subset.tail(2)])
-    for i, row in head_tail.iterrows():
-        plt.text(row['Tasarruf'], row['Suc_Orani']+0.01, row['Sehir'], fontsize=9, fontweight='bold', color='black')
+# Her bölgeden ilk ve son iki şehir; çakışan etiketler kaydırılır ya da atlanır
+head_tail = pd.concat([pd.concat([df[df['Kategori'] == k].head(2), df[df['Kategori'] == k].tail(2)])
+                       for k in df['Kategori'].unique()])
+etiketle(plt.gca(), head_tail['Tasarruf'], head_tail['Suc_Orani'], head_tail['Sehir'],
+         konumlar=('ust', 'sag', 'sol', 'alt'), fontsize=9, fontweight='bold', color='black')
 
 # Bölge İsimleri
 plt.text(df['Tasarruf'].max(), df['Suc_Orani'].min(), 'İDEAL BÖLGE', ha='right', va='bottom', fontsize=12, color='green', fontweight='bold', bbox=dict(facecolor='white', alpha=0.7))
@@ -127,4 +148,4 @@ plt.ylabel('Suç Oranı (%)', fontsize=12)
 plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
 plt.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.show()
\ No newline at end of file
+goster('karar_matrisi')
\ No newline at end of file
@@ -5,10 +5,15 @@ import numpy as np
 from scipy import stats
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score
+from yeniden_ornekleme import grup_karsilastir
+from etiket_yerlesimi import etiketle
+from grafik_cikti import goster
+from profil import bolum
 
 # ---------------------------------------------------------
 # 1. VERİ YÜKLEME
 # ---------------------------------------------------------
+bolum('VERİ YÜKLEME')
 # Kendi dosyanı kullanmak için alttaki satırın başındaki # işaretini kaldır:
 # df = pd.read_csv('message.txt')
 
@@ -33,8 +38,10 @@ if 'Ortalama_Maas' in df.columns:
 # ---------------------------------------------------------
 # 2. HESAPLAMALAR VE ANALİZLER (PDF ENTEGRASYONU)
 # ---------------------------------------------------------
+bolum('HESAPLAMALAR', satir=len(df))
 df['Barinma_Yuku'] = (df['Kira'] / df['Maas']) * 100
 
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
 print("\n--- BİLİMSEL ANALİZ RAPORU ---")
 
 # A) KORELASYON
@@ -56,11 +63,17 @@ grup_zengin = df[df['Maas'] >= avg_maas]['Barinma_Yuku']
 grup_normal = df[df['Maas'] < avg_maas]['Barinma_Yuku']
 t_stat, p_val = stats.ttest_ind(grup_zengin, grup_normal)
 print(f"[3] Hipotez Testi p-değeri: {p_val:.4f}")
+
+# D) YENİDEN ÖRNEKLEME (Normallik varsayımı olmadan)
+yo = grup_karsilastir(grup_zengin, grup_normal)
+print(f"[4] Permütasyon p-değeri: {yo['p']:.4f} ({yo['ornek_sayisi']:,} örnek)")
+print(f"    Ortalama Fark %95 Bootstrap GA: [{yo['alt']:.2f}, {yo['ust']:.2f}]")
 print("-" * 30)
 
 # ---------------------------------------------------------
 # 3. GÖRSELLEŞTİRME (YAN YANA İKİ GRAFİK)
 # ---------------------------------------------------------
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 fig, axes = plt.subplots(1, 2, figsize=(20, 8))
 
 # --- SOL GRAFİK: LOLLIPOP (SENİN ORİJİNAL AYARLARINLA) ---
@@ -90,9 +103,9 @@ axes[0].grid(True, axis='x', linestyle='--', alpha=0.3)
 sns.scatterplot(x=df['Maas'], y=df['Kira'], s=100, color='blue', alpha=0.6, ax=axes[1], label='Şehir Verileri')
 axes[1].plot(df['Maas'], y_pred, color='red', linewidth=2, label=f'Regresyon Doğrusu (R2={r2:.2f})')
 
-# Şehir isimlerini noktalara ekleyelim (Karışıklık olmasın diye sadece bazıları veya hepsi)
-for i in range(len(df)):
-    axes[1].text(df['Maas'].iloc[i]+100, df['Kira'].iloc[i], df['Sehir'].iloc[i], fontsize=8, alpha=0.7)
+# Şehir isimlerini noktalara ekleyelim (Karışıklık olmasın diye çakışanlar atlanır;
+# barınma yükü yüksek olanlar önce yerleşir)
+etiketle(axes[1], df['Maas'], df['Kira'], df['Sehir'], oncelik=df['Barinma_Yuku'], fontsize=8, alpha=0.7)
 
 axes[1].set_title('Regresyon Analizi: Maaş Arttıkça Kira Ne Oluyor?', fontsize=14, fontweight='bold')
 axes[1].set_xlabel('Ortalama Maaş (TL)')
@@ -101,4 +114,4 @@ axes[1].legend()
 axes[1].grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.show()
\ No newline at end of file
+goster('barinma_yuku')
\ No newline at end of file
@@ -1,52 +1,54 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from scipy import stats
-
+from istatistik_cekirdek import dogrusal_regresyon
+from regresyon_grafik import regresyon_ciz
+from veri_yukleyici import veri_yukle
+from turetilmis_sutunlar import turet
+from etiket_yerlesimi import etiketle
+from yogunluk_grafigi import dagilim_ciz
+from grafik_cikti import goster
+from profil import bolum
+
+bolum('VERİ YÜKLEME')
 try:
-    df = pd.read_csv('message.txt')
+    df = veri_yukle('message.txt')
 except FileNotFoundError:
     print("HATA: message.txt dosyası bulunamadı.")
     exit()
 
 # --- VERİ TEMİZLEME ---
-df.columns = df.columns.str.strip().str.replace(' ', '_').str.replace('yıllık_ortalama_sicaklik', 'Sicaklik')
-df.rename(columns={'Ortalama_Maas': 'Gelir', 'Eğitim': 'Egitim', 'Suc_Orani': 'Suc'}, inplace=True)
+bolum('HESAPLAMALAR', satir=len(df))
 df.dropna(subset=['Egitim', 'Gelir', 'Issizlik', 'Suc', 'Nufus'], inplace=True)
 
-# --- NORMALİZASYON ---
-min_gelir, max_gelir = df['Gelir'].min(), df['Gelir'].max()
-df['Gelir_Norm'] = (df['Gelir'] - min_gelir) / (max_gelir - min_gelir + 1e-6)
-
-min_egitim, max_egitim = df['Egitim'].min(), df['Egitim'].max()
-df['Egitim_Norm'] = (df['Egitim'] - min_egitim) / (max_egitim - min_egitim + 1e-6)
-
-# --- EFDE HESAPLAMA ---
-df['EFDE'] = df['Gelir_Norm'] / (df['Issizlik'] + df['Suc'] + 1e-6)
+# --- NORMALİZASYON VE EFDE HESAPLAMA ---
+# Gelir_Norm, Egitim_Norm ve EFDE formülleri turetilmis_sutunlar.py'de tanımlı
+df = turet(df, ['Gelir_Norm', 'Egitim_Norm', 'EFDE'])
 
 # --- KORELASYON VE HİPOTEZ TESTİ ---
-r_val, p_val = stats.pearsonr(df['EFDE'], df['Egitim_Norm'])
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
+regresyon = dogrusal_regresyon(df['EFDE'], df['Egitim_Norm'])
+r_val, p_val = regresyon.r, regresyon.p
 gecerlilik = "GEÇERLİ" if p_val < 0.05 else "GEÇERSİZ"
 
 # --- GRAFİK OLUŞTURMA ---
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 plt.figure(figsize=(12, 7))
 
 # 1. Eğilim Çizgisi (Regresyon)
-sns.regplot(x='EFDE', y='Egitim_Norm', data=df, scatter=False, color='red', line_kws={"label": "Eğilim Çizgisi"})
+# Bant kapalı formda, yukarıdaki regresyondan (bootstrap yok)
+regresyon_ciz(regresyon, df['EFDE'], color='red', line_kws={"label": "Eğilim Çizgisi"})
 
 # 2. Dağılım Grafiği (Scatter)
-sns.scatterplot(
-    x='EFDE', y='Egitim_Norm', data=df, 
-    size='Nufus', sizes=(100, 1000), alpha=0.7, hue='EFDE', palette="viridis", edgecolor="w"
+# Satır sayısı yoğunluk eşiğini aşarsa noktalar kutulanıp tek görüntü olarak çizilir
+dagilim_ciz(
+    df, 'EFDE', 'Egitim_Norm', boyut='Nufus', renk='EFDE',
+    sizes=(100, 1000), alpha=0.7, palette="viridis", edgecolor="w"
 )
 
 # 3. Şehir Etiketleri
 critical_cities = ['İstanbul', 'Ankara','Bursa','İzmir','Antalya','Hakkari']
-for il in critical_cities:
-    if il in df['Il'].values:
-        row = df[df['Il'] == il].iloc[0]
-        plt.text(row['EFDE'], row['Egitim_Norm'] + 0.02, il, fontsize=10, weight='bold', ha='center')
+kritik = df[df['Il'].isin(critical_cities)]
+etiketle(plt.gca(), kritik['EFDE'], kritik['Egitim_Norm'], kritik['Il'], oncelik=kritik['Nufus'],
+         konumlar=('ust', 'sag', 'sol', 'alt'), fontsize=10, fontweight='bold')
 
 
 
@@ -76,5 +78,5 @@ plt.ylabel('Eğitim Seviyesi (Normalize)', fontsize=12)
 plt.grid(True, linestyle='--', alpha=0.5)
 
 plt.tight_layout()
-plt.show()
+goster('egitim_firsati')
 
@@ -2,38 +2,34 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
-from scipy import stats
+from veri_yukleyici import veri_yukle
+from model_secimi import gram_hazirla, model_kur, tum_altkumeler
+from grafik_cikti import goster
+from profil import bolum
 
 # 1. Veri Hazırlığı
+bolum('VERİ YÜKLEME')
 try:
-    df = pd.read_csv('message.txt')
-    df.columns = df.columns.str.strip().str.replace(' ', '_')
-    df.rename(columns={'Ortalama_Maas': 'Gelir', 'Eğitim': 'Egitim', 'Suc_Orani': 'Suc'}, inplace=True)
+    # Sütun temizleme ve sayısal dönüşüm ortak yükleyicide yapılıyor
+    df = veri_yukle('message.txt')
     
     cols = ['Gelir', 'Suc', 'Egitim', 'Issizlik', 'Nufus', 'Elektrik']
-    for col in cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
     df.dropna(subset=cols, inplace=True)
 except Exception as e:
     print(f"Hata: {e}")
     exit()
 
 # 2. İstatistiksel Hesaplama (Regresyon Modeli)
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
 features = ['Suc', 'Egitim', 'Issizlik', 'Nufus', 'Elektrik']
-X = df[features]
-y = df['Gelir']
+# XᵀX ve Xᵀy bir kez hesaplanır; tam model ve bütün alt kümeler buradan çözülür
+gram = gram_hazirla(df, features, 'Gelir')
+model = model_kur(gram, features)
 
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
-
-model = LinearRegression()
-model.fit(X_scaled, y)
-
-# Katsayıları gelirin ortalamasına oranlayarak "Yüzdesel Etki"ye çeviriyoruz
-etki_yuzdesi = (model.coef_ / df['Gelir'].mean()) * 100
+# Standartlaştırılmış katsayıları (1 standart sapmalık değişimin etkisi)
+# gelirin ortalamasına oranlayarak "Yüzdesel Etki"ye çeviriyoruz
+std_katsayi = model.katsayilar * gram.olcek
+etki_yuzdesi = (std_katsayi / df['Gelir'].mean()) * 100
 
 etki_df = pd.DataFrame({
     'Faktör': ['Suç Oranı', 'Eğitim (Kazanç)', 'İşsizlik (Kayıp)', 'Nüfus Etkisi', 'Altyapı/Elek.'],
@@ -41,11 +37,12 @@ etki_df = pd.DataFrame({
 }).sort_values(by='Degisim', ascending=False)
 
 # 3. Model Geçerlilik Testi (P-Value ve R-Kare)
-r_kare = model.score(X_scaled, y)
-# En güçlü faktör üzerinden genel bir p-değeri testi
-_, p_val = stats.pearsonr(df['Egitim'], df['Gelir']) 
+r_kare = model.r2
+# Modelin geneli için F-testi (H0: bütün katsayılar sıfır)
+p_val = model.f_p
 
 # 4. GRAFİK OLUŞTURMA
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 plt.figure(figsize=(12, 8))
 
 # Renkler: Kazançlar Mavi, Kayıplar Turuncu
@@ -67,11 +64,13 @@ plt.ylabel('Ortalama Gelirdeki Değişim Payı (%)', fontsize=12)
 plt.title(f'ŞEHİR EKONOMİSİ ETKİ ANALİZİ\n(Model Gücü: %{r_kare*100:.1f})', fontsize=15, fontweight='bold', pad=25)
 
 # 5. HİPOTEZ VE ANALİZ RAPORU (Terminale Yazdır)
+bolum('RAPOR', satir=len(df))
 print("\n" + "="*55)
 print("             HİPOTEZ TESTİ VE ANALİZ RAPORU")
 print("="*55)
 print(f"1. Modelin Tahmin Gücü (R-Kare): %{r_kare*100:.2f}")
-print(f"2. Hesaplanan P-Değeri: {p_val:.4f}")
+print(f"   Düzeltilmiş R-Kare: %{model.r2_duz*100:.2f}")
+print(f"2. Hesaplanan P-Değeri (F-testi): {p_val:.4f}")
 
 if p_val < 0.05:
     print("3. KARAR: P < 0.05 olduğu için model İSTATİSTİKSEL OLARAK GEÇERLİDİR.")
@@ -84,11 +83,23 @@ print("-" * 55)
 for i, row in etki_df.iterrows():
     fark = "ekstra kazanç sağlıyor" if row['Degisim'] > 0 else "geliri baltalıyor/götürüyor"
     print(f"-> [{row['Faktör']}]: Şehrin geliri üzerindeki payı %{abs(row['Degisim']):.2f} ({fark}).")
+
+# Katsayı bazında anlamlılık (H0: katsayı = 0)
+print("-" * 55)
+print("Katsayı Testleri:")
+katsayi_tablosu = model.tablo()
+katsayi_tablosu['Anlamlı'] = np.where(katsayi_tablosu['p'] < 0.05, 'Evet', 'Hayır')
+print(katsayi_tablosu.to_string(float_format=lambda v: f"{v:.4g}"))
+
+# En iyi alt küme (BIC): gereksiz değişkenler modelden çıkınca ne kalıyor?
+en_iyi = tum_altkumeler(gram).iloc[0]
+print(f"En İyi Alt Küme (BIC): {', '.join(en_iyi['degiskenler'])} "
+      f"(Düz. R-Kare: %{en_iyi['r2_duz']*100:.2f})")
 print("="*55)
 
 plt.grid(axis='y', linestyle=':', alpha=0.6)
 sns.despine(bottom=True, left=True)
 
 plt.tight_layout()
-plt.show()
+goster('gelir_etki_analizi')
 
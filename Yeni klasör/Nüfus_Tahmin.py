@@ -2,10 +2,12 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from scipy import stats
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
+from grafik_cikti import goster
+from profil import bolum
+from senaryo_motoru import YENILENME_DUZEYI, dogurganlik_modeli, nufus_yollari, senaryo_uret, yuzdelik_bantlari
 
 # 1. VERİ HAZIRLIĞI
+bolum('VERİ YÜKLEME')
 veriler = {
     2001: 2.38, 2014: 2.19, 2015: 2.16, 2016: 2.11, 2017: 2.08,
     2018: 2.00, 2019: 1.89, 2020: 1.77, 2021: 1.71, 2022: 1.63,
@@ -15,12 +17,13 @@ veriler = {
 # Veriyi analize uygun formata (DataFrame) çeviriyoruz.
 df = pd.DataFrame(list(veriler.items()), columns=['Yil', 'Dogurganlik'])
 
-def nufus_tahmini_yap_ve_ciz(baslangic_nufusu, yil_sayisi=5):
+def nufus_tahmini_yap_ve_ciz(baslangic_nufusu, yil_sayisi=5, senaryo_sayisi=10_000, tohum=42):
     print(f"--- BİLİMSEL ANALİZ RAPORU ---\n")
 
     # ---------------------------------------------------------
     # A) KORELASYON ANALİZİ (Dosya: dersnot...8705.pdf)
     # ---------------------------------------------------------
+    bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
     # Yıllar ilerledikçe doğurganlık hızı ne yönde değişiyor?
     # PDF [cite: 468, 475]'e göre Pearson korelasyon katsayısını hesaplıyoruz.
     korelasyon, _ = stats.pearsonr(df['Yil'], df['Dogurganlik'])
@@ -54,64 +57,66 @@ def nufus_tahmini_yap_ve_ciz(baslangic_nufusu, yil_sayisi=5):
     # ---------------------------------------------------------
     # Gelecek yılların doğurganlık hızını tahmin etmek için model kuruyoruz.
     # Model: Doğurganlık = b0 + b1 * Yıl [cite: 230]
-    X = df[['Yil']] # Bağımsız değişken (Girdi)
-    y = df['Dogurganlik'] # Bağımlı değişken (Çıktı)
-    
-    model = LinearRegression()
-    model.fit(X, y) # Modeli eğitiyoruz
-    
-    r2 = r2_score(y, model.predict(X)) # Modelin başarısı (R-Kare) [cite: 341]
+    # Aynı model Monte Carlo senaryolarında da kullanılır (senaryo_motoru.py)
+    model = dogurganlik_modeli(df['Yil'], df['Dogurganlik'])
+    regresyon = model['regresyon']
+    r2 = regresyon.r2 # Modelin başarısı (R-Kare) [cite: 341]
     
     print(f"[3] REGRESYON ANALİZİ:")
-    print(f"Model Denklemi: Doğurganlık = {model.intercept_:.2f} + ({model.coef_[0]:.4f} * Yıl)")
+    print(f"Model Denklemi: Doğurganlık = {regresyon.kesisim:.2f} + ({regresyon.egim:.4f} * Yıl)")
     print(f"Model Güvenilirliği (R2): {r2:.3f}")
     print("-" * 30)
 
     # ---------------------------------------------------------
     # NÜFUS TAHMİNİ (DİNAMİK HESAPLAMA)
     # ---------------------------------------------------------
-    current_population = baslangic_nufusu
-    yenilenme_duzeyi = 2.10
-    
-    yillar_plot = [2024]
-    nufuslar_plot = [current_population]
-    tahmin_edilen_hizlar = [] # Grafik için saklayalım
+    bolum('HESAPLAMALAR')
+    # Her yılın doğurganlık hızı regresyonla tahmin edilir ve nüfus, hız ile
+    # yenilenme düzeyi (2.10) arasındaki farka göre ilerletilir:
+    #   yuzde = (hiz - 2.10) / 2.10 * 100 ;  nufus *= 1 + yuzde / 1000
+    # Not: Matematiksel olarak nüfus artış hızı genellikle
+    # (Doğum - Ölüm + Göç) ile hesaplanır; bu, doğurganlık farkına dayalı
+    # bir simülasyondur. Bütün yıllar nufus_yollari ile tek adımda hesaplanır.
+    gelecek_yillar = np.arange(2025, 2025 + yil_sayisi)
+    tahmin_edilen_hizlar = regresyon.tahmin(gelecek_yillar)
+    nufus_yolu = nufus_yollari(tahmin_edilen_hizlar, baslangic_nufusu, YENILENME_DUZEYI)
+
+    yillar_plot = [2024] + gelecek_yillar.tolist()
+    nufuslar_plot = [baslangic_nufusu] + nufus_yolu.astype(int).tolist()
 
     print(f"\n--- Yıllık Simülasyon (Regresyon Destekli) ---")
-    
-    for i in range(1, yil_sayisi + 1):
-        gelecek_yil = 2024 + i
-        
-        # ADIM 1: O yılın doğurganlık hızını REGRESYON ile tahmin et
-        # Eski kodda sabit ortalama kullanılıyordu, şimdi model kullanıyoruz.
-        tahmini_hiz = model.predict([[gelecek_yil]])[0]
-        tahmin_edilen_hizlar.append(tahmini_hiz)
-        
-        # ADIM 2: Senin formülünle değişim yüzdesini hesapla
-        fark = tahmini_hiz - yenilenme_duzeyi
-        # Not: Formülünüzü korudum ancak matematiksel olarak nüfus artış hızı
-        # genellikle (Doğum - Ölüm + Göç) ile hesaplanır.
-        # Bu formül doğurganlık farkına dayalı bir simülasyondur.
-        yillik_degisim_yuzdesi = (fark / yenilenme_duzeyi) * 100 
-        
-        # ADIM 3: Nüfusu güncelle
-        degisim_miktari = current_population * (yillik_degisim_yuzdesi / 1000)
-        current_population += degisim_miktari
-        
-        yillar_plot.append(gelecek_yil)
-        nufuslar_plot.append(int(current_population))
-        
-        print(f"{gelecek_yil} Tahmini Hız: {tahmini_hiz:.2f} -> Nüfus: {int(current_population):,}")
+    for gelecek_yil, tahmini_hiz, nufus in zip(yillar_plot[1:], tahmin_edilen_hizlar, nufuslar_plot[1:]):
+        print(f"{gelecek_yil} Tahmini Hız: {tahmini_hiz:.2f} -> Nüfus: {nufus:,}")
+
+    # ---------------------------------------------------------
+    # MONTE CARLO SENARYOLARI (BELİRSİZLİK BANTLARI)
+    # ---------------------------------------------------------
+    bolum('MONTE CARLO SENARYOLARI')
+    # Tek yol yerine regresyon parametrelerinin belirsizliği ve artıkların
+    # yeniden örneklenmesiyle binlerce doğurganlık yolu aynı anda üretilir.
+    _, nufus_senaryolari = senaryo_uret(model, gelecek_yillar, baslangic_nufusu,
+                                        senaryo_sayisi=senaryo_sayisi, tohum=tohum)
+    bantlar = yuzdelik_bantlari(nufus_senaryolari)
+
+    print(f"\n--- Monte Carlo Senaryoları ({senaryo_sayisi:,} yol, tohum={tohum}) ---")
+    print(f"{yillar_plot[-1]} Nüfus Medyanı: {int(bantlar[50][-1]):,}")
+    print(f"%90 Aralık: {int(bantlar[5][-1]):,} - {int(bantlar[95][-1]):,}")
 
     # ---------------------------------------------------------
     # GÖRSELLEŞTİRME
     # ---------------------------------------------------------
+    bolum('GÖRSELLEŞTİRME')
     # Grafik 
 
 
 
     plt.figure(figsize=(12, 6))
     
+    # Senaryo Bantları (başlangıç yılı kesin değer)
+    bant = {k: np.concatenate([[baslangic_nufusu], v]) for k, v in bantlar.items()}
+    plt.fill_between(yillar_plot, bant[5], bant[95], color='#1f77b4', alpha=0.12, label='%90 Senaryo Bandı')
+    plt.fill_between(yillar_plot, bant[25], bant[75], color='#1f77b4', alpha=0.25, label='%50 Senaryo Bandı')
+
     # Ana Nüfus Grafiği
     plt.plot(yillar_plot, nufuslar_plot, marker='o', linestyle='-', color='#1f77b4', label='Tahmini Nüfus', linewidth=2)
     
@@ -121,13 +126,14 @@ def nufus_tahmini_yap_ve_ciz(baslangic_nufusu, yil_sayisi=5):
     plt.ylabel('Nüfus', fontsize=12)
     plt.grid(True, linestyle='--', alpha=0.5)
     plt.xticks(yillar_plot)
+    plt.legend(loc='upper left')
     
     # Değerleri yazdırma
     for x, y in zip(yillar_plot, nufuslar_plot):
         plt.text(x, y + (y*0.001), f'{y:,}', ha='center', va='bottom', fontsize=9, fontweight='bold')
 
     plt.tight_layout()
-    plt.show()
+    goster('nufus_tahmin')
 
 # --- KULLANIM ---
 turkiye_nufus_2024 = 85372377
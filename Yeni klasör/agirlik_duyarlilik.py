@@ -0,0 +1,130 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from profil import profillenir
+from sonuc_onbellegi import onbellekli
+
+# ---------------------------------------------------------
+# YAŞAM KALİTESİ ENDEKSİ AĞIRLIK DUYARLILIĞI
+# ---------------------------------------------------------
+# yaşam_kalite_endeksi.py'deki Yasam_Puan formülü normalize Maaş, Eğitim
+# (+1) ve Kira, İşsizlik, Suç (-1) ağırlıklarını sabit kabul ediyor. Burada
+# binlerce ağırlık vektörü altında bütün şehirler tek bir matris çarpımıyla
+# puanlanır:
+#     puanlar (ağırlık x şehir) = (W * işaret) (ağırlık x özellik) @ Xᵀ (özellik x şehir)
+# ve her şehir için sıra dağılımı, ilk-N'de kalma oranı ve her sıralamanın
+# eşit ağırlıklı (yayımlanan) sıralamaya Kendall uzaklığı raporlanır.
+
+# Yasam_Puan'daki yönler: artı = iyi, eksi = kötü
+ISARETLER = {'Maas': 1, 'Eğitim': 1, 'Kira': -1, 'Issizlik': -1, 'Suc_Orani': -1}
+
+
+def agirlik_ornekle(adet, ozellik_sayisi, tohum=42, yogunluk=1.0):
+    """
+    Simpleks üzerinden Dirichlet(yogunluk) ağırlıkları çeker ve özellik
+    sayısıyla ölçekler; böylece eşit ağırlık (hepsi 1) dağılımın merkezidir.
+    yogunluk büyüdükçe ağırlıklar eşit ağırlığa yakınlaşır.
+    """
+    rng = np.random.default_rng(tohum)
+    return rng.dirichlet(np.full(ozellik_sayisi, yogunluk), size=adet) * ozellik_sayisi
+
+
+def agirlik_izgarasi(ozellik_sayisi, adim=0.1):
+    """Toplamı 1 olan ve adim katlarından oluşan bütün ağırlık vektörleri (x özellik sayısı)."""
+    bolme = int(round(1 / adim))
+    satirlar = [c for c in itertools.product(range(bolme + 1), repeat=ozellik_sayisi - 1) if sum(c) <= bolme]
+    izgara = np.array([list(c) + [bolme - sum(c)] for c in satirlar], dtype=float) / bolme
+    return izgara * ozellik_sayisi
+
+
+def siralar(puanlar):
+    """(ağırlık x şehir) puanlarından 1 = en iyi olacak şekilde sıra numaraları."""
+    return np.argsort(np.argsort(-puanlar, axis=1, kind='stable'), axis=1, kind='stable') + 1
+
+
+def kendall_uzakliklari(puanlar, referans, parca_boyutu=1000):
+    """
+    Her sıralamanın referans sıralamaya normalize Kendall uzaklığı
+    (ters sıralanan şehir çiftlerinin oranı, 0 = aynı, 1 = tamamen ters).
+    """
+    i, j = np.triu_indices(puanlar.shape[1], k=1)
+    ref_isaret = np.sign(referans[i] - referans[j])
+    sonuc = np.empty(puanlar.shape[0])
+    for bas in range(0, puanlar.shape[0], parca_boyutu):
+        p = puanlar[bas:bas + parca_boyutu]
+        ters = np.sign(p[:, i] - p[:, j]) * ref_isaret < 0
+        sonuc[bas:bas + parca_boyutu] = ters.mean(axis=1)
+    return sonuc
+
+
+@profillenir()
+@onbellekli()
+def duyarlilik_analizi(df_norm, sehirler, agirliklar, isaretler=ISARETLER, ilk=20):
+    """
+    df_norm: şehir x özellik normalize tablo (sütunlar isaretler'in anahtarları)
+    agirliklar: (ağırlık sayısı x özellik) dizi
+    Dönüş: (şehir bazında özet DataFrame, Kendall uzaklıkları dizisi)
+    """
+    ozellikler = list(isaretler)
+    X = df_norm[ozellikler].to_numpy(dtype=float)                  # şehir x özellik
+    isaret = np.array([isaretler[o] for o in ozellikler], dtype=float)
+
+    puanlar = (agirliklar * isaret) @ X.T                            # ağırlık x şehir
+    referans = X @ isaret                                           # eşit ağırlık (yayımlanan)
+    sira = siralar(puanlar)
+    referans_sira = siralar(referans[None, :])[0]
+
+    ozet = pd.DataFrame({
+        'Sehir': np.asarray(sehirler),
+        'Yayimlanan_Sira': referans_sira,
+        'Medyan_Sira': np.median(sira, axis=0),
+        'Sira_%5': np.percentile(sira, 5, axis=0),
+        'Sira_%95': np.percentile(sira, 95, axis=0),
+        'En_Iyi': sira.min(axis=0),
+        'En_Kotu': sira.max(axis=0),
+        f'Ilk{ilk}_Orani': (sira <= ilk).mean(axis=0),
+    }).sort_values('Yayimlanan_Sira').reset_index(drop=True)
+    return ozet, kendall_uzakliklari(puanlar, referans)
+
+
+if __name__ == '__main__':
+    import argparse
+    from veri_yukleyici import veri_yukle
+
+    parser = argparse.ArgumentParser(description="Yaşam Kalitesi sıralamasının ağırlık duyarlılığı (81 il).")
+    parser.add_argument('--adet', type=int, default=10_000, help="Dirichlet ağırlık sayısı")
+    parser.add_argument('--izgara', type=float, default=None, help="Örnekleme yerine ızgara adımı, ör. 0.1")
+    parser.add_argument('--ilk', type=int, default=20)
+    parser.add_argument('--veri', default='message.txt')
+    args = parser.parse_args()
+
+    try:
+        df = veri_yukle(args.veri)
+    except FileNotFoundError:
+        print(f"HATA: {args.veri} dosyası bulunamadı.")
+        exit()
+
+    # Yükleyicinin standart sütun adlarıyla aynı yönler
+    isaretler = {'Gelir': 1, 'Egitim': 1, 'Kira': -1, 'Issizlik': -1, 'Suc': -1}
+    df = df.dropna(subset=list(isaretler)).reset_index(drop=True)
+    df_norm = df[list(isaretler)]
+    df_norm = (df_norm - df_norm.min()) / (df_norm.max() - df_norm.min())
+
+    if args.izgara:
+        W = agirlik_izgarasi(len(isaretler), args.izgara)
+    else:
+        W = agirlik_ornekle(args.adet, len(isaretler))
+    ozet, kendall = duyarlilik_analizi(df_norm, df['Il'], W, isaretler, args.ilk)
+
+    print("\n" + "="*75)
+    print(f"      AĞIRLIK DUYARLILIĞI ({len(W)} ağırlık vektörü, {len(df)} il)")
+    print("="*75)
+    print(ozet.head(args.ilk).to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    print("-"*75)
+    sabit = (ozet[f'Ilk{args.ilk}_Orani'] >= 0.9).sum()
+    print(f"İlk {args.ilk}'de ağırlıkların en az %90'ında kalan il sayısı: {sabit}")
+    print(f"Kendall uzaklığı (yayımlanan sıralamaya): medyan {np.median(kendall):.3f} | "
+          f"%95 {np.percentile(kendall, 95):.3f} | en fazla {kendall.max():.3f}")
+    print("="*75)
@@ -0,0 +1,296 @@
+import math
+import sys
+
+import numpy as np
+
+from istatistik_cekirdek import t_p_degeri
+from veri_yukleyici import parcali_oku
+
+# ---------------------------------------------------------
+# AKIŞ (STREAMING) MODU: TEK GEÇİŞLİ İSTATİSTİKLER
+# ---------------------------------------------------------
+# Dosya parça parça okunur ve yalnızca küçük birikimciler bellekte tutulur:
+#   - MinMax     -> normalize() için en küçük / en büyük değer
+#   - Welford    -> ortalama ve varyans (sayısal olarak kararlı)
+#   - EsMoment   -> Pearson r, p-değeri ve OLS eğimi için eş-moment toplamları
+#   - KuantilTaslagi (aykiri_deger.py) -> korelasyondan önce aykırı satırları
+#     ayıran endeksler için kesim sınırı (ör. Baskı Endeksi'nde %95)
+# Her birikimci birlestir() ile başka bir parçanın/işçinin sonucuyla
+# birleştirilebilir (Chan vd. paralel formülü). scipy.stats içe aktarılmaz;
+# p-değeri istatistik_cekirdek.t_p_degeri ile hesaplanır.
+
+
+def temiz(x):
+    """float dizisine çevirir, NaN değerleri atar."""
+    x = np.asarray(x, dtype=float)
+    return x[~np.isnan(x)]
+
+
+class MinMax:
+    def __init__(self):
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def guncelle(self, x):
+        x = temiz(x)
+        if x.size:
+            self.n += x.size
+            self.min = min(self.min, float(x.min()))
+            self.max = max(self.max, float(x.max()))
+        return self
+
+    def birlestir(self, diger):
+        self.n += diger.n
+        self.min = min(self.min, diger.min)
+        self.max = max(self.max, diger.max)
+        return self
+
+    def normalize(self, x):
+        # Scriptlerdeki normalize() ile aynı formül (+1e-6 sıfıra bölmeyi önler)
+        return (x - self.min) / (self.max - self.min + 1e-6)
+
+
+class Welford:
+    def __init__(self):
+        self.n = 0
+        self.ortalama = 0.0
+        self.m2 = 0.0
+
+    def guncelle(self, x):
+        x = temiz(x)
+        if x.size:
+            parca = Welford()
+            parca.n = x.size
+            parca.ortalama = float(x.mean())
+            parca.m2 = float(((x - parca.ortalama) ** 2).sum())
+            self.birlestir(parca)
+        return self
+
+    def birlestir(self, diger):
+        if diger.n == 0:
+            return self
+        n = self.n + diger.n
+        delta = diger.ortalama - self.ortalama
+        self.ortalama += delta * diger.n / n
+        self.m2 += diger.m2 + delta ** 2 * self.n * diger.n / n
+        self.n = n
+        return self
+
+    @property
+    def varyans(self):
+        # pandas .var() ile uyumlu olsun diye örneklem varyansı (ddof=1)
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.varyans)
+
+
+class EsMoment:
+    def __init__(self):
+        self.n = 0
+        self.ort_x = 0.0
+        self.ort_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def guncelle(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        gecerli = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[gecerli], y[gecerli]
+        if x.size:
+            parca = EsMoment()
+            parca.n = x.size
+            parca.ort_x, parca.ort_y = float(x.mean()), float(y.mean())
+            dx, dy = x - parca.ort_x, y - parca.ort_y
+            parca.m2_x = float(dx @ dx)
+            parca.m2_y = float(dy @ dy)
+            parca.c_xy = float(dx @ dy)
+            self.birlestir(parca)
+        return self
+
+    def birlestir(self, diger):
+        if diger.n == 0:
+            return self
+        n = self.n + diger.n
+        dx = diger.ort_x - self.ort_x
+        dy = diger.ort_y - self.ort_y
+        carpan = self.n * diger.n / n
+        self.m2_x += diger.m2_x + dx * dx * carpan
+        self.m2_y += diger.m2_y + dy * dy * carpan
+        self.c_xy += diger.c_xy + dx * dy * carpan
+        self.ort_x += dx * diger.n / n
+        self.ort_y += dy * diger.n / n
+        self.n = n
+        return self
+
+    @property
+    def r(self):
+        return self.c_xy / math.sqrt(self.m2_x * self.m2_y)
+
+    @property
+    def p(self):
+        # stats.pearsonr ile aynı: t = r * sqrt((n-2)/(1-r^2)), çift yönlü
+        r = min(max(self.r, -1.0), 1.0)
+        sd = self.n - 2
+        if abs(r) == 1.0:
+            return 0.0
+        t = r * math.sqrt(sd / (1 - r * r))
+        return t_p_degeri(t, sd)
+
+    @property
+    def egim(self):
+        return self.c_xy / self.m2_x
+
+    @property
+    def kesisim(self):
+        return self.ort_y - self.egim * self.ort_x
+
+
+# ---------------------------------------------------------
+# ENDEKS TANIMLARI (scriptlerdeki formüllerin akış karşılıkları)
+# ---------------------------------------------------------
+# Her endeks, kendi scriptinin dropna() yaptığı satır kümesi üzerinde
+# normalize edilir. 'kesim' verilen endekslerde korelasyon, scriptteki gibi
+# yalnızca endeksi kendi kuantilinin altında kalan satırlarla kurulur.
+# Kesim sınırı KuantilTaslagi ile bulunur: taslak kapasitesine sığan veride
+# (ör. 81 il) sonuç tam bellekli scriptle aynıdır, ilçe ölçeğinde sınır
+# taslağın sıra hatası kadar yaklaşıktır.
+ENDEKSLER = {
+    'EFDE': {
+        # Egitim_Fırsatı.py
+        'gerekli': ['Egitim', 'Gelir', 'Issizlik', 'Suc', 'Nufus'],
+        'normalize': ['Gelir', 'Egitim'],
+        'formul': lambda p, n: n['Gelir'] / (p['Issizlik'] + p['Suc'] + 1e-6),
+        'korelasyon': ('EFDE', 'Egitim_Norm'),
+    },
+    'Baski_Endeksi': {
+        # baski_endeksi_analizi.py
+        'gerekli': ['Kira', 'Gelir', 'Egitim', 'Issizlik', 'Suc', 'Nufus'],
+        'normalize': ['Gelir', 'Egitim'],
+        'formul': lambda p, n: (p['Issizlik'] + p['Suc']) / (n['Gelir'] + n['Egitim'] + 0.1),
+        'korelasyon': ('Baski_Endeksi', 'Kira'),
+        # Script %95 kuantilin üstündeki aykırıları regresyondan çıkarır
+        'kesim': 0.95,
+    },
+    'Ekonomik_Rahatlik': {
+        # işsizlik_eğitim_suc.py
+        'gerekli': ['Gelir', 'Kira', 'Suc', 'Issizlik', 'Nufus'],
+        'normalize': ['Gelir'],
+        'formul': lambda p, n: n['Gelir'] / (p['Kira'] * p['Issizlik'] + 1e-6),
+        'korelasyon': ('Ekonomik_Rahatlik', 'Suc'),
+    },
+}
+
+
+def _gecerli_satirlar(parca, tanim):
+    return parca[tanim['gerekli']].notna().all(axis=1)
+
+
+def minmax_gecisi(yol='message.txt', parca_boyutu=100_000, endeksler=ENDEKSLER):
+    """1. geçiş: her endeksin normalize ettiği sütunlar için min/max toplar."""
+    sinirlar = {ad: {col: MinMax() for col in t['normalize']} for ad, t in endeksler.items()}
+    for parca in parcali_oku(yol, parca_boyutu):
+        for ad, tanim in endeksler.items():
+            gecerli = parca[_gecerli_satirlar(parca, tanim)]
+            for col, mm in sinirlar[ad].items():
+                mm.guncelle(gecerli[col].to_numpy())
+    return sinirlar
+
+
+def endeks_parcalari(yol='message.txt', parca_boyutu=100_000, endeksler=ENDEKSLER, sinirlar=None):
+    """
+    2. geçiş: endeks sütunları (ve *_Norm sütunları) eklenmiş parçalar üretir.
+    Bir satır bir endeksin gerektirdiği sütunlardan birini eksik taşıyorsa
+    o endeks NaN kalır (scriptteki dropna ile aynı sonuç).
+    """
+    if sinirlar is None:
+        sinirlar = minmax_gecisi(yol, parca_boyutu, endeksler)
+    for parca in parcali_oku(yol, parca_boyutu):
+        for ad, tanim in endeksler.items():
+            gecerli = _gecerli_satirlar(parca, tanim)
+            normlar = {col: sinirlar[ad][col].normalize(parca[col]) for col in tanim['normalize']}
+            for col, seri in normlar.items():
+                # *_Norm sütunu ilk tanımlayan endeksten gelir
+                if col + '_Norm' not in parca.columns:
+                    parca[col + '_Norm'] = seri.where(gecerli)
+            parca[ad] = tanim['formul'](parca, normlar).where(gecerli)
+        yield parca
+
+
+def kesim_gecisi(yol='message.txt', parca_boyutu=100_000, endeksler=ENDEKSLER, sinirlar=None):
+    """
+    'kesim' tanımlı endeksler için kuantil sınırlarını bulur (ek bir geçiş).
+    Dönüş: {endeks: sınır}; kesimi olmayan endeks için boş sözlük döner.
+    """
+    # aykiri_deger bu modülden Welford'u içe aktarır; döngüsel içe aktarma olmasın
+    from aykiri_deger import KuantilTaslagi
+
+    taslaklar = {ad: KuantilTaslagi() for ad, t in endeksler.items() if t.get('kesim') is not None}
+    if not taslaklar:
+        return {}
+    for parca in endeks_parcalari(yol, parca_boyutu, endeksler, sinirlar):
+        for ad, taslak in taslaklar.items():
+            taslak.guncelle(parca[ad].to_numpy())
+    return {ad: taslak.kuantil(endeksler[ad]['kesim']) for ad, taslak in taslaklar.items()}
+
+
+def akis_ozeti(yol='message.txt', parca_boyutu=100_000, endeksler=ENDEKSLER):
+    """
+    Endeksleri sınırlı bellekle hesaplar ve her biri için ortalama/std ile
+    scriptlerdeki korelasyon çiftinin r, p, eğim ve kesişimini döndürür.
+    Ortalama/std geçerli tüm satırlar, korelasyon ise (varsa) kesim
+    sınırının altındaki satırlar üzerindendir.
+    """
+    sinirlar = minmax_gecisi(yol, parca_boyutu, endeksler)
+    kesimler = kesim_gecisi(yol, parca_boyutu, endeksler, sinirlar)
+    dagilimlar = {ad: Welford() for ad in endeksler}
+    iliskiler = {ad: EsMoment() for ad in endeksler}
+    for parca in endeks_parcalari(yol, parca_boyutu, endeksler, sinirlar):
+        for ad, tanim in endeksler.items():
+            dagilimlar[ad].guncelle(parca[ad].to_numpy())
+            x_col, y_col = tanim['korelasyon']
+            if y_col.endswith('_Norm'):
+                # *_Norm sütunları bu endeksin kendi min/max'ıyla yeniden hesaplanır
+                y = sinirlar[ad][y_col[:-5]].normalize(parca[y_col[:-5]])
+            else:
+                y = parca[y_col]
+            x = parca[x_col]
+            if ad in kesimler:
+                # Sınırın üstü (ve NaN) korelasyona girmez
+                x = x.where(parca[ad] <= kesimler[ad])
+            iliskiler[ad].guncelle(x.to_numpy(dtype=float), y.to_numpy(dtype=float))
+
+    ozet = {}
+    for ad, tanim in endeksler.items():
+        w, e = dagilimlar[ad], iliskiler[ad]
+        ozet[ad] = {
+            'n': w.n, 'ortalama': w.ortalama, 'std': w.std,
+            'korelasyon': tanim['korelasyon'], 'kesim_siniri': kesimler.get(ad), 'n_korelasyon': e.n,
+            'r': e.r, 'p': e.p, 'egim': e.egim, 'kesisim': e.kesisim,
+        }
+    return ozet
+
+
+if __name__ == '__main__':
+    yol = sys.argv[1] if len(sys.argv) > 1 else 'message.txt'
+    parca_boyutu = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    try:
+        ozet = akis_ozeti(yol, parca_boyutu)
+    except FileNotFoundError:
+        print(f"HATA: {yol} dosyası bulunamadı.")
+        exit()
+
+    print("\n" + "="*65)
+    print("          AKIŞ MODU ENDEKS RAPORU (SINIRLI BELLEK)")
+    print("="*65)
+    for ad, s in ozet.items():
+        x_col, y_col = s['korelasyon']
+        print(f"[{ad}] n={s['n']:,}  ortalama={s['ortalama']:.6g}  std={s['std']:.6g}")
+        kesim = '' if s['kesim_siniri'] is None else f"  (≤ {s['kesim_siniri']:.6g}, n={s['n_korelasyon']:,})"
+        print(f"    {x_col} ~ {y_col}{kesim}: r={s['r']:.4f}  p={s['p']:.6f}  "
+              f"eğim={s['egim']:.6g}  kesişim={s['kesisim']:.6g}")
+    print("="*65)
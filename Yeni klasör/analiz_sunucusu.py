@@ -0,0 +1,632 @@
+import argparse
+import asyncio
+import io
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+import matplotlib
+
+matplotlib.use('Agg')  # sunucu pencere açmaz; grafikler bayt olarak döner
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from aykiri_deger import KuantilTaslagi
+from istatistik_cekirdek import dogrusal_regresyon
+from korelasyon_matrisi import korelasyon_matrisi
+from kuznets import kuznets_tahmin, kuznets_uydur
+from segmentasyon import segment_ata
+from senaryo_motoru import dogurganlik_modeli, nufus_yollari, senaryo_uret, yuzdelik_bantlari
+from turetilmis_sutunlar import turet, tumunu_turet
+from veri_yukleyici import seri_yukle, veri_yukle
+from yeniden_ornekleme import grup_karsilastir
+from zaman_serisi import kirilma_noktasi
+
+# ---------------------------------------------------------
+# YEREL ANALİZ SUNUCUSU (ASYNCIO, HTTP/JSON)
+# ---------------------------------------------------------
+# Her soru için yeni bir yorumlayıcı açmak scipy/sklearn/seaborn içe
+# aktarımı ve CSV ayrıştırması demek: mikrosaniyelik istatistik için
+# saniyelerce bekleme. Bu sunucu:
+#   1. message.txt, su_verisi.csv ve emisyon_gsyh.csv'yi bir kez yükler
+#      (türetilmiş sütunlar dahil) ve bellekte sıcak tutar.
+#   2. Analizleri uç noktalar olarak sunar:
+#        GET /analiz/<ad>?parametre=deger          -> JSON sonuç
+#        GET /analiz/<ad>?bicim=png|svg            -> çizilmiş grafik
+#        GET /analizler                            -> uç nokta listesi
+#        GET /saglik                               -> durum, veri boyutları, sayaçlar
+#        POST /yenile                              -> dosyaları yeniden yükler
+#   3. Hafif analizler olay döngüsünde hesaplanır; yeniden örnekleme,
+#      Monte Carlo ve grafik çizimi süreç havuzuna gönderilir. Linux'ta
+#      işçiler 'fork' ile yüklü tabloyu kopyalamadan devralır.
+#   4. Veri yalnızca /yenile ile değiştiği için yanıtlar (analiz,
+#      parametreler) anahtarıyla LRU bellekte tutulur; aynı anda gelen özdeş
+#      istekler tek bir hesaplamayı bekler. Her /yenile veri neslini artırır;
+#      eski nesilden dönen sonuçlar önbelleğe yazılmaz, havuzda beklerken
+#      iptal edilen istekler 503 alır.
+# Yalnızca yerel kullanım için tasarlanmıştır (kimlik doğrulama yok,
+# varsayılan adres 127.0.0.1).
+#
+# Kullanım: python analiz_sunucusu.py [--port 8765] [--isci 4]
+#           curl 'http://127.0.0.1:8765/analiz/efde?ilk=5'
+
+DIZIN = os.path.dirname(os.path.abspath(__file__))
+VARSAYILAN_ADRES = '127.0.0.1'
+VARSAYILAN_PORT = 8765
+YANIT_ONBELLEGI_BOYUTU = 1024
+GRAFIK_DPI = 110
+
+# Nüfus_Tahmin.py'deki doğurganlık serisi ve 2024 nüfusu
+DOGURGANLIK = {
+    2001: 2.38, 2014: 2.19, 2015: 2.16, 2016: 2.11, 2017: 2.08,
+    2018: 2.00, 2019: 1.89, 2020: 1.77, 2021: 1.71, 2022: 1.63,
+    2023: 1.51, 2024: 1.48
+}
+NUFUS_2024 = 85372377
+
+_VERI = {}
+
+
+class IstekHatasi(ValueError):
+    """İstemciden kaynaklanan hata (HTTP 400)."""
+
+
+# ---------------------------------------------------------
+# 1. VERİ YÜKLEME
+# ---------------------------------------------------------
+def veriyi_yukle(dizin=DIZIN):
+    """Üç veri setini yükler ve modül genelindeki _VERI sözlüğüne koyar."""
+    il = tumunu_turet(veri_yukle(os.path.join(dizin, 'message.txt')))
+
+    su = seri_yukle(os.path.join(dizin, 'su_verisi.csv')).sort_values('Yıl').reset_index(drop=True)
+    su['Kisi_Basi_Gunluk_Su_Litre'] = su['Toplam_Su_Miktari_Bin_m3'] * 1_000_000 / (su['Nüfus'] * 365)
+
+    emisyon = seri_yukle(os.path.join(dizin, 'emisyon_gsyh.csv')).sort_values('Yil')
+    emisyon = emisyon.dropna(subset=['Toplam_Emisyon', 'GSYH_Milyar_USD']).reset_index(drop=True)
+
+    dogurganlik = pd.DataFrame(list(DOGURGANLIK.items()), columns=['Yil', 'Dogurganlik'])
+
+    _VERI.clear()
+    _VERI.update(il=il, su=su, emisyon=emisyon, dogurganlik=dogurganlik, yuklenme=time.time())
+    return _VERI
+
+
+def _isci_baslat(dizin):
+    # 'spawn' ile başlayan işçiler tabloyu kendileri yükler; 'fork' ile
+    # başlayanlar ana süreçteki _VERI'yi hazır devralır
+    if not _VERI:
+        veriyi_yukle(dizin)
+    import matplotlib.pyplot  # noqa: F401  (ilk grafikte içe aktarma beklenmesin)
+
+
+# ---------------------------------------------------------
+# 2. PARAMETRELER
+# ---------------------------------------------------------
+def _sayi(parametreler, ad, varsayilan, tip=float, alt=None, ust=None):
+    deger = parametreler.get(ad)
+    if deger is None or deger == '':
+        return varsayilan
+    try:
+        deger = tip(deger)
+    except ValueError:
+        raise IstekHatasi(f"'{ad}' sayı olmalı: {parametreler[ad]!r}") from None
+    if (alt is not None and deger < alt) or (ust is not None and deger > ust):
+        raise IstekHatasi(f"'{ad}' {alt} ile {ust} arasında olmalı")
+    return deger
+
+
+def _regresyon_ozeti(sonuc):
+    return {'n': sonuc.n, 'egim': sonuc.egim, 'kesisim': sonuc.kesisim, 'r': sonuc.r,
+            'r2': sonuc.r2, 'p': sonuc.p, 'egim_se': sonuc.egim_se}
+
+
+def _iller(df, sutunlar, ilk, sirala, artan=False):
+    """sirala sütununa göre ilk N ilin seçili sütunları (kayıt listesi)."""
+    return df.sort_values(sirala, ascending=artan).head(ilk)[['Il'] + sutunlar].to_dict('records')
+
+
+def _ornek_sayisi(parametreler):
+    return _sayi(parametreler, 'ornek', 100_000, int, 1_000, 1_000_000)
+
+
+# ---------------------------------------------------------
+# 3. ANALİZLER
+# ---------------------------------------------------------
+# Her analiz (veri, parametreler) -> sözlük döndürür. '_grafik' anahtarı
+# JSON'a girmez; grafik istendiğinde çizim tarifi olarak kullanılır.
+
+def barinma_yuku(veri, p):
+    """BarınmaYükü.py: Kira / Maaş oranı, maaş-kira regresyonu ve grup karşılaştırması."""
+    ilk = _sayi(p, 'ilk', 10, int, 1, 1000)
+    df = turet(veri['il'].dropna(subset=['Gelir', 'Kira']), ['Barinma_Yuku'])
+    regresyon = dogrusal_regresyon(df['Gelir'], df['Kira'])
+
+    ort_gelir = df['Gelir'].mean()
+    zengin = df.loc[df['Gelir'] >= ort_gelir, 'Barinma_Yuku']
+    normal = df.loc[df['Gelir'] < ort_gelir, 'Barinma_Yuku']
+    _, p_t = stats.ttest_ind(zengin, normal)
+    yo = grup_karsilastir(zengin, normal, ornek_sayisi=_ornek_sayisi(p))
+    return {
+        'satir': len(df),
+        'korelasyon': regresyon.r,
+        'regresyon': _regresyon_ozeti(regresyon),
+        'hipotez': {'t_testi_p': p_t, 'permutasyon_p': yo['p'], 'fark': yo['fark'],
+                    'ga_alt': yo['alt'], 'ga_ust': yo['ust'], 'ornek_sayisi': yo['ornek_sayisi']},
+        'kritik': {'yuzde_70_ustu': int((df['Barinma_Yuku'] > 70).sum()),
+                   'yuzde_50_70': int(df['Barinma_Yuku'].between(50, 70, inclusive='right').sum())},
+        'en_yuksek': _iller(df, ['Gelir', 'Kira', 'Barinma_Yuku'], ilk, 'Barinma_Yuku'),
+        '_grafik': {'tur': 'dagilim', 'df': df, 'x': 'Gelir', 'y': 'Kira', 'regresyon': regresyon,
+                    'etiket_onceligi': 'Barinma_Yuku', 'baslik': 'Maaş ve Kira İlişkisi (Barınma Yükü)'},
+    }
+
+
+KATEGORILER = {
+    (True, False): 'İdeal (Zengin & Güvenli)',
+    (True, True): 'Riskli Cazibe (Zengin ama Tehlikeli)',
+    (False, False): 'Mütevazı Liman (Fakir ama Güvenli)',
+    (False, True): 'Alarm Veren (Fakir & Tehlikeli)',
+}
+
+
+def karar_matrisi(veri, p):
+    """4 Bölgeli Karar Matrisi.py: tasarruf/suç dört bölgesi, korelasyon, grup testi, regresyon."""
+    df = turet(veri['il'].dropna(subset=['Gelir', 'Kira', 'Suc']), ['Tasarruf'])
+    df['Kategori'], (ort_tasarruf, ort_suc) = segment_ata(
+        df['Tasarruf'], df['Suc'], KATEGORILER,
+        x_esik='ortalama', y_esik='ortalama', x_esit_yuksek=True, y_esit_yuksek=False)
+    korelasyon = korelasyon_matrisi(df, ['Gelir', 'Kira', 'Tasarruf', 'Suc'])
+
+    yuksek = df.loc[df['Suc'] > ort_suc, 'Tasarruf']
+    dusuk = df.loc[df['Suc'] <= ort_suc, 'Tasarruf']
+    normal = (stats.shapiro(yuksek)[1] > 0.05 and stats.shapiro(dusuk)[1] > 0.05)
+    if normal:
+        hipotez = {'test': 't', 'p': stats.ttest_ind(yuksek, dusuk)[1]}
+    else:
+        yo = grup_karsilastir(yuksek, dusuk, ornek_sayisi=_ornek_sayisi(p))
+        hipotez = {'test': 'permutasyon', 'p': yo['p'], 'fark': yo['fark'], 'ga_alt': yo['alt'],
+                   'ga_ust': yo['ust'], 'ornek_sayisi': yo['ornek_sayisi']}
+    regresyon = dogrusal_regresyon(df['Tasarruf'], df['Suc'])
+    return {
+        'satir': len(df),
+        'esikler': {'tasarruf': ort_tasarruf, 'suc': ort_suc},
+        'bolgeler': {k: df.loc[df['Kategori'] == k, 'Il'].tolist() for k in KATEGORILER.values()},
+        'korelasyon': korelasyon['r'], 'korelasyon_p': korelasyon['p'],
+        'hipotez': hipotez,
+        'regresyon': _regresyon_ozeti(regresyon),
+        '_grafik': {'tur': 'dagilim', 'df': df, 'x': 'Tasarruf', 'y': 'Suc', 'renk': 'Kategori',
+                    'regresyon': regresyon, 'esikler': (ort_tasarruf, ort_suc),
+                    'baslik': 'Tasarruf ve Suç Oranı: 4 Bölgeli Karar Matrisi'},
+    }
+
+
+def efde(veri, p):
+    """Egitim_Fırsatı.py: Ekonomik Fırsat Doğurganlık Endeksi ile eğitim ilişkisi."""
+    ilk = _sayi(p, 'ilk', 10, int, 1, 1000)
+    df = turet(veri['il'].dropna(subset=['Egitim', 'Gelir', 'Issizlik', 'Suc', 'Nufus']),
+               ['Gelir_Norm', 'Egitim_Norm', 'EFDE'])
+    regresyon = dogrusal_regresyon(df['EFDE'], df['Egitim_Norm'])
+    return {
+        'satir': len(df),
+        'regresyon': _regresyon_ozeti(regresyon),
+        'gecerli': bool(regresyon.p < 0.05),
+        'en_yuksek': _iller(df, ['EFDE', 'Egitim_Norm'], ilk, 'EFDE'),
+        'en_dusuk': _iller(df, ['EFDE', 'Egitim_Norm'], ilk, 'EFDE', artan=True),
+        '_grafik': {'tur': 'dagilim', 'df': df, 'x': 'EFDE', 'y': 'Egitim_Norm', 'boyut': 'Nufus',
+                    'renk': 'EFDE', 'regresyon': regresyon, 'etiket_onceligi': 'Nufus',
+                    'baslik': 'Ekonomik Güvenlik (EFDE) ve Eğitim'},
+    }
+
+
+def baski_endeksi(veri, p):
+    """baski_endeksi_analizi.py: sosyal baskı endeksi, %95 üstü aykırılar ve kira regresyonu."""
+    esik = _sayi(p, 'kuantil', 0.95, float, 0.5, 0.999)
+    df = veri['il'].dropna(subset=['Kira', 'Gelir', 'Egitim', 'Issizlik', 'Suc', 'Nufus'])
+    df = turet(df, ['Gelir_Norm', 'Egitim_Norm', 'Baski_Endeksi'])
+    sinir = KuantilTaslagi().guncelle(df['Baski_Endeksi']).kuantil(esik)
+    aykiri = df['Baski_Endeksi'] > sinir
+    regresyon = dogrusal_regresyon(df.loc[~aykiri, 'Baski_Endeksi'], df.loc[~aykiri, 'Kira'])
+    return {
+        'satir': len(df),
+        'sinir': sinir,
+        'aykirilar': df.loc[aykiri, ['Il', 'Baski_Endeksi', 'Kira']].to_dict('records'),
+        'regresyon': _regresyon_ozeti(regresyon),
+        'gecerli': bool(regresyon.p < 0.05),
+        '_grafik': {'tur': 'dagilim', 'df': df, 'x': 'Baski_Endeksi', 'y': 'Kira', 'boyut': 'Nufus',
+                    'renk': 'Baski_Endeksi', 'regresyon': regresyon, 'etiket_onceligi': 'Baski_Endeksi',
+                    'baslik': 'Sosyal Baskı Endeksi ve Kira'},
+    }
+
+
+YASAM_SUTUNLARI = ['Gelir', 'Egitim', 'Kira', 'Issizlik', 'Suc']
+
+
+def yasam_puani(veri, p):
+    """yaşam_kalite_endeksi.py: eşit ağırlıklı yaşam puanı, eğitim grubu testi ve işsizlik regresyonu."""
+    ilk = _sayi(p, 'ilk', 10, int, 1, 1000)
+    df = veri['il'].dropna(subset=YASAM_SUTUNLARI)
+    norm = (df[YASAM_SUTUNLARI] - df[YASAM_SUTUNLARI].min()) / (df[YASAM_SUTUNLARI].max() - df[YASAM_SUTUNLARI].min())
+    df = df.assign(Yasam_Puan=(norm['Gelir'] + norm['Egitim']) - (norm['Kira'] + norm['Issizlik'] + norm['Suc']))
+
+    ort_egitim = df['Egitim'].mean()
+    yuksek = df.loc[df['Egitim'] >= ort_egitim, 'Yasam_Puan']
+    dusuk = df.loc[df['Egitim'] < ort_egitim, 'Yasam_Puan']
+    _, p_t = stats.ttest_ind(yuksek, dusuk)
+    yo = grup_karsilastir(yuksek, dusuk, ornek_sayisi=_ornek_sayisi(p))
+    regresyon = dogrusal_regresyon(df['Issizlik'], df['Yasam_Puan'])
+    return {
+        'satir': len(df),
+        'korelasyon_gelir': float(df['Gelir'].corr(df['Yasam_Puan'])),
+        'hipotez': {'t_testi_p': p_t, 'permutasyon_p': yo['p'], 'fark': yo['fark'],
+                    'ga_alt': yo['alt'], 'ga_ust': yo['ust'], 'ornek_sayisi': yo['ornek_sayisi']},
+        'regresyon': _regresyon_ozeti(regresyon),
+        'en_yuksek': _iller(df, ['Yasam_Puan'], ilk, 'Yasam_Puan'),
+        'en_dusuk': _iller(df, ['Yasam_Puan'], ilk, 'Yasam_Puan', artan=True),
+        '_grafik': {'tur': 'dagilim', 'df': df, 'x': 'Issizlik', 'y': 'Yasam_Puan', 'regresyon': regresyon,
+                    'etiket_onceligi': 'Yasam_Puan', 'baslik': 'İşsizlik ve Yaşam Puanı'},
+    }
+
+
+def nufus_projeksiyonu(veri, p):
+    """Nüfus_Tahmin.py: doğurganlık regresyonuyla deterministik yol ve Monte Carlo bantları."""
+    yil_sayisi = _sayi(p, 'yil', 10, int, 1, 100)
+    baslangic = _sayi(p, 'baslangic', NUFUS_2024, float, 1)
+    senaryo_sayisi = _sayi(p, 'senaryo', 10_000, int, 100, 1_000_000)
+    tohum = _sayi(p, 'tohum', 42, int, 0)
+
+    df = veri['dogurganlik']
+    model = dogurganlik_modeli(df['Yil'], df['Dogurganlik'])
+    yillar = np.arange(2025, 2025 + yil_sayisi)
+    hizlar = model['regresyon'].tahmin(yillar)
+    yol = nufus_yollari(hizlar, baslangic)
+    _, senaryolar = senaryo_uret(model, yillar, baslangic, senaryo_sayisi=senaryo_sayisi, tohum=tohum)
+    bantlar = yuzdelik_bantlari(senaryolar)
+    return {
+        'regresyon': _regresyon_ozeti(model['regresyon']),
+        'yenilenme_testi_p': stats.ttest_1samp(df['Dogurganlik'], 2.10)[1],
+        'yillar': yillar, 'dogurganlik': hizlar, 'nufus': np.floor(yol),
+        'senaryo_sayisi': senaryo_sayisi,
+        'bantlar': {f'p{k}': v for k, v in bantlar.items()},
+        '_grafik': {'tur': 'bant', 'yillar': yillar, 'yol': yol, 'bantlar': bantlar, 'baslangic': baslangic},
+    }
+
+
+def su_tuketimi(veri, p):
+    """su_tuketim_analizi.py: kişi başı tüketim eğilimi ve yapısal kırılma."""
+    bas_yil = _sayi(p, 'baslangic_yili', 2008, int)
+    tum = veri['su']
+    df = tum[tum['Yıl'] >= bas_yil]
+    if len(df) < 3:
+        raise IstekHatasi(f"{bas_yil} sonrası en az 3 yıl gerekli")
+    regresyon = dogrusal_regresyon(df['Yıl'], df['Kisi_Basi_Gunluk_Su_Litre'])
+    kirilma = kirilma_noktasi(tum['Yıl'], tum['Kisi_Basi_Gunluk_Su_Litre'])
+    return {
+        'satir': len(df),
+        'regresyon': _regresyon_ozeti(regresyon),
+        'kirilma': {a: kirilma[a] for a in ('yil', 'chow_f', 'p')},
+        'seri': df[['Yıl', 'Kisi_Basi_Gunluk_Su_Litre']].to_dict('records'),
+        '_grafik': {'tur': 'dagilim', 'df': df, 'x': 'Yıl', 'y': 'Kisi_Basi_Gunluk_Su_Litre',
+                    'regresyon': regresyon, 'cizgi': True, 'baslik': 'Kişi Başı Günlük Su Tüketimi'},
+    }
+
+
+def emisyon_gsyh(veri, p):
+    """emisyon_gsyh_analizi.py: GSYH-emisyon regresyonu, kırılma ve Kuznets eğrisi."""
+    derece = _sayi(p, 'derece', 2, int, 2, 3)
+    df = veri['emisyon']
+    regresyon = dogrusal_regresyon(df['GSYH_Milyar_USD'], df['Toplam_Emisyon'])
+    kirilma = kirilma_noktasi(df['Yil'], df['Toplam_Emisyon'], x=df['GSYH_Milyar_USD'])
+    k = kuznets_uydur(df['GSYH_Milyar_USD'], df['Toplam_Emisyon'], derece=derece)
+    return {
+        'satir': len(df),
+        'regresyon': _regresyon_ozeti(regresyon),
+        'kirilma': {a: kirilma[a] for a in ('yil', 'chow_f', 'p')},
+        'kuznets': {a: k[a] for a in ('derece', 'r2', 'r2_duz', 'f_p', 'donum', 'donum_alt', 'donum_ust',
+                                      'donum_orani')} | {'katsayilar': k['katsayilar']},
+        '_grafik': {'tur': 'dagilim', 'df': df, 'x': 'GSYH_Milyar_USD', 'y': 'Toplam_Emisyon',
+                    'regresyon': regresyon, 'kuznets': k, 'etiket': 'Yil',
+                    'baslik': 'GSYH ve Emisyon (Kuznets Eğrisi)'},
+    }
+
+
+# ad -> (fonksiyon, ağır mı?, parametreler). Ağır analizler (yeniden
+# örnekleme, Monte Carlo, bootstrap) süreç havuzunda çalışır.
+ANALIZLER = {
+    'barinma_yuku': (barinma_yuku, True, ['ilk', 'ornek']),
+    'karar_matrisi': (karar_matrisi, True, ['ornek']),
+    'efde': (efde, False, ['ilk']),
+    'baski_endeksi': (baski_endeksi, False, ['kuantil']),
+    'yasam_puani': (yasam_puani, True, ['ilk', 'ornek']),
+    'nufus_projeksiyonu': (nufus_projeksiyonu, True, ['yil', 'baslangic', 'senaryo', 'tohum']),
+    'su_tuketimi': (su_tuketimi, False, ['baslangic_yili']),
+    'emisyon_gsyh': (emisyon_gsyh, True, ['derece']),
+}
+
+
+# ---------------------------------------------------------
+# 4. GRAFİKLER
+# ---------------------------------------------------------
+def grafik_ciz(tarif, bicim='png'):
+    """Analizin '_grafik' tarifini çizer; PNG/SVG baytlarını döndürür."""
+    import matplotlib.pyplot as plt
+
+    from etiket_yerlesimi import etiketle
+    from regresyon_grafik import regresyon_ciz
+    from yogunluk_grafigi import dagilim_ciz
+
+    fig, ax = plt.subplots(figsize=(11, 6.5))
+    try:
+        if tarif['tur'] == 'bant':
+            yillar = np.concatenate([[2024], tarif['yillar']])
+            bant = {k: np.concatenate([[tarif['baslangic']], v]) for k, v in tarif['bantlar'].items()}
+            ax.fill_between(yillar, bant[5], bant[95], color='#1f77b4', alpha=0.12, label='%90 Senaryo Bandı')
+            ax.fill_between(yillar, bant[25], bant[75], color='#1f77b4', alpha=0.25, label='%50 Senaryo Bandı')
+            ax.plot(yillar, np.concatenate([[tarif['baslangic']], tarif['yol']]), marker='o',
+                    color='#1f77b4', linewidth=2, label='Tahmini Nüfus')
+            ax.set_title('Nüfus Projeksiyonu (Regresyon + Monte Carlo)')
+            ax.set_xlabel('Yıl')
+            ax.set_ylabel('Nüfus')
+        else:
+            df, x, y = tarif['df'], tarif['x'], tarif['y']
+            if tarif.get('cizgi'):
+                ax.plot(df[x], df[y], marker='o', color='tab:blue', linewidth=2, label='Gerçek Veri')
+            else:
+                renk = tarif.get('renk')
+                stil = {'palette': 'deep' if renk == 'Kategori' else 'viridis'} if renk else {}
+                if tarif.get('boyut'):
+                    stil['sizes'] = (60, 600)
+                dagilim_ciz(df, x, y, boyut=tarif.get('boyut'), renk=renk, ax=ax, alpha=0.75, **stil)
+            regresyon_ciz(tarif['regresyon'], df[x], ax=ax, color='red', line_kws={'label': 'Regresyon'})
+            if 'kuznets' in tarif:
+                xs = np.linspace(df[x].min(), df[x].max(), 200)
+                ax.plot(xs, kuznets_tahmin(tarif['kuznets'], xs), color='purple', linestyle='--',
+                        label='Kuznets Eğrisi')
+            if 'esikler' in tarif:
+                ax.axvline(tarif['esikler'][0], color='gray', linestyle='--', linewidth=1)
+                ax.axhline(tarif['esikler'][1], color='gray', linestyle='--', linewidth=1)
+            if 'etiket' in tarif or 'etiket_onceligi' in tarif:
+                metin = df[tarif.get('etiket', 'Il')].astype(str)
+                oncelik = df[tarif['etiket_onceligi']].abs() if 'etiket_onceligi' in tarif else None
+                etiketle(ax, df[x], df[y], metin, oncelik=oncelik, fontsize=8)
+            ax.set_title(tarif['baslik'])
+            ax.set_xlabel(x)
+            ax.set_ylabel(y)
+        ax.grid(True, linestyle='--', alpha=0.5)
+        ax.legend(loc='best', fontsize=8)
+        fig.tight_layout()
+        tampon = io.BytesIO()
+        fig.savefig(tampon, format=bicim, dpi=GRAFIK_DPI)
+        return tampon.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def _jsonla(v):
+    """numpy/pandas değerlerini JSON'a uygun hale getirir (NaN/sonsuz -> null)."""
+    if isinstance(v, dict):
+        return {str(k): _jsonla(d) for k, d in v.items() if not str(k).startswith('_')}
+    if isinstance(v, (list, tuple)):
+        return [_jsonla(d) for d in v]
+    if isinstance(v, pd.DataFrame):
+        return {str(k): _jsonla(d) for k, d in v.to_dict('index').items()}
+    if isinstance(v, (pd.Series, np.ndarray)):
+        return _jsonla(v.tolist())
+    if isinstance(v, np.generic):
+        v = v.item()
+    if isinstance(v, float) and not math.isfinite(v):
+        return None
+    return v
+
+
+def calistir(ad, parametreler, bicim=None):
+    """
+    Bir analizi bu süreçte çalıştırır (olay döngüsünde ya da işçide).
+    Dönüş: (içerik türü, gövde baytları)
+    """
+    sonuc = ANALIZLER[ad][0](_VERI, parametreler)
+    if bicim:
+        tur = 'image/svg+xml' if bicim == 'svg' else 'image/png'
+        return tur, grafik_ciz(sonuc['_grafik'], bicim)
+    return 'application/json; charset=utf-8', json.dumps(_jsonla(sonuc), ensure_ascii=False).encode('utf-8')
+
+
+# ---------------------------------------------------------
+# 5. HTTP SUNUCUSU
+# ---------------------------------------------------------
+DURUM_METINLERI = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                   500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+def _hata(durum, mesaj):
+    return durum, 'application/json; charset=utf-8', json.dumps({'hata': mesaj}, ensure_ascii=False).encode('utf-8')
+
+
+def _havuz_baglami():
+    yontemler = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('fork' if 'fork' in yontemler else 'spawn')
+
+
+class AnalizSunucusu:
+    """Veriyi sıcak tutan, analizleri HTTP/JSON ile sunan asyncio sunucusu."""
+
+    def __init__(self, dizin=DIZIN, isci_sayisi=None, onbellek_boyutu=YANIT_ONBELLEGI_BOYUTU):
+        self.dizin = dizin
+        self.isci_sayisi = isci_sayisi
+        self.onbellek_boyutu = onbellek_boyutu
+        self.yanitlar = OrderedDict()     # anahtar -> (tür, gövde), LRU
+        self.bekleyenler = {}             # anahtar -> hesaplanmakta olan görev
+        self.nesil = 0                    # her yüklemede artar; eski sonuçlar önbelleğe yazılmaz
+        self.sayaclar = {'istek': 0, 'onbellek_isabeti': 0, 'havuz': 0, 'hata': 0}
+        self.baslangic = time.time()
+        self.havuz = None
+
+    def yukle(self):
+        veriyi_yukle(self.dizin)
+        eski, self.havuz = self.havuz, ProcessPoolExecutor(
+            max_workers=self.isci_sayisi, mp_context=_havuz_baglami(),
+            initializer=_isci_baslat, initargs=(self.dizin,))
+        if eski is not None:
+            eski.shutdown(wait=False, cancel_futures=True)
+        self.nesil += 1
+        self.yanitlar.clear()
+        self.bekleyenler.clear()
+
+    def kapat(self):
+        if self.havuz is not None:
+            self.havuz.shutdown(wait=False, cancel_futures=True)
+
+    async def _hesapla(self, anahtar, ad, parametreler, bicim):
+        nesil = self.nesil
+        if ANALIZLER[ad][1] or bicim:
+            self.sayaclar['havuz'] += 1
+            dongu = asyncio.get_running_loop()
+            sonuc = await dongu.run_in_executor(self.havuz, calistir, ad, parametreler, bicim)
+        else:
+            sonuc = calistir(ad, parametreler, bicim)
+        if nesil != self.nesil:
+            return sonuc                  # hesaplama sürerken veri yenilendi
+        self.yanitlar[anahtar] = sonuc
+        while len(self.yanitlar) > self.onbellek_boyutu:
+            self.yanitlar.popitem(last=False)
+        return sonuc
+
+    async def analiz(self, ad, parametreler):
+        if ad not in ANALIZLER:
+            return _hata(404, f"Bilinmeyen analiz: {ad}")
+        bicim = parametreler.pop('bicim', None) or None
+        if bicim not in (None, 'png', 'svg'):
+            return _hata(400, "'bicim' png ya da svg olmalı")
+        gecerli = set(ANALIZLER[ad][2])
+        bilinmeyen = sorted(set(parametreler) - gecerli)
+        if bilinmeyen:
+            return _hata(400, f"Bilinmeyen parametre(ler): {', '.join(bilinmeyen)} "
+                              f"(geçerli: {', '.join(sorted(gecerli)) or 'yok'})")
+
+        anahtar = (ad, bicim, tuple(sorted(parametreler.items())))
+        if anahtar in self.yanitlar:
+            self.sayaclar['onbellek_isabeti'] += 1
+            self.yanitlar.move_to_end(anahtar)
+            return (200,) + self.yanitlar[anahtar]
+        # Aynı anda gelen özdeş istekler tek hesaplamayı bekler
+        gorev = self.bekleyenler.get(anahtar)
+        if gorev is None:
+            gorev = asyncio.ensure_future(self._hesapla(anahtar, ad, parametreler, bicim))
+            self.bekleyenler[anahtar] = gorev
+            gorev.add_done_callback(
+                lambda g: self.bekleyenler.pop(anahtar) if self.bekleyenler.get(anahtar) is g else None)
+        try:
+            return (200,) + await asyncio.shield(gorev)
+        except IstekHatasi as e:
+            return _hata(400, str(e))
+        except asyncio.CancelledError:
+            if not gorev.cancelled():
+                raise                     # iptal edilen bu bağlantı, hesaplama değil
+            # /yenile eski havuzu kapatırken kuyruktaki iş iptal edildi
+            return _hata(503, "Veri yeniden yüklendi; isteği tekrarlayın")
+
+    def saglik(self):
+        return {'durum': 'hazir', 'calisma_suresi_sn': round(time.time() - self.baslangic, 1),
+                'veri_yuklenme': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(_VERI['yuklenme'])),
+                'veri': {ad: len(_VERI[ad]) for ad in ('il', 'su', 'emisyon', 'dogurganlik')},
+                'yanit_onbellegi': len(self.yanitlar), 'sayaclar': self.sayaclar}
+
+    async def yanitla(self, yontem, hedef):
+        """(durum, içerik türü, gövde) döndürür."""
+        adres = urlsplit(hedef)
+        yol = adres.path.rstrip('/') or '/'
+        parametreler = dict(parse_qsl(adres.query))
+        if yol == '/yenile':
+            if yontem != 'POST':
+                return _hata(405, "/yenile için POST kullanın")
+            self.yukle()
+            return 200, 'application/json; charset=utf-8', json.dumps(self.saglik(), ensure_ascii=False).encode()
+        if yontem not in ('GET', 'HEAD'):
+            return _hata(405, f"Desteklenmeyen yöntem: {yontem}")
+        if yol in ('/', '/analizler'):
+            liste = {ad: {'aciklama': f.__doc__.strip(), 'parametreler': prm + ['bicim'], 'agir': agir}
+                     for ad, (f, agir, prm) in ANALIZLER.items()}
+            return 200, 'application/json; charset=utf-8', json.dumps(liste, ensure_ascii=False).encode()
+        if yol == '/saglik':
+            return 200, 'application/json; charset=utf-8', json.dumps(self.saglik(), ensure_ascii=False).encode()
+        if yol.startswith('/analiz/'):
+            return await self.analiz(yol[len('/analiz/'):], parametreler)
+        return _hata(404, f"Bilinmeyen yol: {yol}")
+
+    async def baglanti(self, okuyucu, yazici):
+        """Tek bağlantı; HTTP/1.1 keep-alive ile ardışık istekler aynı bağlantıdan gelir."""
+        try:
+            while True:
+                istek_satiri = await okuyucu.readline()
+                if not istek_satiri.strip():
+                    break
+                basliklar = {}
+                while True:
+                    satir = await okuyucu.readline()
+                    if satir in (b'\r\n', b'\n', b''):
+                        break
+                    ad, _, deger = satir.decode('latin-1').partition(':')
+                    basliklar[ad.strip().lower()] = deger.strip()
+                if int(basliklar.get('content-length') or 0):
+                    await okuyucu.readexactly(int(basliklar['content-length']))   # gövde kullanılmıyor
+
+                parcalar = istek_satiri.decode('latin-1').split()
+                self.sayaclar['istek'] += 1
+                if len(parcalar) != 3:
+                    durum, tur, govde = _hata(400, "Geçersiz istek satırı")
+                    surum = 'HTTP/1.0'
+                else:
+                    yontem, hedef, surum = parcalar
+                    try:
+                        durum, tur, govde = await self.yanitla(yontem, hedef)
+                    except Exception as e:
+                        durum, tur, govde = _hata(500, f"{type(e).__name__}: {e}")
+                if durum != 200:
+                    self.sayaclar['hata'] += 1
+
+                kapat = (surum == 'HTTP/1.0' and basliklar.get('connection', '').lower() != 'keep-alive') \
+                    or basliklar.get('connection', '').lower() == 'close'
+                baslik = (f"HTTP/1.1 {durum} {DURUM_METINLERI[durum]}\r\n"
+                          f"Content-Type: {tur}\r\nContent-Length: {len(govde)}\r\n"
+                          f"Connection: {'close' if kapat else 'keep-alive'}\r\n\r\n")
+                yazici.write(baslik.encode('latin-1') + (b'' if parcalar[:1] == ['HEAD'] else govde))
+                await yazici.drain()
+                if kapat:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            yazici.close()
+
+    async def calis(self, adres=VARSAYILAN_ADRES, port=VARSAYILAN_PORT):
+        self.yukle()
+        sunucu = await asyncio.start_server(self.baglanti, adres, port)
+        print(f"Analiz sunucusu hazır: http://{adres}:{port}/analizler "
+              f"({len(_VERI['il'])} il, {len(ANALIZLER)} analiz)", flush=True)
+        try:
+            async with sunucu:
+                await sunucu.serve_forever()
+        finally:
+            self.kapat()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Veriyi bellekte tutan yerel HTTP/JSON analiz sunucusu.")
+    parser.add_argument('--adres', default=VARSAYILAN_ADRES)
+    parser.add_argument('--port', type=int, default=VARSAYILAN_PORT)
+    parser.add_argument('--isci', type=int, default=None, help="Süreç havuzundaki işçi sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--veri-dizini', default=DIZIN, help="message.txt, su_verisi.csv ve emisyon_gsyh.csv klasörü")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(AnalizSunucusu(args.veri_dizini, args.isci).calis(args.adres, args.port))
+    except FileNotFoundError as e:
+        print(f"HATA: Veri dosyası bulunamadı: {e.filename}")
+        exit()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,369 @@
+import argparse
+import math
+
+import numpy as np
+import pandas as pd
+
+from istatistik_cekirdek import t_p_degeri
+
+# ---------------------------------------------------------
+# ARTIMLI (INCREMENTAL) ENDEKS MOTORU
+# ---------------------------------------------------------
+# Tek bir ilin Kira veya Issizlik değeri düzeltildiğinde bütün tablo
+# yeniden hesaplanmasın diye:
+#   - Her normalize edilen sütun için en küçük/en büyük değer ve ikinci
+#     en küçük/en büyük değer (satır numaralarıyla) tutulur.
+#   - Min/max değişmediyse yalnızca güncellenen satırın Yasam_Puan, EFDE
+#     ve Baski_Endeksi değerleri yeniden hesaplanır; korelasyonlar için
+#     tutulan eş-moment toplamlarından eski satırın katkısı çıkarılıp
+#     yenisi eklenir.
+#   - Min/max değiştiyse yalnızca o sütuna bağlı endeksler vektörel olarak
+#     yeniden hesaplanır (tam tarama).
+#   - Baski_Endeksi ~ Kira, scriptteki gibi endeksin %95 kuantilinin
+#     üstündeki aykırılar çıkarılarak kurulur. Endeksin sıralı bir kopyası
+#     tutulur; bir satır değişince kopyada yalnızca o değer kaydırılır ve
+#     sınırın iki yanına geçen satırlar toplamlara eklenip çıkarılır.
+# Formüller yaşam_kalite_endeksi.py, Egitim_Fırsatı.py ve
+# baski_endeksi_analizi.py ile aynıdır.
+#
+# Kullanım: python artimli_endeks.py --duzelt Ankara Kira=21000 --duzelt Van Issizlik=11.5
+
+
+class _UcDeger:
+    """Bir sütunun en küçük iki değerini (satır numaralarıyla) takip eder.
+    En büyük taraf için değerler -1 ile çarpılmış olarak kullanılır."""
+
+    def __init__(self, degerler, isaret):
+        self.isaret = isaret
+        self.tara(degerler)
+
+    def _iki_en_kucuk(self, v, haric=None):
+        if haric is not None:
+            v = v.copy()
+            v[haric] = np.inf
+        iki = np.argpartition(v, 1)[:2] if v.size > 1 else np.array([0, 0])
+        iki = iki[np.argsort(v[iki], kind='stable')]
+        return int(iki[0]), int(iki[1])
+
+    def tara(self, degerler):
+        v = self.isaret * degerler
+        self.i1, self.i2 = self._iki_en_kucuk(v)
+        self.v1, self.v2 = float(v[self.i1]), float(v[self.i2])
+
+    def guncelle(self, degerler, i, yeni):
+        """degerler dizisi zaten güncellenmiş olmalı. Uç değer değiştiyse True."""
+        yeni = self.isaret * yeni
+        eski_uc = self.v1
+        if i == self.i1:
+            if yeni <= self.v2:
+                self.v1 = yeni
+            else:
+                # Birinci sıradaki satır içeri kaydı: ikinci öne geçer,
+                # yeni ikinci için sütun taranır
+                self.i1, self.v1 = self.i2, self.v2
+                self.i2 = self._iki_en_kucuk(self.isaret * degerler, haric=self.i1)[0]
+                self.v2 = float(self.isaret * degerler[self.i2])
+        elif yeni < self.v1:
+            self.i2, self.v2 = self.i1, self.v1
+            self.i1, self.v1 = i, yeni
+        elif i == self.i2:
+            if yeni <= self.v2:
+                self.v2 = yeni
+            else:
+                self.i2 = self._iki_en_kucuk(self.isaret * degerler, haric=self.i1)[0]
+                self.v2 = float(self.isaret * degerler[self.i2])
+        elif yeni < self.v2:
+            self.i2, self.v2 = i, yeni
+        return self.v1 != eski_uc
+
+    @property
+    def uc(self):
+        return self.isaret * self.v1
+
+
+class _EsMomentToplam:
+    """Pearson r için kaydırılmış toplamlar; satır çıkarma/ekleme destekler."""
+
+    def __init__(self, x, y):
+        self.hesapla(x, y)
+
+    def hesapla(self, x, y):
+        # Sayısal iptali azaltmak için tam taramadaki ortalamalara göre kaydır
+        self.kx, self.ky = float(x.mean()), float(y.mean())
+        dx, dy = x - self.kx, y - self.ky
+        self.n = x.size
+        self.sx, self.sy = float(dx.sum()), float(dy.sum())
+        self.sxx, self.syy, self.sxy = float(dx @ dx), float(dy @ dy), float(dx @ dy)
+
+    def _katki(self, isaret, x, y):
+        # x, y tek değer ya da aynı boyda diziler olabilir
+        dx = np.atleast_1d(np.asarray(x, dtype=float)) - self.kx
+        dy = np.atleast_1d(np.asarray(y, dtype=float)) - self.ky
+        self.n += isaret * dx.size
+        self.sx += isaret * float(dx.sum())
+        self.sy += isaret * float(dy.sum())
+        self.sxx += isaret * float(dx @ dx)
+        self.syy += isaret * float(dy @ dy)
+        self.sxy += isaret * float(dx @ dy)
+
+    def ekle(self, x, y):
+        self._katki(1, x, y)
+
+    def cikar(self, x, y):
+        self._katki(-1, x, y)
+
+    def degistir(self, eski_x, eski_y, yeni_x, yeni_y):
+        self.cikar(eski_x, eski_y)
+        self.ekle(yeni_x, yeni_y)
+
+    def sonuc(self):
+        n = self.n
+        cxx = self.sxx - self.sx * self.sx / n
+        cyy = self.syy - self.sy * self.sy / n
+        cxy = self.sxy - self.sx * self.sy / n
+        r = min(max(cxy / math.sqrt(cxx * cyy), -1.0), 1.0)
+        sd = n - 2
+        t = r * math.sqrt(sd / (1 - r * r)) if abs(r) < 1 else math.copysign(math.inf, r)
+        return {'r': float(r), 'p': t_p_degeri(float(t), sd), 'egim': float(cxy / cxx), 'n': n}
+
+
+class _KuantilKesim:
+    """Bir endeksin q kuantilini sıralı kopyası üzerinden takip eder.
+    normal maskesi sınırın altında kalan (korelasyona giren) satırlardır."""
+
+    def __init__(self, degerler, q):
+        self.q = q
+        self.tara(degerler)
+
+    def tara(self, degerler):
+        self.sira = np.argsort(degerler, kind='stable')
+        self.sirali = degerler[self.sira]
+        self.sinir = self._kuantil()
+        self.normal = degerler <= self.sinir
+
+    def _kuantil(self):
+        # np.quantile (doğrusal) ile aynı: komşu iki sıralı değer arasında enterpolasyon
+        h = self.q * (self.sirali.size - 1)
+        alt = int(math.floor(h))
+        return float(np.quantile(self.sirali[alt:alt + 2], h - alt))
+
+    def guncelle(self, i, eski, yeni):
+        """
+        i. satırın değeri eski -> yeni oldu. Sıralı kopyada yalnızca o değer
+        kaydırılır. Dönüş: (i eskiden normal miydi, normale geçen satırlar,
+        normalden çıkan satırlar); son ikisi i'yi içermez.
+        """
+        s, sira = self.sirali, self.sira
+        bas, son = np.searchsorted(s, eski, 'left'), np.searchsorted(s, eski, 'right')
+        k = bas + int(np.flatnonzero(sira[bas:son] == i)[0])
+        hedef = int(np.searchsorted(s, yeni))
+        if hedef > k:
+            hedef -= 1
+            s[k:hedef], sira[k:hedef] = s[k + 1:hedef + 1], sira[k + 1:hedef + 1]
+        else:
+            s[hedef + 1:k + 1], sira[hedef + 1:k + 1] = s[hedef:k], sira[hedef:k]
+        s[hedef], sira[hedef] = yeni, i
+
+        eski_normal, eski_sinir = bool(self.normal[i]), self.sinir
+        self.sinir = self._kuantil()
+        self.normal[i] = yeni <= self.sinir
+        # Değeri değişmeyen satırlar yalnızca iki sınır arasındaysa taraf değiştirir
+        alt, ust = sorted((eski_sinir, self.sinir))
+        gecen = sira[np.searchsorted(s, alt, 'right'):np.searchsorted(s, ust, 'right')]
+        gecen = gecen[gecen != i]
+        self.normal[gecen] = self.sinir > eski_sinir
+        bos = gecen[:0]
+        return (eski_normal, gecen, bos) if self.sinir > eski_sinir else (eski_normal, bos, gecen)
+
+
+class ArtimliEndeks:
+    # Yasam_Puan (yaşam_kalite_endeksi.py) için +/- yönlü normalize sütunlar
+    YASAM_ARTI = ['Gelir', 'Egitim']
+    YASAM_EKSI = ['Kira', 'Issizlik', 'Suc']
+    SUTUNLAR = ['Gelir', 'Egitim', 'Kira', 'Issizlik', 'Suc']
+
+    # endeks -> min/max'ı etkileyen sütunlar
+    BAGIMLILIK = {
+        'Yasam_Puan': set(SUTUNLAR),
+        'EFDE': {'Gelir'},
+        'Baski_Endeksi': {'Gelir', 'Egitim'},
+        'Egitim_Norm': {'Egitim'},
+    }
+    # Takip edilen korelasyon çiftleri
+    CIFTLER = [('EFDE', 'Egitim_Norm'), ('Baski_Endeksi', 'Kira'), ('Gelir', 'Yasam_Puan')]
+    # endeks -> kuantil; çiftin x'i bu endeksse sınırın üstü korelasyona girmez
+    # (baski_endeksi_analizi.py: %95 üstü aykırılar regresyondan çıkarılır)
+    KESIM = {'Baski_Endeksi': 0.95}
+
+    def __init__(self, df):
+        df = df.dropna(subset=self.SUTUNLAR)
+        self.iller = df['Il'].to_numpy() if 'Il' in df.columns else None
+        self._konum = {il: i for i, il in enumerate(self.iller)} if self.iller is not None else {}
+        self.ham = {c: df[c].to_numpy(dtype=float).copy() for c in self.SUTUNLAR}
+        self.alt = {c: _UcDeger(self.ham[c], 1) for c in self.SUTUNLAR}
+        self.ust = {c: _UcDeger(self.ham[c], -1) for c in self.SUTUNLAR}
+        self.tam_tarama_sayisi = 0
+        self.endeksler = {}
+        for ad in self.BAGIMLILIK:
+            self.endeksler[ad] = self._hesapla(ad)
+        self.kesimler = {ad: _KuantilKesim(self.endeksler[ad], q) for ad, q in self.KESIM.items()}
+        self.toplamlar = {cift: _EsMomentToplam(*self._cift_dizileri(cift)) for cift in self.CIFTLER}
+
+    # --- formüller ---------------------------------------------------
+    def _norm(self, c, x, eps):
+        mn, mx = self.alt[c].uc, self.ust[c].uc
+        return (x - mn) / (mx - mn + eps)
+
+    def _hesapla(self, ad, i=None):
+        """Endeksi bütün satırlar için (i=None) veya tek satır için hesaplar."""
+        h = {c: (v if i is None else v[i]) for c, v in self.ham.items()}
+        if ad == 'Yasam_Puan':
+            # yaşam_kalite_endeksi.py: (max - min) ile, +1e-6 olmadan
+            arti = sum(self._norm(c, h[c], 0.0) for c in self.YASAM_ARTI)
+            eksi = sum(self._norm(c, h[c], 0.0) for c in self.YASAM_EKSI)
+            return arti - eksi
+        gelir_norm = self._norm('Gelir', h['Gelir'], 1e-6)
+        egitim_norm = self._norm('Egitim', h['Egitim'], 1e-6)
+        if ad == 'EFDE':
+            return gelir_norm / (h['Issizlik'] + h['Suc'] + 1e-6)
+        if ad == 'Baski_Endeksi':
+            return (h['Issizlik'] + h['Suc']) / (gelir_norm + egitim_norm + 0.1)
+        if ad == 'Egitim_Norm':
+            return egitim_norm
+        raise KeyError(ad)
+
+    def _dizi(self, ad):
+        return self.endeksler[ad] if ad in self.endeksler else self.ham[ad]
+
+    def _cift_dizileri(self, cift):
+        x, y = self._dizi(cift[0]), self._dizi(cift[1])
+        if cift[0] in self.kesimler:
+            normal = self.kesimler[cift[0]].normal
+            return x[normal], y[normal]
+        return x, y
+
+    # --- güncelleme --------------------------------------------------
+    def satir_guncelle(self, i, **degerler):
+        """
+        i. satırın ham değerlerini değiştirir (ör. Kira=21000) ve endeksleri,
+        korelasyon toplamlarını yamalar. Tam tarama yapılan endeksleri döndürür.
+        """
+        bilinmeyen = set(degerler) - set(self.SUTUNLAR)
+        if bilinmeyen:
+            raise KeyError(f"Takip edilmeyen sütun(lar): {sorted(bilinmeyen)}")
+
+        eski_cift = {cift: (self._dizi(cift[0])[i], self._dizi(cift[1])[i]) for cift in self.CIFTLER}
+        eski_kesim = {ad: self.endeksler[ad][i] for ad in self.kesimler}
+        uc_degisen = set()
+        for c, yeni in degerler.items():
+            yeni = float(yeni)
+            self.ham[c][i] = yeni
+            if self.alt[c].guncelle(self.ham[c], i, yeni) | self.ust[c].guncelle(self.ham[c], i, yeni):
+                uc_degisen.add(c)
+
+        taranan = [ad for ad, bag in self.BAGIMLILIK.items() if bag & uc_degisen]
+        for ad in self.endeksler:
+            if ad in taranan:
+                self.endeksler[ad] = self._hesapla(ad)
+            else:
+                self.endeksler[ad][i] = self._hesapla(ad, i)
+        if taranan:
+            self.tam_tarama_sayisi += 1
+
+        gecisler = {}
+        for ad, kesim in self.kesimler.items():
+            if ad in taranan:
+                kesim.tara(self.endeksler[ad])
+            else:
+                gecisler[ad] = kesim.guncelle(i, eski_kesim[ad], self.endeksler[ad][i])
+
+        for cift, toplam in self.toplamlar.items():
+            x, y = self._dizi(cift[0]), self._dizi(cift[1])
+            if cift[0] in taranan or cift[1] in taranan:
+                toplam.hesapla(*self._cift_dizileri(cift))
+            elif cift[0] in gecisler:
+                eski_normal, giren, cikan = gecisler[cift[0]]
+                if eski_normal:
+                    toplam.cikar(*eski_cift[cift])
+                if self.kesimler[cift[0]].normal[i]:
+                    toplam.ekle(x[i], y[i])
+                toplam.ekle(x[giren], y[giren])
+                toplam.cikar(x[cikan], y[cikan])
+            else:
+                toplam.degistir(*eski_cift[cift], x[i], y[i])
+        return taranan
+
+    def il_guncelle(self, il, **degerler):
+        """satir_guncelle'nin il adıyla çağrılan hali."""
+        if il not in self._konum:
+            raise KeyError(f"Tabloda olmayan il: {il}")
+        return self.satir_guncelle(self._konum[il], **degerler)
+
+    # --- sonuçlar ----------------------------------------------------
+    def korelasyonlar(self):
+        return {f"{x} ~ {y}": t.sonuc() for (x, y), t in self.toplamlar.items()}
+
+    def tablo(self):
+        veri = {'Il': self.iller} if self.iller is not None else {}
+        veri.update(self.ham)
+        veri.update(self.endeksler)
+        return pd.DataFrame(veri)
+
+
+def _sutun_degeri(metin):
+    sutun, _, deger = metin.partition('=')
+    try:
+        return sutun, float(deger)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"SUTUN=DEGER biçiminde olmalı: {metin}") from None
+
+
+def _korelasyon_tablosu(onceki, sonraki):
+    satirlar = []
+    for cift, s in sonraki.items():
+        o = onceki[cift]
+        satirlar.append(f"  {cift:<28} r: {o['r']:+.4f} -> {s['r']:+.4f}   "
+                        f"p: {o['p']:.6f} -> {s['p']:.6f}   n: {o['n']} -> {s['n']}")
+    return "\n".join(satirlar)
+
+
+if __name__ == '__main__':
+    from veri_yukleyici import veri_yukle
+
+    parser = argparse.ArgumentParser(description="Tek illik düzeltmeleri endekslere ve korelasyonlara artımlı uygular.")
+    parser.add_argument('--veri', default='message.txt')
+    parser.add_argument('--duzelt', nargs='+', action='append', required=True, metavar='IL SUTUN=DEGER',
+                        help="ör. --duzelt Ankara Kira=21000 Issizlik=9.5 (birden çok kez verilebilir)")
+    args = parser.parse_args()
+
+    try:
+        duzeltmeler = [(il, dict(map(_sutun_degeri, degerler))) for il, *degerler in args.duzelt]
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    try:
+        motor = ArtimliEndeks(veri_yukle(args.veri))
+    except FileNotFoundError:
+        print(f"HATA: {args.veri} dosyası bulunamadı.")
+        exit()
+
+    onceki = motor.korelasyonlar()
+    print("\n" + "="*65)
+    print("          ARTIMLI ENDEKS GÜNCELLEMESİ")
+    print("="*65)
+    for il, degerler in duzeltmeler:
+        if not degerler:
+            print(f"HATA: {il} için SUTUN=DEGER verilmedi.")
+            exit()
+        try:
+            taranan = motor.il_guncelle(il, **degerler)
+        except KeyError as e:
+            print(f"HATA: {e.args[0]}")
+            exit()
+        yeni = ", ".join(f"{c}={v:g}" for c, v in degerler.items())
+        print(f"{il}: {yeni}  (tam tarama: {', '.join(taranan) or 'yok'})")
+
+    print("-"*65)
+    print(_korelasyon_tablosu(onceki, motor.korelasyonlar()))
+    for ad, kesim in motor.kesimler.items():
+        print(f"  {ad} %{kesim.q * 100:g} sınırı: {kesim.sinir:.4f}")
+    print("="*65)
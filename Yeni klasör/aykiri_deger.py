@@ -0,0 +1,181 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from akis_istatistik import Welford, temiz
+
+# ---------------------------------------------------------
+# AYKIRI DEĞER ALT SİSTEMİ (AKIŞ KUANTİLLERİ + DAYANIKLI SKORLAR)
+# ---------------------------------------------------------
+# baski_endeksi_analizi.py quantile(0.95) ile, sicaklık_enerji.py z-skoru
+# ile aykırı değer ayıklıyor; ikisi de bütün sütunun bellekte olmasını
+# gerektiriyor ve z-skoru aykırı değerlerin kendisinden etkileniyor.
+#   - KuantilTaslagi: KLL birleştirilebilir kuantil özeti. Seviye
+#     kapasiteleri üstten alta k·(2/3)^derinlik ile küçülür; toplam ~3k öğe
+#     tutulur. Parçalar/işçiler birlestir() ile toplanır. Sıkıştırmaların
+#     rastgele hataları birbirini götürdüğünden sıra hatası n ile büyümez:
+#     sira_hatasi, kaydedilen sıkıştırmalardan Hoeffding ile hesaplanan
+#     %99 olasılıklı üst sınırdır (k=200 için ~%2, gerçek hata ~%0.5).
+#   - Skorlar: 'z'   -> (x - ortalama) / std (ddof=0, stats.zscore ile aynı)
+#              'mad' -> 0.6745 (x - medyan) / MAD (Iglewicz-Hoaglin)
+#              'iqr' -> Tukey çitlerinin kaç IQR dışında kalındığı
+#     Her yöntem (skor, aykırı mı) döndürür.
+
+VARSAYILAN_ESIK = {'z': 3.0, 'mad': 3.5, 'iqr': 1.5}
+
+
+class KuantilTaslagi:
+    """
+    Birleştirilebilir yaklaşık kuantil özeti (KLL). Seviye h'deki her öğe
+    2^h gözlemi temsil eder. Toplam öğe sayısı kapasiteyi aşınca
+    kapasitesini dolduran en alt seviye sıralanır ve öğelerin yarısı
+    (rastgele tek ya da çift konumdakiler) bir üst seviyeye aktarılır.
+    Hiç sıkıştırma olmadıysa (n küçükse) sonuçlar kesindir.
+    """
+
+    def __init__(self, k=200, tohum=0):
+        self.k = k
+        self.n = 0
+        self.seviyeler = [np.empty(0)]
+        self.varyans = 0.0       # sıkıştırma hatalarının varyans sınırı: Σ (2^h)²
+        self._rng = np.random.default_rng(tohum)
+
+    def _kapasite(self, h):
+        # En üst seviye k, alta doğru her seviyede 2/3 oranında küçülür (KLL);
+        # en alt seviyeler 2'ye kadar iner, toplam kapasite ~3k
+        derinlik = len(self.seviyeler)
+        return max(2, int(math.ceil(self.k * (2 / 3) ** (derinlik - h - 1))))
+
+    def _sikistir(self):
+        while sum(s.size for s in self.seviyeler) > sum(map(self._kapasite, range(len(self.seviyeler)))):
+            h = next(h for h, s in enumerate(self.seviyeler) if s.size >= self._kapasite(h))
+            seviye = np.sort(self.seviyeler[h])
+            # Tek sayıda öğe varsa rastgele uçtaki biri bu seviyede kalır
+            bit = self._rng.integers(2)
+            if seviye.size % 2:
+                kalan, seviye = (seviye[:1], seviye[1:]) if bit else (seviye[-1:], seviye[:-1])
+            else:
+                kalan = seviye[:0]
+            self.seviyeler[h] = kalan
+            if h + 1 == len(self.seviyeler):
+                self.seviyeler.append(np.empty(0))
+            self.seviyeler[h + 1] = np.concatenate([self.seviyeler[h + 1], seviye[bit::2]])
+            # Her sorgunun sırası en çok 2^h kayar, işareti yazı-turayla belirlenir
+            self.varyans += 4.0 ** h
+
+    def guncelle(self, x):
+        x = temiz(x)
+        if x.size:
+            self.n += x.size
+            self.seviyeler[0] = np.concatenate([self.seviyeler[0], x])
+            self._sikistir()
+        return self
+
+    def birlestir(self, diger):
+        while len(self.seviyeler) < len(diger.seviyeler):
+            self.seviyeler.append(np.empty(0))
+        for h, seviye in enumerate(diger.seviyeler):
+            self.seviyeler[h] = np.concatenate([self.seviyeler[h], seviye])
+        self.n += diger.n
+        self.varyans += diger.varyans
+        self._sikistir()
+        return self
+
+    @property
+    def sira_hatasi(self):
+        """
+        Normalize sıra hatası için %99 olasılıklı üst sınır (0 = kesin sonuç).
+        Hoeffding: P(|hata| > t) <= 2 exp(-t² / (2 Σ (2^h)²)); n'den bağımsız
+        olarak ~O(1/k) kalır.
+        """
+        if not self.n:
+            return 0.0
+        return math.sqrt(2 * self.varyans * math.log(2 / 0.01)) / self.n
+
+    def kuantil(self, q):
+        q = np.asarray(q, dtype=float)
+        if self.n == 0:
+            return np.full(q.shape, np.nan) if q.ndim else math.nan
+        if self.varyans == 0:
+            # Kesin durum: pandas/numpy ile aynı doğrusal enterpolasyon
+            sonuc = np.quantile(self.seviyeler[0], q)
+        else:
+            degerler = np.concatenate(self.seviyeler)
+            agirliklar = np.concatenate([np.full(s.size, 2.0 ** h) for h, s in enumerate(self.seviyeler)])
+            sira = np.argsort(degerler, kind='stable')
+            degerler, agirliklar = degerler[sira], agirliklar[sira]
+            # Her öğe temsil ettiği ağırlığın ortasına yerleştirilip enterpole edilir
+            orta = np.cumsum(agirliklar) - agirliklar / 2
+            sonuc = np.interp(q * self.n, orta, degerler)
+        return float(sonuc) if q.ndim == 0 else sonuc
+
+
+def parametreleri_hesapla(x, yontem='mad'):
+    """Bellekteki bir dizi için skor parametreleri (kesin)."""
+    x = temiz(x)
+    if yontem == 'z':
+        return {'yontem': yontem, 'merkez': float(x.mean()), 'olcek': float(x.std())}
+    if yontem == 'mad':
+        medyan = float(np.median(x))
+        return {'yontem': yontem, 'merkez': medyan, 'olcek': float(np.median(np.abs(x - medyan)))}
+    if yontem == 'iqr':
+        q1, q3 = np.quantile(x, [0.25, 0.75])
+        return {'yontem': yontem, 'q1': float(q1), 'q3': float(q3), 'olcek': float(q3 - q1)}
+    raise ValueError(f"Bilinmeyen yöntem: {yontem}")
+
+
+def akis_parametreleri(parca_ureteci, yontem='mad', k=200):
+    """
+    Sütunu bellekte tutmadan skor parametreleri. parca_ureteci her
+    çağrıldığında dizileri yeniden üreten bir fonksiyon olmalı (ör.
+    lambda: (p['Kira'] for p in parcali_oku(yol))); 'mad' iki geçiş yapar.
+    Taslak tabanlı yöntemlerde 'sira_hatasi' da döner.
+    """
+    if yontem == 'z':
+        w = Welford()
+        for parca in parca_ureteci():
+            w.guncelle(parca)
+        return {'yontem': yontem, 'merkez': w.ortalama, 'olcek': math.sqrt(w.m2 / w.n) if w.n else math.nan}
+
+    taslak = KuantilTaslagi(k)
+    for parca in parca_ureteci():
+        taslak.guncelle(parca)
+    if yontem == 'iqr':
+        q1, q3 = taslak.kuantil([0.25, 0.75])
+        return {'yontem': yontem, 'q1': float(q1), 'q3': float(q3), 'olcek': float(q3 - q1),
+                'sira_hatasi': taslak.sira_hatasi}
+    if yontem == 'mad':
+        medyan = taslak.kuantil(0.5)
+        sapma = KuantilTaslagi(k)
+        for parca in parca_ureteci():
+            sapma.guncelle(np.abs(np.asarray(parca, dtype=float) - medyan))
+        return {'yontem': yontem, 'merkez': medyan, 'olcek': sapma.kuantil(0.5),
+                'sira_hatasi': max(taslak.sira_hatasi, sapma.sira_hatasi)}
+    raise ValueError(f"Bilinmeyen yöntem: {yontem}")
+
+
+def skorla(x, parametreler, esik=None):
+    """Parametrelere göre (skor, aykırı_mı) dizileri; parça parça çağrılabilir."""
+    x = np.asarray(x, dtype=float)
+    yontem = parametreler['yontem']
+    esik = VARSAYILAN_ESIK[yontem] if esik is None else esik
+    olcek = parametreler['olcek']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if yontem == 'z':
+            skor = (x - parametreler['merkez']) / olcek
+        elif yontem == 'mad':
+            skor = 0.6745 * (x - parametreler['merkez']) / olcek
+        else:
+            # Çitin dışındaki uzaklık (IQR biriminde, işaretli); içeride 0
+            skor = np.where(x > parametreler['q3'], (x - parametreler['q3']) / olcek,
+                            np.where(x < parametreler['q1'], (x - parametreler['q1']) / olcek, 0.0))
+    return skor, np.abs(skor) > esik
+
+
+def aykiri_skorlari(x, yontem='mad', esik=None):
+    """Bellekteki bir sütun için skor ve bayrak tablosu (indeks korunur)."""
+    parametreler = parametreleri_hesapla(x, yontem)
+    skor, aykiri = skorla(x, parametreler, esik)
+    indeks = x.index if isinstance(x, pd.Series) else None
+    return pd.DataFrame({'skor': skor, 'aykiri': aykiri}, index=indeks)
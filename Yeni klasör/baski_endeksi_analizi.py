@@ -1,55 +1,61 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from scipy import stats
-
-
+from istatistik_cekirdek import dogrusal_regresyon
+from regresyon_grafik import regresyon_ciz
+from veri_yukleyici import veri_yukle
+from turetilmis_sutunlar import turet
+from aykiri_deger import KuantilTaslagi
+from etiket_yerlesimi import etiketle
+from yogunluk_grafigi import dagilim_ciz
+from grafik_cikti import goster
+from profil import bolum
+
+
+bolum('VERİ YÜKLEME')
 try:
-    df = pd.read_csv('message.txt')
-    df.columns = df.columns.str.strip().str.replace(' ', '_').str.replace('yıllık_ortalama_sicaklik', 'Sicaklik')
-    df.rename(columns={'Ortalama_Maas': 'Gelir', 'Eğitim': 'Egitim', 'Suc_Orani': 'Suc'}, inplace=True)
-    df['Kira'] = pd.to_numeric(df['Kira'], errors='coerce')
+    df = veri_yukle('message.txt')
     df.dropna(subset=['Kira', 'Gelir', 'Egitim', 'Issizlik', 'Suc', 'Nufus'], inplace=True)
 except FileNotFoundError:
     print("HATA: message.txt dosyası bulunamadı.")
     exit()
 
 # HESAPLAMALAR VE NORMALİZASYON
-def normalize(column):
-    return (column - column.min()) / (column.max() - column.min() + 1e-6)
-
-df['Gelir_Norm'] = normalize(df['Gelir'])
-df['Egitim_Norm'] = normalize(df['Egitim'])
+# normalize() ve formüller turetilmis_sutunlar.py'de tanımlı
 # Baskı Endeksi: Sosyal baskı (İşsizlik+Suç) / Sosyal Refah (Gelir+Eğitim)
-df['Baski_Endeksi'] = (df['Issizlik'] + df['Suc']) / (df['Gelir_Norm'] + df['Egitim_Norm'] + 0.1)
+bolum('HESAPLAMALAR', satir=len(df))
+df = turet(df, ['Gelir_Norm', 'Egitim_Norm', 'Baski_Endeksi'])
 
 #AYKIRI DEĞER VE İSTATİSTİKSEL H
-sinir = df['Baski_Endeksi'].quantile(0.95)
-df_normal = df[df['Baski_Endeksi'] <= sinir].copy()
-df_outliers = df[df['Baski_Endeksi'] > sinir].copy()
+# Birleştirilebilir kuantil taslağı: küçük veride kesin (quantile ile aynı),
+# ilçe ölçeğinde parça parça beslenebilir
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
+sinir = KuantilTaslagi().guncelle(df['Baski_Endeksi']).kuantil(0.95)
+# Alt tablolar kopyalanmaz; normal/aykırı ayrımı bir boolean maske ile tutulur
+endeks, kira = df['Baski_Endeksi'].to_numpy(dtype=float), df['Kira'].to_numpy(dtype=float)
+normal = endeks <= sinir
+aykirilar = np.flatnonzero(~normal)
 
 # Korelasyon ve P-Value (Hipotez Testi)
-r_val, p_val = stats.pearsonr(df_normal['Baski_Endeksi'], df_normal['Kira'])
+regresyon = dogrusal_regresyon(endeks[normal], kira[normal])
+r_val, p_val = regresyon.r, regresyon.p
 gecerlilik = "GEÇERLİ" if p_val < 0.05 else "GEÇERSİZ"
 
 #  GRAFİK OLUŞTURMA 
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 plt.figure(figsize=(12, 7))
 
 # Regresyon Çizgisi
-sns.regplot(x='Baski_Endeksi', y='Kira', data=df_normal, scatter=False, 
-            color='red', truncate=True, line_kws={"label": "Eğilim Çizgisi (Regresyon)"})
+regresyon_ciz(regresyon, endeks[normal], color='red',
+              line_kws={"label": "Eğilim Çizgisi (Regresyon)"})
 
 # Dağılım Grafiği
-sns.scatterplot(x='Baski_Endeksi', y='Kira', data=df, size='Nufus', 
-                sizes=(100, 1000), alpha=0.7, hue='Kira', palette="magma", edgecolor="w")
+# Satır sayısı yoğunluk eşiğini aşarsa noktalar kutulanıp tek görüntü olarak çizilir
+dagilim_ciz(df, 'Baski_Endeksi', 'Kira', boyut='Nufus', renk='Kira',
+            sizes=(100, 1000), alpha=0.7, palette="magma", edgecolor="w")
 
-# Aykırı Değer İşaretleme
-for i in range(len(df_outliers)):
-    plt.scatter(df_outliers.iloc[i]['Baski_Endeksi'], df_outliers.iloc[i]['Kira'], 
-                s=2500, facecolors='none', edgecolors='red', linewidths=2, linestyle='--')
-    plt.text(df_outliers.iloc[i]['Baski_Endeksi'], df_outliers.iloc[i]['Kira'] + 1000, 
-             f"Aykırı: {df_outliers.iloc[i]['Il']}", color='red', weight='bold', ha='center')
+# Aykırı Değer İşaretleme (tek çağrı; yazıları aşağıda şehir etiketleriyle birlikte yerleşir)
+plt.scatter(endeks[aykirilar], kira[aykirilar], s=2500, facecolors='none', edgecolors='red',
+            linewidths=2, linestyle='--')
 
 # Grafik Detayları
 plt.title(f'BASKI ENDEKSİ VE KİRA İLİŞKİSİ\n', fontsize=14)
@@ -70,12 +76,19 @@ print(f"   Açıklama: Bu bağ tesadüf değildir, değişkenler birbirini doğr
 
 
 
-# Şehir İsimleri (Önemli olanlar)
+# Aykırı ve önemli şehir etiketleri aynı çakışma ızgarasından geçer: önce
+# aykırılar (baskı endeksine göre), sonra önemli şehirler (nüfusa göre).
+# Aykırı etiketleri s=2500 halkanın dışına itilir.
 etiketler = ['İstanbul', 'Ankara', 'İzmir', 'Şırnak', 'Hakkari']
-for i, row in df.iterrows():
-    if row['Il'] in etiketler:
-        plt.text(row['Baski_Endeksi'], row['Kira'], row['Il'], weight='bold', fontsize=9)
+onemli = np.flatnonzero(df['Il'].isin(etiketler).to_numpy() & normal)
+sira = np.concatenate([aykirilar, onemli])
+oncelik = np.concatenate([len(onemli) + df['Baski_Endeksi'].iloc[aykirilar].rank().to_numpy(),
+                          df['Nufus'].iloc[onemli].rank().to_numpy()])
+metinler = [f"Aykırı: {il}" for il in df['Il'].iloc[aykirilar]] + list(df['Il'].iloc[onemli])
+etiketle(plt.gca(), endeks[sira], kira[sira], metinler, oncelik=oncelik,
+         renkler=['red'] * len(aykirilar) + ['black'] * len(onemli),
+         kayma=np.r_[np.full(len(aykirilar), 7.0), np.ones(len(onemli))], fontsize=9, fontweight='bold')
 
 plt.tight_layout()
-plt.show()
+goster('baski_endeksi')
 
@@ -1,16 +1,20 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from scipy import stats
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
+from istatistik_cekirdek import dogrusal_regresyon
+from veri_yukleyici import seri_yukle
+from zaman_serisi import kayan_regresyon, kirilma_noktasi
+from kuznets import kuznets_uydur, kuznets_tahmin
+from regresyon_grafik import regresyon_ciz
+from etiket_yerlesimi import etiketle
+from grafik_cikti import goster
+from profil import bolum
 
 # ==============================
 # 1. VERİ YÜKLEME VE HAZIRLIK
 # ==============================
+bolum('VERİ YÜKLEME')
 try:
-    df = pd.read_csv("emisyon_gsyh.csv")
+    df = seri_yukle("emisyon_gsyh.csv")
     df = df.sort_values("Yil")
     
     # Veri setinde boşluk varsa temizleyelim
@@ -29,6 +33,7 @@ except FileNotFoundError:
 # ==============================
 # 2. BİLİMSEL ANALİZ MOTORU
 # ==============================
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
 print("\n" + "="*65)
 print("       EKONOMİ VE ÇEVRE ETKİLEŞİM RAPORU (Kuznets Analizi)")
 print("="*65)
@@ -37,7 +42,9 @@ print("="*65)
 x_col = 'GSYH_Milyar_USD'
 y_col = 'Toplam_Emisyon'
 
-r_val, p_val = stats.pearsonr(df[x_col], df[y_col])
+# r, p ve regresyon katsayıları tek geçişte (istatistik_cekirdek.py)
+regresyon = dogrusal_regresyon(df[x_col], df[y_col])
+r_val, p_val = regresyon.r, regresyon.p
 
 print(f"[1] İLİŞKİ GÜCÜ (KORELASYON):")
 print(f"    Katsayı (r): {r_val:.4f}")
@@ -51,20 +58,42 @@ print(f"\n[2] GÜVENİLİRLİK (P-Value: {p_val:.6f}):")
 print(f"    Sonuç: Bu ilişki {durum}DIR.")
 
 # C) REGRESYON MODELİ
-X = df[[x_col]].values
-y = df[y_col].values
-model = LinearRegression()
-model.fit(X, y)
-r2 = r2_score(y, model.predict(X))
+r2 = regresyon.r2
 
 print(f"\n[3] MODEL BAŞARISI (R2):")
 print(f"    Değer: {r2:.4f}")
 print(f"    Anlamı: Emisyon artışının %{r2*100:.1f}'i ekonomik büyüme ile açıklanmaktadır.")
+
+# D) ZAMAN İÇİNDE DEĞİŞEN ETKİ (8 yıllık kayan pencere + kırılma)
+kayan = kayan_regresyon(df['Yil'], df[y_col], x=df[x_col], pencere=8)
+kayan = kayan[kayan['bit'] >= df['Yil'].min() + 7]  # yalnızca tam 8 yıllık pencereler
+kirilma = kirilma_noktasi(df['Yil'], df[y_col], x=df[x_col])
+ilk, son = kayan.iloc[0], kayan.iloc[-1]
+print(f"\n[4] ZAMAN İÇİNDE DEĞİŞEN ETKİ (8 yıllık kayan pencere):")
+print(f"    {ilk['bas']:.0f}-{ilk['bit']:.0f}: 1 Milyar USD -> {ilk['egim']:.3f} Mt (r = {ilk['r']:.2f})")
+print(f"    {son['bas']:.0f}-{son['bit']:.0f}: 1 Milyar USD -> {son['egim']:.3f} Mt (r = {son['r']:.2f})")
+print(f"    Yapısal kırılma: {kirilma['yil']:.0f} (Chow F = {kirilma['chow_f']:.2f}, p = {kirilma['p']:.6f})")
+
+# E) KUZNETS EĞRİSİ TESTİ (ters U: b2 < 0 ve veri aralığında bir dönüm noktası)
+print(f"\n[5] KUZNETS EĞRİSİ (Polinom Modeller, 2000 bootstrap):")
+kuznets_modelleri = {}
+for derece, log in [(2, False), (3, False), (2, True)]:
+    ad = f"{'Kuadratik' if derece == 2 else 'Kübik'}{' (log)' if log else ''}"
+    k = kuznets_uydur(df[x_col], df[y_col], derece=derece, log=log)
+    kuznets_modelleri[ad] = k
+    b2 = k['katsayilar'].loc['b2']
+    print(f"    {ad:<16} R2 = {k['r2']:.4f} | b2 = {b2['katsayi']:.3g} (p = {b2['p']:.4f})")
+    if np.isfinite(k['donum']):
+        print(f"      Dönüm noktası: {k['donum']:.0f} Milyar USD "
+              f"(%95 GA: {k['donum_alt']:.0f} - {k['donum_ust']:.0f}, bulunma oranı: %{k['donum_orani']*100:.0f})")
+    else:
+        print(f"      Veri aralığında dönüm noktası yok (bootstrap bulunma oranı: %{k['donum_orani']*100:.0f})")
 print("="*65 + "\n")
 
 # ==============================
 # 3. GÖRSELLEŞTİRME (ÇİFT PANEL)
 # ==============================
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 fig, (ax1, ax3) = plt.subplots(2, 1, figsize=(12, 12))
 
 # --- ÜST GRAFİK: ZAMAN SERİSİ (TARİHÇE) ---
@@ -86,16 +115,23 @@ ax1.set_title("Bölüm 1: Yıllara Göre Gelişim (Tarihsel Süreç)", fontsize=
 
 # --- ALT GRAFİK: REGRESYON (BİLİMSEL KANIT) ---
 # İşte o meşhur "Kırmızı Koridor" burada devreye giriyor
-sns.regplot(x=x_col, y=y_col, data=df, ax=ax3,
-            ci=95,  # %95 Güven Aralığı Koridoru
-            scatter_kws={'s': 100, 'color': 'purple', 'alpha': 0.6, 'label': 'Yıllık Veriler'},
-            line_kws={'color': 'orange', 'linewidth': 3, 'label': f'Etki Trendi (R2={r2:.2f})'})
+regresyon_ciz(regresyon, df[x_col], df[y_col], ax=ax3,
+              guven=0.95,  # %95 Güven Aralığı Koridoru (kapalı form)
+              scatter_kws={'s': 100, 'color': 'purple', 'alpha': 0.6, 'label': 'Yıllık Veriler'},
+              line_kws={'color': 'orange', 'linewidth': 3, 'label': f'Etki Trendi (R2={r2:.2f})'})
+
+# Kuadratik Kuznets eğrisi (ters U olup olmadığı gözle görülsün)
+kuadratik = kuznets_modelleri['Kuadratik']
+x_egri = np.linspace(df[x_col].min(), df[x_col].max(), 200)
+ax3.plot(x_egri, kuznets_tahmin(kuadratik, x_egri), color='green', linestyle='--', linewidth=2,
+         label=f"Kuznets (Kuadratik, R2={kuadratik['r2']:.2f})")
 
 # Yılları noktaların üzerine yazalım (Hangi yıl nerede?)
-for i, row in df.iterrows():
-    # Sadece belli yılları yazalım (karmaşa olmasın diye 3 yılda bir veya uç değerler)
-    if i % 3 == 0 or row['Yil'] == df['Yil'].max() or row['Yil'] == df['Yil'].min():
-        ax3.text(row[x_col], row[y_col], str(int(row['Yil'])), fontsize=9, fontweight='bold')
+# Öncelik: uç yıllar, sonra 3 yılda bir; yer kalırsa diğerleri, çakışanlar atlanır
+uc_yil = df['Yil'].isin([df['Yil'].min(), df['Yil'].max()])
+yil_onceligi = 2 * uc_yil + (np.arange(len(df)) % 3 == 0)
+etiketle(ax3, df[x_col], df[y_col], df['Yil'].astype(int), oncelik=yil_onceligi,
+         fontsize=9, fontweight='bold')
 
 ax3.set_title("Bölüm 2: Ekonomik Büyümenin Çevreye Etkisi (Korelasyon Analizi)", fontsize=14)
 ax3.set_xlabel("GSYH (Milyar USD) - Zenginleşme", fontsize=12)
@@ -104,4 +140,4 @@ ax3.grid(True, linestyle="--", alpha=0.5)
 ax3.legend(loc='upper left')
 
 plt.tight_layout()
-plt.show()
\ No newline at end of file
+goster('emisyon_gsyh')
\ No newline at end of file
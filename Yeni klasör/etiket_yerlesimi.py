@@ -0,0 +1,140 @@
+from collections import defaultdict
+
+import numpy as np
+
+from profil import profillenir
+
+# ---------------------------------------------------------
+# ÇAKIŞMA DUYARLI ŞEHİR ETİKETİ YERLEŞİMİ
+# ---------------------------------------------------------
+# Scriptler iterrows() içinde her şehre tek tek plt.text çağırıyor; 81 ilde
+# etiketler üst üste biniyor, ilçe ölçeğinde ise yazı çizimi dakikalar
+# sürüyor. Burada:
+#   1. Etiketler önceliğe göre sıralanır (nüfus, aykırılık, kritik il ...).
+#   2. Her etiket için birkaç aday konum (sağ, üst, sol, alt, köşeler)
+#      ekran (piksel) koordinatlarında kutu olarak hesaplanır. Yazı boyutu
+#      Text nesnesi oluşturmadan karakter sayısından tahmin edilir.
+#   3. Yerleşen kutular düzgün bir ızgarada (spatial hash) tutulur; her aday
+#      yalnızca kapsadığı hücrelerdeki kutularla karşılaştırılır. Toplam
+#      maliyet sıralama dahil yaklaşık O(n log n).
+#   4. Çakışmayan ilk aday seçilir; hiçbiri uymazsa etiket atlanır.
+#      Yerleşen etiketler en sonda tek seferde eksene eklenir.
+
+# ad -> (x kayması, y kayması [punto], ha, va)
+ADAYLAR = {
+    'sag': (4, 0, 'left', 'center'),
+    'ust': (0, 4, 'center', 'bottom'),
+    'sol': (-4, 0, 'right', 'center'),
+    'alt': (0, -4, 'center', 'top'),
+    'sag_ust': (3, 3, 'left', 'bottom'),
+    'sol_ust': (-3, 3, 'right', 'bottom'),
+    'sag_alt': (3, -3, 'left', 'top'),
+    'sol_alt': (-3, -3, 'right', 'top'),
+}
+VARSAYILAN_KONUMLAR = ('sag', 'ust', 'sol', 'alt', 'sag_ust', 'sol_ust', 'sag_alt', 'sol_alt')
+
+# Ortalama karakter genişliği / punto (DejaVu Sans için yaklaşık)
+_KARAKTER_ORANI = {'normal': 0.6, 'bold': 0.68}
+
+
+def _kutu(px, py, g, h, dx, dy, ha, va):
+    """Bağlantı noktası ve hizalamaya göre (x0, y0, x1, y1) piksel kutusu."""
+    x0 = px + dx - {'left': 0, 'center': g / 2, 'right': g}[ha]
+    y0 = py + dy - {'bottom': 0, 'center': h / 2, 'top': h}[va]
+    return x0, y0, x0 + g, y0 + h
+
+
+def yerlesim_hesapla(px, py, genislik, yukseklik, oncelik=None, konumlar=VARSAYILAN_KONUMLAR,
+                     kayma_olcegi=1.0, sinir=None, dolgu=1.0):
+    """
+    Piksel koordinatlarındaki noktalar ve etiket boyutları için yerleşim.
+    Dönüş: (yerleşen etiket indeksleri, her biri için seçilen konum adı).
+    sinir: (x0, y0, x1, y1) verilirse bu kutunun dışına taşan aday elenir.
+    """
+    px, py = np.asarray(px, dtype=float), np.asarray(py, dtype=float)
+    genislik = np.broadcast_to(np.asarray(genislik, dtype=float), px.shape)
+    yukseklik = np.broadcast_to(np.asarray(yukseklik, dtype=float), px.shape)
+    kayma_olcegi = np.broadcast_to(np.asarray(kayma_olcegi, dtype=float), px.shape)
+    if px.size == 0:
+        return [], []
+    sira = np.argsort(-np.asarray(oncelik, dtype=float), kind='stable') if oncelik is not None \
+        else np.arange(px.size)
+
+    hucre = max(float(np.median(genislik)), float(np.median(yukseklik)), 1.0)
+    izgara = defaultdict(list)
+    kutular = []
+    secilen, secilen_konum = [], []
+
+    for i in sira:
+        if not (np.isfinite(px[i]) and np.isfinite(py[i])):
+            continue
+        for ad in konumlar:
+            dx, dy, ha, va = ADAYLAR[ad]
+            x0, y0, x1, y1 = _kutu(px[i], py[i], genislik[i], yukseklik[i],
+                                   dx * kayma_olcegi[i], dy * kayma_olcegi[i], ha, va)
+            if sinir is not None and (x0 < sinir[0] or y0 < sinir[1] or x1 > sinir[2] or y1 > sinir[3]):
+                continue
+            hucreler = [(cx, cy)
+                        for cx in range(int(x0 // hucre), int(x1 // hucre) + 1)
+                        for cy in range(int(y0 // hucre), int(y1 // hucre) + 1)]
+            cakisma = False
+            for h in hucreler:
+                for k in izgara.get(h, ()):
+                    a0, b0, a1, b1 = kutular[k]
+                    if x0 < a1 + dolgu and a0 < x1 + dolgu and y0 < b1 + dolgu and b0 < y1 + dolgu:
+                        cakisma = True
+                        break
+                if cakisma:
+                    break
+            if cakisma:
+                continue
+            kutular.append((x0, y0, x1, y1))
+            for h in hucreler:
+                izgara[h].append(len(kutular) - 1)
+            secilen.append(int(i))
+            secilen_konum.append(ad)
+            break
+    return secilen, secilen_konum
+
+
+@profillenir()
+def etiketle(ax, x, y, metinler, oncelik=None, konumlar=VARSAYILAN_KONUMLAR, fontsize=9,
+             fontweight='normal', renkler=None, eksen_icinde=True, kayma=1.0, **text_kws):
+    """
+    Veri koordinatlarındaki noktaları çakışmadan etiketler; sığmayanlar
+    atlanır. Eksen sınırları belirlendikten (veri çizildikten) sonra
+    çağrılmalıdır. Etiketler noktaya punto cinsinden kaydırılarak
+    (annotate, offset points) eklendiği için sonradan tight_layout gibi
+    yerleşim değişikliklerinde noktadan kopmaz. kayma, büyük işaretçilerde
+    (ör. s=150) etiketi noktadan uzaklaştırmak için aday kaymalarını ölçekler;
+    etiket başına dizi de olabilir (aynı çağrıda farklı boy işaretçiler).
+    Dönüş: eklenen Annotation nesneleri.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    metinler = [str(m) for m in metinler]
+    if not metinler:
+        return []
+    kayma = np.broadcast_to(np.asarray(kayma, dtype=float), x.shape)
+
+    pt = ax.figure.dpi / 72.0
+    karakter = _KARAKTER_ORANI.get(fontweight, _KARAKTER_ORANI['normal'])
+    uzunluk = np.array([len(m) for m in metinler], dtype=float)
+    genislik = uzunluk * fontsize * karakter * pt
+    yukseklik = np.full(len(metinler), fontsize * 1.2 * pt)
+
+    # Otomatik ölçekleme tembel uygulanır; dönüşümden önce sınırları güncelle
+    ax.get_xlim(), ax.get_ylim()
+    piksel = ax.transData.transform(np.column_stack([x, y]))
+    sinir = tuple(ax.bbox.extents) if eksen_icinde else None
+    secilen, secilen_konum = yerlesim_hesapla(piksel[:, 0], piksel[:, 1], genislik, yukseklik,
+                                              oncelik, konumlar, kayma_olcegi=pt * kayma, sinir=sinir)
+
+    eklenen = []
+    for i, ad in zip(secilen, secilen_konum):
+        dx, dy, ha, va = ADAYLAR[ad]
+        renk = renkler[i] if renkler is not None else text_kws.get('color', 'black')
+        kws = {**text_kws, 'color': renk}
+        eklenen.append(ax.annotate(metinler[i], (x[i], y[i]), xytext=(dx * kayma[i], dy * kayma[i]), textcoords='offset points',
+                                   ha=ha, va=va, fontsize=fontsize, fontweight=fontweight, **kws))
+    return eklenen
@@ -0,0 +1,75 @@
+import os
+
+import matplotlib
+
+from profil import asama, bitir
+
+# ---------------------------------------------------------
+# BAŞSIZ (HEADLESS) GRAFİK ÇIKTISI
+# ---------------------------------------------------------
+# Scriptlerin sonundaki plt.show() ekran ister ve programı bloklar. Bu modül
+# ortam değişkenleriyle açılan başsız bir mod sağlar:
+#   GRAFIK_DIZINI=ciktilar    -> pencere açılmaz, grafikler bu klasöre yazılır
+#   GRAFIK_FORMAT=png,svg     -> yazılacak format(lar) (varsayılan: png)
+#   GRAFIK_DPI=200            -> çözünürlük (varsayılan: 150)
+# Değişken tanımlı değilse goster() eskisi gibi plt.show() çağırır.
+
+VARSAYILAN_DPI = 150
+
+
+def cikti_dizini():
+    return os.environ.get('GRAFIK_DIZINI') or None
+
+
+def basiz_mi():
+    return cikti_dizini() is not None
+
+
+def ayarlar():
+    """(dizin, formatlar, dpi) üçlüsünü ortam değişkenlerinden okur."""
+    formatlar = [f.strip().lower() for f in os.environ.get('GRAFIK_FORMAT', 'png').split(',') if f.strip()]
+    dpi = int(os.environ.get('GRAFIK_DPI', VARSAYILAN_DPI))
+    return cikti_dizini(), formatlar, dpi
+
+
+if basiz_mi():
+    # Etkileşimsiz arka uç; pyplot önceden içe aktarılmış olsa da geçerli olur
+    matplotlib.use('Agg')
+
+
+def figur_kaydet(fig, ad, dizin=None, formatlar=None, dpi=None):
+    """Tek bir figürü istenen formatlarda kaydeder; yazılan yolları döndürür."""
+    varsayilan_dizin, varsayilan_formatlar, varsayilan_dpi = ayarlar()
+    dizin = dizin or varsayilan_dizin or '.'
+    formatlar = formatlar or varsayilan_formatlar
+    dpi = dpi or varsayilan_dpi
+    os.makedirs(dizin, exist_ok=True)
+    yollar = []
+    for fmt in formatlar:
+        yol = os.path.join(dizin, f"{ad}.{fmt}")
+        fig.savefig(yol, dpi=dpi, format=fmt)
+        yollar.append(yol)
+    return yollar
+
+
+def goster(ad):
+    """
+    plt.show() yerine kullanılır. Başsız modda açık bütün figürler
+    '<ad>.png', '<ad>_2.png' ... olarak kaydedilip kapatılır.
+    """
+    import matplotlib.pyplot as plt
+
+    if not basiz_mi():
+        # Pencerede beklenen süre profile (bkz. profil.py) girmesin
+        bitir()
+        plt.show()
+        return []
+
+    yollar = []
+    with asama('grafik_kaydet', satir=len(plt.get_fignums())):
+        for sira, numara in enumerate(plt.get_fignums(), start=1):
+            fig = plt.figure(numara)
+            dosya_adi = ad if sira == 1 else f"{ad}_{sira}"
+            yollar.extend(figur_kaydet(fig, dosya_adi))
+            plt.close(fig)
+    return yollar
@@ -0,0 +1,114 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from istatistik_cekirdek import t_p_degerleri
+
+# ---------------------------------------------------------
+# GRUPLU ANALİZ MODU (BÖLGE / İLÇE BAZINDA KORELASYON VE REGRESYON)
+# ---------------------------------------------------------
+# Scriptler tek bir ulusal r, p ve eğim hesaplıyor. Bu modül aynı sonuçları
+# her grup (coğrafi bölge, ilçe ...) için tek geçişte üretir: gruplar
+# pd.factorize ile tamsayı koda çevrilir ve n, Σx, Σy, Σx², Σy², Σxy
+# toplamları np.bincount ile bütün gruplar için aynı anda alınır.
+# df[df.Bolge == k] alt kümeleri üzerinde döngü yoktur.
+
+# İl -> 7 coğrafi bölge
+BOLGELER = {
+    'Marmara': ['Balıkesir', 'Bilecik', 'Bursa', 'Çanakkale', 'Edirne', 'İstanbul',
+                'Kırklareli', 'Kocaeli', 'Sakarya', 'Tekirdağ', 'Yalova'],
+    'Ege': ['Afyonkarahisar', 'Aydın', 'Denizli', 'İzmir', 'Kütahya', 'Manisa', 'Muğla', 'Uşak'],
+    'Akdeniz': ['Adana', 'Antalya', 'Burdur', 'Hatay', 'Isparta', 'Kahramanmaraş', 'Mersin', 'Osmaniye'],
+    'İç Anadolu': ['Aksaray', 'Ankara', 'Çankırı', 'Eskişehir', 'Karaman', 'Kayseri', 'Kırıkkale',
+                   'Kırşehir', 'Konya', 'Nevşehir', 'Niğde', 'Sivas', 'Yozgat'],
+    'Karadeniz': ['Amasya', 'Artvin', 'Bartın', 'Bayburt', 'Bolu', 'Çorum', 'Düzce', 'Giresun',
+                  'Gümüşhane', 'Karabük', 'Kastamonu', 'Ordu', 'Rize', 'Samsun', 'Sinop', 'Tokat',
+                  'Trabzon', 'Zonguldak'],
+    'Doğu Anadolu': ['Ağrı', 'Ardahan', 'Bingöl', 'Bitlis', 'Elazığ', 'Erzincan', 'Erzurum', 'Hakkari',
+                     'Iğdır', 'Kars', 'Malatya', 'Muş', 'Tunceli', 'Van'],
+    'Güneydoğu Anadolu': ['Adıyaman', 'Batman', 'Diyarbakır', 'Gaziantep', 'Kilis', 'Mardin', 'Siirt',
+                          'Şanlıurfa', 'Şırnak'],
+}
+IL_BOLGE = {il: bolge for bolge, iller in BOLGELER.items() for il in iller}
+
+
+def gruplu_regresyon(df, x, y, anahtar, harita=None):
+    """
+    Her grup için n, ortalamalar, Pearson r, p-değeri, OLS eğimi ve kesişimi.
+
+    anahtar: grup sütununun adı (ör. 'Ilce') ya da harita ile birlikte
+        eşlenecek sütun (ör. anahtar='Il', harita=IL_BOLGE).
+    x veya y'si NaN olan ya da grubu eşlenemeyen satırlar dışarıda kalır.
+    Gözlemi 3'ten az olan gruplarda r/p/eğim NaN döner.
+    """
+    gruplar = df[anahtar].map(harita) if harita is not None else df[anahtar]
+    xd = df[x].to_numpy(dtype=float)
+    yd = df[y].to_numpy(dtype=float)
+    kodlar, adlar = pd.factorize(gruplar, sort=True)
+
+    gecerli = (kodlar >= 0) & ~np.isnan(xd) & ~np.isnan(yd)
+    kodlar, xd, yd = kodlar[gecerli], xd[gecerli], yd[gecerli]
+    # Büyük değerlerde sayısal iptali azaltmak için genel ortalamayı çıkar
+    kaydir_x = xd.mean() if xd.size else 0.0
+    kaydir_y = yd.mean() if yd.size else 0.0
+    xd, yd = xd - kaydir_x, yd - kaydir_y
+
+    k = len(adlar)
+    n = np.bincount(kodlar, minlength=k).astype(float)
+    sx = np.bincount(kodlar, xd, k)
+    sy = np.bincount(kodlar, yd, k)
+    sxx = np.bincount(kodlar, xd * xd, k)
+    syy = np.bincount(kodlar, yd * yd, k)
+    sxy = np.bincount(kodlar, xd * yd, k)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ort_x, ort_y = sx / n, sy / n
+        cxx = sxx - sx * ort_x
+        cyy = syy - sy * ort_y
+        cxy = sxy - sx * ort_y
+        r = np.clip(cxy / np.sqrt(cxx * cyy), -1.0, 1.0)
+        egim = cxy / cxx
+        kesisim = (ort_y + kaydir_y) - egim * (ort_x + kaydir_x)
+        sd = n - 2
+        t = r * np.sqrt(sd / (1 - r * r))
+
+    yetersiz = n < 3
+    p = t_p_degerleri(t, sd)
+    for dizi in (r, egim, kesisim, p):
+        dizi[yetersiz] = np.nan
+
+    return pd.DataFrame({
+        'n': n.astype(int),
+        f'ort_{x}': ort_x + kaydir_x,
+        f'ort_{y}': ort_y + kaydir_y,
+        'r': r, 'p': p, 'egim': egim, 'kesisim': kesisim,
+    }, index=pd.Index(adlar, name=anahtar if harita is None else 'Grup'))
+
+
+if __name__ == '__main__':
+    from veri_yukleyici import veri_yukle
+    from turetilmis_sutunlar import TURETILMIS, turet
+
+    parser = argparse.ArgumentParser(description="Bölge/grup bazında korelasyon ve regresyon tablosu.")
+    parser.add_argument('x', help="Bağımsız değişken, ör. EFDE")
+    parser.add_argument('y', help="Bağımlı değişken, ör. Egitim_Norm")
+    parser.add_argument('--anahtar', default='Il', help="Grup sütunu (varsayılan: Il -> 7 bölge)")
+    parser.add_argument('--veri', default='message.txt')
+    args = parser.parse_args()
+
+    try:
+        df = veri_yukle(args.veri)
+    except FileNotFoundError:
+        print(f"HATA: {args.veri} dosyası bulunamadı.")
+        exit()
+    df = turet(df, [c for c in (args.x, args.y) if c in TURETILMIS])
+
+    harita = IL_BOLGE if args.anahtar == 'Il' else None
+    tablo = gruplu_regresyon(df, args.x, args.y, args.anahtar, harita)
+
+    print("\n" + "="*65)
+    print(f"      GRUPLU ANALİZ: {args.x} ~ {args.y}")
+    print("="*65)
+    print(tablo.to_string(float_format=lambda v: f"{v:.4f}"))
+    print("="*65)
@@ -0,0 +1,109 @@
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+# ---------------------------------------------------------
+# KAPALI FORM REGRESYON / KORELASYON ÇEKİRDEĞİ
+# ---------------------------------------------------------
+# stats.pearsonr + sklearn LinearRegression + r2_score üçlüsü aynı veri
+# üzerinden üç ayrı geçiş yapıyordu. Basit doğrusal regresyonun bütün
+# sonuçları (eğim, kesişim, r, R², standart hatalar, t ve p) aynı eş-moment
+# toplamlarından çıkar. Bu modül yalnızca NumPy'a bağlıdır; p-değeri için
+# gereken scipy.special de ancak ihtiyaç olduğunda içe aktarılır.
+
+
+class RegresyonSonucu(NamedTuple):
+    n: int
+    egim: float
+    kesisim: float
+    r: float
+    r2: float
+    egim_se: float       # eğimin standart hatası
+    kesisim_se: float    # kesişimin standart hatası
+    t: float             # H0: eğim = 0 için t istatistiği
+    p: float             # çift yönlü p-değeri (stats.pearsonr ile aynı)
+    artik_std: float     # artıkların standart sapması, sqrt(SSE / (n-2))
+    ort_x: float
+    sxx: float           # sum((x - ort_x)^2), güven bantları için
+
+    def tahmin(self, x):
+        return self.kesisim + self.egim * np.asarray(x, dtype=float)
+
+
+def t_p_degeri(t, sd):
+    """Student t dağılımı için çift yönlü p-değeri."""
+    if math.isnan(t) or sd <= 0:
+        return math.nan
+    if math.isinf(t):
+        return 0.0
+    from scipy.special import betainc  # ağır scipy.stats yerine yalnızca special
+
+    return float(betainc(sd / 2.0, 0.5, sd / (sd + t * t)))
+
+
+def t_p_degerleri(t, sd):
+    """t_p_degeri'nin dizi sürümü (gruplu ve matris analizleri için)."""
+    from scipy.special import betainc
+
+    t = np.asarray(t, dtype=float)
+    sd = np.asarray(sd, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = betainc(sd / 2.0, 0.5, sd / (sd + t * t))
+    p = np.where(np.isinf(t), 0.0, p)
+    return np.where(sd > 0, p, np.nan)
+
+
+def f_p_degeri(f, sd1, sd2):
+    """F(sd1, sd2) dağılımı için üst kuyruk p-değeri (model geneli F-testi)."""
+    if math.isnan(f) or sd1 <= 0 or sd2 <= 0:
+        return math.nan
+    if math.isinf(f):
+        return 0.0
+    from scipy.special import betainc
+
+    return float(betainc(sd2 / 2.0, sd1 / 2.0, sd2 / (sd2 + sd1 * f)))
+
+
+def dogrusal_regresyon(x, y):
+    """
+    y = kesisim + egim * x modelini tek seferde hesaplar.
+    NaN içeren satırlar çıkarılır. En az 3 geçerli gözlem gerekir.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    gecerli = ~(np.isnan(x) | np.isnan(y))
+    if not gecerli.all():
+        x, y = x[gecerli], y[gecerli]
+    n = x.size
+    if n < 3:
+        raise ValueError(f"Regresyon için en az 3 gözlem gerekli (n={n})")
+
+    ort_x, ort_y = x.mean(), y.mean()
+    dx, dy = x - ort_x, y - ort_y
+    sxx, syy, sxy = dx @ dx, dy @ dy, dx @ dy
+    if sxx == 0:
+        raise ValueError("x sabit; eğim tanımsız")
+
+    egim = sxy / sxx
+    kesisim = ort_y - egim * ort_x
+    r = sxy / math.sqrt(sxx * syy) if syy > 0 else math.nan
+    r = min(max(r, -1.0), 1.0) if not math.isnan(r) else r
+    r2 = r * r
+
+    sd = n - 2
+    sse = max(syy - egim * sxy, 0.0)
+    artik_std = math.sqrt(sse / sd)
+    egim_se = artik_std / math.sqrt(sxx)
+    kesisim_se = artik_std * math.sqrt(1.0 / n + ort_x * ort_x / sxx)
+    if egim_se > 0:
+        t = egim / egim_se
+    else:
+        t = math.copysign(math.inf, egim) if egim != 0 else math.nan
+
+    return RegresyonSonucu(
+        n=n, egim=float(egim), kesisim=float(kesisim), r=float(r), r2=float(r2),
+        egim_se=float(egim_se), kesisim_se=float(kesisim_se), t=float(t),
+        p=t_p_degeri(float(t), sd), artik_std=float(artik_std),
+        ort_x=float(ort_x), sxx=float(sxx),
+    )
@@ -1,65 +1,62 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from scipy import stats 
-
+from istatistik_cekirdek import dogrusal_regresyon
+from regresyon_grafik import regresyon_ciz
+from veri_yukleyici import veri_yukle
+from turetilmis_sutunlar import turet
+from segmentasyon import segment_ata
+from etiket_yerlesimi import etiketle
+from yogunluk_grafigi import dagilim_ciz
+from grafik_cikti import goster
+from profil import bolum
+
+bolum('VERİ YÜKLEME')
 try:
-    df = pd.read_csv('message.txt')
+    df = veri_yukle('message.txt')
 except FileNotFoundError:
     print("UYARI: message.txt bulunamadı.")
     exit()
 
 
-df.columns = df.columns.str.strip().str.replace(' ', '_').str.replace('yıllık_ortalama_sicaklik', 'Sicaklik')
-df.rename(columns={'Ortalama_Maas': 'Gelir', 'Eğitim': 'Egitim', 'Suc_Orani': 'Suc'}, inplace=True)
-
-df['Kira'] = pd.to_numeric(df['Kira'], errors='coerce')
 df.dropna(subset=['Gelir', 'Kira', 'Suc', 'Issizlik', 'Nufus'], inplace=True)
 
-# --- 1. NORMALİZASYON ---
-min_gelir = df['Gelir'].min()
-max_gelir = df['Gelir'].max()
-df['Gelir_Norm'] = (df['Gelir'] - min_gelir) / (max_gelir - min_gelir + 1e-6)
-
-# --- 2. EKONOMİK RAHATLIK SKORU HESAPLAMA ---
-df['Ekonomik_Rahatlik'] = df['Gelir_Norm'] / (df['Kira'] * df['Issizlik'] + 1e-6)
+# --- 1-2. NORMALİZASYON VE EKONOMİK RAHATLIK SKORU HESAPLAMA ---
+# Gelir_Norm ve Ekonomik_Rahatlik formülleri turetilmis_sutunlar.py'de tanımlı
+bolum('HESAPLAMALAR', satir=len(df))
+df = turet(df, ['Gelir_Norm', 'Ekonomik_Rahatlik'])
 
 # --- 3. BÖLGE TANIMI ---
-ort_skor = df['Ekonomik_Rahatlik'].mean()
-ort_suc = df['Suc'].mean()
-
-def rahatlik_bolge_belirle(row):
-    if row['Ekonomik_Rahatlik'] >= ort_skor and row['Suc'] < ort_suc:
-        return "Yüksek Rahatlık & Düşük Suç (İDEAL)" 
-    elif row['Ekonomik_Rahatlik'] < ort_skor and row['Suc'] >= ort_suc:
-        return "Düşük Rahatlık & Yüksek Suç (RİSKLİ)" 
-    elif row['Ekonomik_Rahatlik'] >= ort_skor and row['Suc'] >= ort_suc:
-        return "Pahalı ve Sorunlu Rahatlık (ÇELİŞKİLİ)"
-    else:
-        return "Gelişime Açık (PASİF)"
+# (Rahatlık yüksek mi?, Suç yüksek mi?) -> Bölge
+bolge_tablosu = {
+    (True, False): "Yüksek Rahatlık & Düşük Suç (İDEAL)",
+    (False, True): "Düşük Rahatlık & Yüksek Suç (RİSKLİ)",
+    (True, True): "Pahalı ve Sorunlu Rahatlık (ÇELİŞKİLİ)",
+    (False, False): "Gelişime Açık (PASİF)",
+}
 
-df['Bolge'] = df.apply(rahatlik_bolge_belirle, axis=1)
+df['Bolge'], (ort_skor, ort_suc) = segment_ata(
+    df['Ekonomik_Rahatlik'], df['Suc'], bolge_tablosu,
+    x_esik='ortalama', y_esik='ortalama', x_esit_yuksek=True, y_esit_yuksek=True)
 
 # --- 4. HİPOTEZ TESTİ VE KORELASYON HESABI ---
 # r_val: Korelasyon gücü, p_val: Hipotez testi anlamlılık değeri
-r_val, p_val = stats.pearsonr(df['Ekonomik_Rahatlik'], df['Suc'])
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
+regresyon = dogrusal_regresyon(df['Ekonomik_Rahatlik'], df['Suc'])
+r_val, p_val = regresyon.r, regresyon.p
 durum = "Anlamlı" if p_val < 0.05 else "Anlamsız"
 
 # --- 5. GRAFİK OLUŞTURMA ---
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 plt.figure(figsize=(12, 8))
 
 # REGRESYON ÇİZGİSİ (Trend Analizi)
-sns.regplot(
-    data=df, x='Ekonomik_Rahatlik', y='Suc', 
-    scatter=False, color='red', line_kws={"linestyle": "--", "label": "Regresyon Eğilimi"}
-)
+regresyon_ciz(regresyon, df['Ekonomik_Rahatlik'], color='red',
+              line_kws={"linestyle": "--", "label": "Regresyon Eğilimi"})
 
 # SCATTER PLOT (Nokta Dağılımı)
-sns.scatterplot(
-    data=df, x='Ekonomik_Rahatlik', y='Suc', 
-    hue='Bolge', size='Nufus', sizes=(100, 1000), 
-    alpha=0.7, palette='deep' 
+# Satır sayısı yoğunluk eşiğini aşarsa noktalar kutulanıp tek görüntü olarak çizilir
+dagilim_ciz(
+    df, 'Ekonomik_Rahatlik', 'Suc', boyut='Nufus', renk='Bolge',
+    sizes=(100, 1000), alpha=0.7, palette='deep'
 )
 
 # Ortalama Eksen Çizgileri
@@ -80,12 +77,10 @@ renk_paleti = {
     'Gelişime Açık (PASİF)': 'navy'
 }
 
-for il in critical_cities:
-    if il in df['Il'].values:
-        row = df[df['Il'] == il].iloc[0]
-        plt.annotate(il, (row['Ekonomik_Rahatlik'], row['Suc']), 
-                     textcoords="offset points", xytext=(5, 5), ha='left', 
-                     fontsize=10, color=renk_paleti.get(row['Bolge'], 'black'), weight='bold')
+kritik = df[df['Il'].isin(critical_cities)]
+etiketle(plt.gca(), kritik['Ekonomik_Rahatlik'], kritik['Suc'], kritik['Il'], oncelik=kritik['Nufus'],
+         konumlar=('sag_ust', 'sag', 'sol_ust', 'sol', 'sag_alt', 'sol_alt'), fontsize=10, fontweight='bold',
+         renkler=[renk_paleti.get(b, 'black') for b in kritik['Bolge']])
 
 plt.title('Ekonomik Rahatlık ve Suç İlişkisi: Regresyon ve Hipotez Analizi', fontsize=16)
 plt.xlabel('Ekonomik Rahatlık Skoru', fontsize=12)
@@ -101,4 +96,4 @@ print(f"Hipotez Testi P-Değeri: {p_val:.4f}")
 print(f"Karar: İlişki istatistiksel olarak {durum}.")
 print("-" * 40)
 
-plt.show()
\ No newline at end of file
+goster('issizlik_egitim_suc')
\ No newline at end of file
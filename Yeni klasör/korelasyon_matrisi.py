@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+from istatistik_cekirdek import t_p_degerleri
+from profil import profillenir
+from veri_yukleyici import SEMA
+
+# ---------------------------------------------------------
+# TÜM ÇİFTLER İÇİN KORELASYON VE BASİT REGRESYON MATRİSİ
+# ---------------------------------------------------------
+# df.corr() p-değeri vermiyor; pearsonr'ı her çift için ayrı çağırmak ise
+# k² Python çağrısı demek. Burada bütün çiftler standartlaştırılmış veri
+# matrisinin birkaç matris çarpımıyla hesaplanır. NaN içeren satırlar
+# tamamen atılmaz: her çift, iki sütunun da dolu olduğu satırları kullanır
+# (pairwise-complete). Bunun için M (dolu maskesi) ve NaN'ları 0 yapılmış
+# Z matrisiyle çift bazlı toplamlar alınır:
+#   n   = MᵀM          Σx  = ZᵀM        Σx² = (Z²)ᵀM        Σxy = ZᵀZ
+
+
+@profillenir()
+def korelasyon_matrisi(df, sutunlar=None):
+    """
+    Seçilen (varsayılan: kimlik olmayan bütün sayısal) sütunların bütün çiftleri için
+    r, p, n, eğim ve kesişim matrislerini döndürür.
+
+    egim.loc[a, b] ve kesisim.loc[a, b]: b = kesisim + egim * a
+    (satır bağımsız, sütun bağımlı değişken).
+    Dönüş: {'r', 'p', 'n', 'egim', 'kesisim'} -> DataFrame
+    """
+    if sutunlar is None:
+        sutunlar = [c for c in df.select_dtypes(include='number').columns if SEMA.get(c) != 'kimlik']
+    X = df[sutunlar].to_numpy(dtype=float)
+
+    # Sütun bazında standartlaştırma (koşullanmayı iyileştirir)
+    ort = np.nanmean(X, axis=0)
+    ss = np.nanstd(X, axis=0)
+    ss[~(ss > 0)] = 1.0
+    Z = (X - ort) / ss
+
+    M = ~np.isnan(Z)
+    Z = np.where(M, Z, 0.0)
+    Mf = M.astype(float)
+
+    n = Mf.T @ Mf
+    sx = Z.T @ Mf           # sx[i, j]: i sütununun, i ve j'nin dolu olduğu satırlardaki toplamı
+    sxx = (Z * Z).T @ Mf
+    sxy = Z.T @ Z
+    sy, syy = sx.T, sxx.T
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cxx = sxx - sx * sx / n
+        cyy = syy - sy * sy / n
+        cxy = sxy - sx * sy / n
+        r = np.clip(cxy / np.sqrt(cxx * cyy), -1.0, 1.0)
+        sd = n - 2
+        t = r * np.sqrt(sd / (1 - r * r))
+
+        # Standart birimlerdeki eğim/kesişimi orijinal birimlere çevir
+        b_std = cxy / cxx
+        a_std = sy / n - b_std * sx / n
+        oran = ss[None, :] / ss[:, None]
+        egim = b_std * oran
+        kesisim = ort[None, :] + ss[None, :] * a_std - egim * ort[:, None]
+
+    p = t_p_degerleri(t, sd)
+    np.fill_diagonal(p, 0.0)
+    yetersiz = n < 3
+    for dizi in (r, p, egim, kesisim):
+        dizi[yetersiz] = np.nan
+
+    cerceve = lambda a: pd.DataFrame(a, index=sutunlar, columns=sutunlar)
+    return {'r': cerceve(r), 'p': cerceve(p), 'n': cerceve(n.astype(int)),
+            'egim': cerceve(egim), 'kesisim': cerceve(kesisim)}
+
+
+if __name__ == '__main__':
+    from veri_yukleyici import veri_yukle
+    from turetilmis_sutunlar import tumunu_turet
+
+    try:
+        df = tumunu_turet(veri_yukle('message.txt'))
+    except FileNotFoundError:
+        print("HATA: message.txt dosyası bulunamadı.")
+        exit()
+
+    sonuc = korelasyon_matrisi(df)
+    pd.set_option('display.width', 250)
+    print("\n" + "="*65)
+    print("          TÜM ÇİFTLER KORELASYON MATRİSİ (r)")
+    print("="*65)
+    print(sonuc['r'].round(2).to_string())
+    print("\n" + "="*65)
+    print("          P-DEĞERİ MATRİSİ (H0: r = 0)")
+    print("="*65)
+    print(sonuc['p'].map(lambda v: f"{v:.3f}").to_string())
+
+    # Anlamlı çiftleri güçten zayıfa sırala (üst üçgen)
+    ust = np.triu(np.ones(sonuc['r'].shape, dtype=bool), k=1)
+    ciftler = sonuc['r'].where(ust).stack().dropna().to_frame('r')
+    ciftler['p'] = sonuc['p'].where(ust).stack().dropna()
+    anlamli = ciftler[ciftler['p'] < 0.05]
+    anlamli = anlamli.loc[anlamli['r'].abs().sort_values(ascending=False).index]
+    print("\n" + "-"*65)
+    print(f"Anlamlı çift sayısı (p < 0.05): {len(anlamli)} / {len(ciftler)}")
+    print(anlamli.head(15).to_string(float_format=lambda v: f"{v:.4f}"))
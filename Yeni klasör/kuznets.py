@@ -0,0 +1,158 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from istatistik_cekirdek import f_p_degeri, t_p_degerleri
+from profil import profillenir
+from sonuc_onbellegi import onbellekli
+
+# ---------------------------------------------------------
+# ÇEVRESEL KUZNETS EĞRİSİ (POLİNOM UYDURMA + DÖNÜM NOKTASI)
+# ---------------------------------------------------------
+# Emisyon = b0 + b1 x + b2 x² (+ b3 x³), x = GSYH (ya da log modelde
+# ln GSYH ve ln Emisyon). Ters U için b2 < 0 beklenir; dönüm noktası
+# türevin sıfır olduğu ve ikinci türevin negatif olduğu x değeridir.
+# Güven aralığı için satırlar yerine koymalı yeniden örneklenir ve bütün
+# örneklemler (B x p x p) boyutlu normal denklemler olarak tek bir toplu
+# np.linalg.solve çağrısıyla çözülür; Python döngüsünde yeniden uydurma yok.
+# Parti boyutu bellek bütçesinden türetilir: örneklem başına indeks, Ub ve
+# yb için ~8n(p+2) bayt ayrılır.
+
+PARTI_BELLEGI = 64 * 2**20     # parti başına ara dizilere ayrılan bayt
+
+
+def _tasarim(x, derece):
+    return np.stack([x ** k for k in range(derece + 1)], axis=-1)
+
+
+def _donum_noktalari(b, alt, ust):
+    """
+    Katsayı satırlarından (B x p) [alt, ust] aralığındaki yerel maksimum
+    (dönüm noktası); yoksa NaN. Kuadratik ve kübik için kapalı form.
+    """
+    b = np.atleast_2d(b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if b.shape[1] == 3:
+            # b1 + 2 b2 x = 0, maksimum için b2 < 0
+            x = -b[:, 1] / (2 * b[:, 2])
+            gecerli = b[:, 2] < 0
+        else:
+            # b1 + 2 b2 x + 3 b3 x² = 0; maksimumda 2 b2 + 6 b3 x < 0
+            a, bb, c = 3 * b[:, 3], 2 * b[:, 2], b[:, 1]
+            kok = np.sqrt(bb * bb - 4 * a * c)
+            adaylar = np.stack([(-bb - kok) / (2 * a), (-bb + kok) / (2 * a)], axis=1)
+            maksimum = 2 * b[:, 2, None] + 6 * b[:, 3, None] * adaylar < 0
+            adaylar = np.where(maksimum & (adaylar >= alt) & (adaylar <= ust), adaylar, np.nan)
+            # Kübiğin en fazla bir yerel maksimumu var; fmin NaN'ları yok sayar
+            x = np.fmin(adaylar[:, 0], adaylar[:, 1])
+            gecerli = np.isfinite(x)
+    return np.where(gecerli & (x >= alt) & (x <= ust), x, np.nan)
+
+
+@profillenir()
+@onbellekli()
+def kuznets_uydur(gsyh, emisyon, derece=2, log=False, bootstrap=2000, guven=0.95, tohum=42,
+                  parti_boyutu=None):
+    """
+    Kuadratik (derece=2) veya kübik (derece=3) Kuznets eğrisi.
+    Dönüş sözlüğü:
+      'katsayilar' -> DataFrame (katsayi, se, t, p), 'r2', 'r2_duz', 'f_p',
+      'donum' (GSYH biriminde, veri aralığında değilse NaN),
+      'donum_alt', 'donum_ust' (bootstrap yüzdelik GA),
+      'donum_orani' (dönüm noktası bulunan bootstrap örneklemlerinin oranı)
+    """
+    if derece not in (2, 3):
+        raise ValueError("derece 2 veya 3 olmalı")
+    x = np.asarray(gsyh, dtype=float)
+    y = np.asarray(emisyon, dtype=float)
+    gecerli = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[gecerli], y[gecerli]
+    if log:
+        if (x <= 0).any() or (y <= 0).any():
+            raise ValueError("Log model için değerler pozitif olmalı")
+        x, y = np.log(x), np.log(y)
+    n, p = x.size, derece + 1
+    sd = n - p
+    if sd <= 0:
+        raise ValueError(f"Gözlem sayısı yetersiz (n={n}, derece={derece})")
+
+    # Koşullanma için x ölçeklenir; katsayılar sonra orijinal birime çevrilir
+    ort, olcek = x.mean(), x.std() or 1.0
+    u = (x - ort) / olcek
+    U = _tasarim(u, derece)
+    UtU_ters = np.linalg.inv(U.T @ U)
+    bu = UtU_ters @ (U.T @ y)
+    artik = y - U @ bu
+    sse = float(artik @ artik)
+    sigma2 = sse / sd
+
+    # u = (x - ort) / olcek dönüşümünün katsayılara etkisi: b = D bu
+    D = np.zeros((p, p))
+    for j in range(p):
+        # u^j = Σ_k C(j,k) x^k (-ort)^(j-k) / olcek^j
+        for k in range(j + 1):
+            D[k, j] = math.comb(j, k) * (-ort) ** (j - k) / olcek ** j
+    b = D @ bu
+    cov = sigma2 * D @ UtU_ters @ D.T
+    se = np.sqrt(np.diag(cov))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = b / se
+    syy = float(((y - y.mean()) ** 2).sum())
+    r2 = 1 - sse / syy
+    f = ((syy - sse) / derece) / sigma2 if sigma2 > 0 else math.inf
+
+    alt, ust = x.min(), x.max()
+    donum_u = _donum_noktalari(bu[None, :], (alt - ort) / olcek, (ust - ort) / olcek)[0]
+
+    # Toplu bootstrap: her parti (B x n) indeks, (B x p x p) normal denklemler
+    rng = np.random.default_rng(tohum)
+    if parti_boyutu is None:
+        parti_boyutu = max(1, PARTI_BELLEGI // (8 * n * (p + 2)))
+    donumler = []
+    kalan = bootstrap
+    while kalan > 0:
+        adet = min(kalan, parti_boyutu)
+        idx = rng.integers(0, n, size=(adet, n))
+        Ub, yb = U[idx], y[idx]
+        UtU = np.einsum('bni,bnj->bij', Ub, Ub)
+        Uty = np.einsum('bni,bn->bi', Ub, yb)
+        # Tekil örneklemler (ör. hep aynı satır) NaN olarak atlanır
+        tekil = np.abs(np.linalg.det(UtU)) < 1e-10
+        UtU[tekil] = np.eye(p)
+        bb = np.linalg.solve(UtU, Uty[..., None])[..., 0]
+        bb[tekil] = np.nan
+        donumler.append(_donum_noktalari(bb, (alt - ort) / olcek, (ust - ort) / olcek))
+        kalan -= adet
+    donumler = np.concatenate(donumler) if donumler else np.empty(0)
+    bulunan = donumler[np.isfinite(donumler)]
+
+    geri = lambda v: float(np.exp(v * olcek + ort) if log else v * olcek + ort)
+    a = (1 - guven) / 2
+    if bulunan.size:
+        q_alt, q_ust = np.quantile(bulunan, [a, 1 - a])
+        donum_alt, donum_ust = geri(q_alt), geri(q_ust)
+    else:
+        donum_alt = donum_ust = math.nan
+
+    adlar = [f'b{k}' for k in range(p)]
+    return {
+        'derece': derece, 'log': log, 'n': n,
+        'katsayilar': pd.DataFrame({'katsayi': b, 'se': se, 't': t, 'p': t_p_degerleri(t, sd)},
+                                   index=pd.Index(adlar, name='terim')),
+        'r2': float(r2), 'r2_duz': float(1 - (1 - r2) * (n - 1) / sd),
+        'f_p': f_p_degeri(float(f), derece, sd),
+        'donum': geri(donum_u) if np.isfinite(donum_u) else math.nan,
+        'donum_alt': donum_alt, 'donum_ust': donum_ust,
+        'donum_orani': float(bulunan.size / bootstrap) if bootstrap else math.nan,
+        'guven': guven,
+    }
+
+
+def kuznets_tahmin(sonuc, gsyh):
+    """Uydurulan eğrinin GSYH değerlerindeki tahmini (log modelde emisyon birimine geri döner)."""
+    x = np.asarray(gsyh, dtype=float)
+    if sonuc['log']:
+        x = np.log(x)
+    tahmin = _tasarim(x, sonuc['derece']) @ sonuc['katsayilar']['katsayi'].to_numpy()
+    return np.exp(tahmin) if sonuc['log'] else tahmin
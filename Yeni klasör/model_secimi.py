@@ -0,0 +1,234 @@
+import itertools
+import math
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from istatistik_cekirdek import f_p_degeri, t_p_degerleri
+from profil import profillenir
+from sonuc_onbellegi import onbellekli
+
+# ---------------------------------------------------------
+# GRAM MATRİSİNDEN MODEL SEÇİMİ (EN İYİ ALT KÜME / ADIMSAL)
+# ---------------------------------------------------------
+# Her aday model için LinearRegression'ı yeniden eğitmek yerine merkezlenmiş
+# ve ölçeklenmiş Gram matrisi XᵀX ile Xᵀy bir kez hesaplanır. Herhangi bir
+# değişken alt kümesi S için:
+#     b_S = C[S,S]⁻¹ c[S]       SSE = syy - b_Sᵀ c[S]
+#     Var(b_S) = σ² C[S,S]⁻¹    σ² = SSE / (n - |S| - 1)
+# Böylece veri bir daha taranmaz; yalnızca |S| x |S| boyutlu sistemler
+# çözülür. Aynı boyuttaki bütün alt kümeler tek bir toplu np.linalg.solve
+# çağrısıyla çözülür.
+#   AIC = n ln(SSE/n) + 2(|S|+1)        BIC = n ln(SSE/n) + ln(n)(|S|+1)
+
+
+class Gram(NamedTuple):
+    ozellikler: list
+    hedef: str
+    n: int
+    ort_x: np.ndarray
+    ort_y: float
+    olcek: np.ndarray    # özelliklerin standart sapması (ddof=0), koşullanma için
+    C: np.ndarray        # ölçeklenmiş merkezlenmiş XᵀX
+    c: np.ndarray        # ölçeklenmiş merkezlenmiş Xᵀy
+    syy: float
+
+
+class ModelSonucu(NamedTuple):
+    degiskenler: list
+    katsayilar: np.ndarray   # orijinal birimlerde
+    se: np.ndarray
+    t: np.ndarray
+    p: np.ndarray
+    kesisim: float
+    kesisim_se: float
+    n: int
+    r2: float
+    r2_duz: float            # düzeltilmiş R²
+    f: float
+    f_p: float               # model geneli F-testi p-değeri
+    aic: float
+    bic: float
+
+    def tablo(self):
+        return pd.DataFrame({'katsayi': self.katsayilar, 'se': self.se, 't': self.t, 'p': self.p},
+                            index=pd.Index(self.degiskenler, name='degisken'))
+
+
+def gram_hazirla(df, ozellikler, hedef):
+    """Özellik ya da hedefi NaN olan satırları atıp Gram matrisini bir kez hesaplar."""
+    veri = df[list(ozellikler) + [hedef]].dropna()
+    X = veri[list(ozellikler)].to_numpy(dtype=float)
+    y = veri[hedef].to_numpy(dtype=float)
+    ort_x, ort_y = X.mean(axis=0), y.mean()
+    olcek = X.std(axis=0)
+    olcek[~(olcek > 0)] = 1.0
+    Z = (X - ort_x) / olcek
+    dy = y - ort_y
+    return Gram(list(ozellikler), hedef, len(y), ort_x, float(ort_y), olcek,
+                Z.T @ Z, Z.T @ dy, float(dy @ dy))
+
+
+def _bilgi_olcutleri(gram, sse, k):
+    n = gram.n
+    r2 = 1 - sse / gram.syy
+    r2_duz = 1 - (1 - r2) * (n - 1) / (n - k - 1)
+    with np.errstate(divide='ignore'):
+        log_l = n * np.log(np.maximum(sse, 1e-300) / n)
+    return r2, r2_duz, log_l + 2 * (k + 1), log_l + math.log(n) * (k + 1)
+
+
+def model_kur(gram, degiskenler):
+    """Seçilen değişkenler için katsayı, SE, t, p, R², F ve AIC/BIC."""
+    idx = [gram.ozellikler.index(d) for d in degiskenler]
+    k, n = len(idx), gram.n
+    sd = n - k - 1
+    if sd <= 0:
+        raise ValueError(f"Serbestlik derecesi yetersiz (n={n}, değişken={k})")
+
+    if k:
+        A_ters = np.linalg.pinv(gram.C[np.ix_(idx, idx)])
+        b_std = A_ters @ gram.c[idx]
+        sse = max(gram.syy - float(b_std @ gram.c[idx]), 0.0)
+    else:
+        A_ters, b_std, sse = np.zeros((0, 0)), np.zeros(0), gram.syy
+    sigma2 = sse / sd
+
+    olcek = gram.olcek[idx]
+    ort = gram.ort_x[idx]
+    katsayilar = b_std / olcek
+    cov = sigma2 * A_ters / np.outer(olcek, olcek)
+    se = np.sqrt(np.diag(cov))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = katsayilar / se
+    kesisim = gram.ort_y - float(katsayilar @ ort)
+    kesisim_se = math.sqrt(sigma2 / n + float(ort @ cov @ ort))
+
+    r2, r2_duz, aic, bic = _bilgi_olcutleri(gram, sse, k)
+    f = (r2 / k) / ((1 - r2) / sd) if k and r2 < 1 else (math.inf if k else math.nan)
+    return ModelSonucu(list(degiskenler), katsayilar, se, t, t_p_degerleri(t, sd),
+                       kesisim, kesisim_se, n, float(r2), float(r2_duz),
+                       float(f), f_p_degeri(float(f), k, sd), float(aic), float(bic))
+
+
+def _toplu_sse(gram, kombinasyonlar):
+    """Aynı boyuttaki alt kümelerin SSE değerleri (tek toplu çözüm)."""
+    idx = np.asarray(kombinasyonlar)
+    A = gram.C[idx[:, :, None], idx[:, None, :]]
+    b = gram.c[idx]
+    try:
+        cozum = np.linalg.solve(A, b[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        # Tekil (eş doğrusal) alt küme varsa tek tek en küçük kareler
+        cozum = np.stack([np.linalg.lstsq(a, v, rcond=None)[0] for a, v in zip(A, b)])
+    return np.maximum(gram.syy - (cozum * b).sum(axis=1), 0.0)
+
+
+@profillenir()
+@onbellekli(yoksay=('parca_boyutu',))
+def tum_altkumeler(gram, en_fazla=None, parca_boyutu=50_000):
+    """
+    Bütün alt kümeleri (en_fazla değişkene kadar) R², düzeltilmiş R², AIC ve
+    BIC ile değerlendirir. 30+ değişkende 2^k alt küme yerine en_fazla ile
+    sınırlandırılmalıdır. BIC'e göre sıralı DataFrame döner.
+    """
+    p = len(gram.ozellikler)
+    en_fazla = p if en_fazla is None else min(en_fazla, p, gram.n - 2)
+    satirlar = []
+    for k in range(1, en_fazla + 1):
+        kombinasyonlar = itertools.combinations(range(p), k)
+        while True:
+            parca = list(itertools.islice(kombinasyonlar, parca_boyutu))
+            if not parca:
+                break
+            sse = _toplu_sse(gram, parca)
+            r2, r2_duz, aic, bic = _bilgi_olcutleri(gram, sse, k)
+            satirlar.append(pd.DataFrame({
+                'degiskenler': [tuple(gram.ozellikler[i] for i in s) for s in parca],
+                'k': k, 'r2': r2, 'r2_duz': r2_duz, 'aic': aic, 'bic': bic,
+            }))
+    return pd.concat(satirlar, ignore_index=True).sort_values('bic', ignore_index=True)
+
+
+def adimsal_secim(gram, yon='ileri', olcut='bic'):
+    """
+    İleri (boş modelden) veya geri (tam modelden) adımsal seçim. Her adımda
+    ölçütü ('aic', 'bic' veya 'r2_duz') en çok iyileştiren değişken eklenir ya
+    da çıkarılır; iyileşme kalmayınca durur. Dönüş: (ModelSonucu, adım listesi)
+    """
+    if olcut not in ('aic', 'bic', 'r2_duz'):
+        raise ValueError(f"Bilinmeyen ölçüt: {olcut}")
+    isaret = -1 if olcut == 'r2_duz' else 1   # küçük olan iyi olacak şekilde
+    tumu = list(range(len(gram.ozellikler)))
+    secili = [] if yon == 'ileri' else list(tumu)
+    sira = {'aic': 2, 'bic': 3, 'r2_duz': 1}[olcut]
+
+    def degerler(kumeler):
+        # Adaylar aynı boyutta: tek toplu çözüm
+        k = len(kumeler[0])
+        if gram.n - k - 1 <= 0:
+            return np.full(len(kumeler), np.inf)
+        sse = _toplu_sse(gram, kumeler) if k else np.full(len(kumeler), gram.syy)
+        return isaret * _bilgi_olcutleri(gram, sse, k)[sira]
+
+    mevcut = degerler([secili])[0]
+    adimlar = []
+    while True:
+        if yon == 'ileri':
+            adaylar = [(secili + [j], '+', j) for j in tumu if j not in secili]
+        else:
+            adaylar = [([i for i in secili if i != j], '-', j) for j in secili]
+        if not adaylar:
+            break
+        puanlar = degerler([kume for kume, _, _ in adaylar])
+        en_iyi = int(np.argmin(puanlar))
+        if not puanlar[en_iyi] < mevcut:
+            break
+        secili, islem, j = adaylar[en_iyi]
+        mevcut = puanlar[en_iyi]
+        adimlar.append((islem + gram.ozellikler[j], float(isaret * mevcut)))
+    return model_kur(gram, [gram.ozellikler[i] for i in sorted(secili)]), adimlar
+
+
+if __name__ == '__main__':
+    import argparse
+    from veri_yukleyici import veri_yukle
+    from turetilmis_sutunlar import TURETILMIS, turet
+
+    parser = argparse.ArgumentParser(description="Gram matrisinden en iyi alt küme / adımsal regresyon.")
+    parser.add_argument('hedef', help="Bağımlı değişken, ör. Gelir")
+    parser.add_argument('ozellikler', nargs='*', help="Aday değişkenler (varsayılan: bütün sayısal sütunlar)")
+    parser.add_argument('--en-fazla', type=int, default=None, help="Alt kümedeki en fazla değişken")
+    parser.add_argument('--adimsal', choices=['ileri', 'geri'], default=None)
+    parser.add_argument('--olcut', choices=['aic', 'bic', 'r2_duz'], default='bic')
+    parser.add_argument('--veri', default='message.txt')
+    args = parser.parse_args()
+
+    try:
+        df = veri_yukle(args.veri)
+    except FileNotFoundError:
+        print(f"HATA: {args.veri} dosyası bulunamadı.")
+        exit()
+    df = turet(df, [c for c in [args.hedef] + args.ozellikler if c in TURETILMIS])
+    ozellikler = args.ozellikler or [c for c in df.select_dtypes(include='number').columns
+                                     if c not in (args.hedef, 'ID')]
+    gram = gram_hazirla(df, ozellikler, args.hedef)
+
+    print("\n" + "="*65)
+    print(f"      MODEL SEÇİMİ: {args.hedef} ~ {len(ozellikler)} aday (n={gram.n})")
+    print("="*65)
+    if args.adimsal:
+        model, adimlar = adimsal_secim(gram, args.adimsal, args.olcut)
+        for islem, deger in adimlar:
+            print(f"  {islem:<20} {args.olcut} = {deger:.3f}")
+    else:
+        tablo = tum_altkumeler(gram, args.en_fazla)
+        model = model_kur(gram, list(tablo['degiskenler'].iloc[0]))
+        tablo['degiskenler'] = tablo['degiskenler'].map(', '.join)
+        print(tablo.head(10).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+    print("-"*65)
+    print(f"Seçilen model: R² = {model.r2:.3f} | Düz. R² = {model.r2_duz:.3f} | "
+          f"F = {model.f:.2f} (p = {model.f_p:.4f})")
+    print(model.tablo().to_string(float_format=lambda v: f"{v:.4f}"))
+    print("="*65)
@@ -0,0 +1,343 @@
+import argparse
+import errno
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from veri_yukleyici import KIMLIK_ONEKI, SEMA, ham_oku, sema_dizisi, semaya_cevir
+
+# ---------------------------------------------------------
+# ÇOK YILLI PANEL DEPOSU (BELLEĞE EŞLENMİŞ DİZİLER)
+# ---------------------------------------------------------
+# message.txt tek bir yılın il tablosu; su_verisi.csv ve emisyon_gsyh.csv
+# ise ulusal yıllık seriler. Depo bunları tek bir klasörde, sabit
+# genişlikli ikili dizilerde tutar:
+#   il.npy      (gösterge, yıl, il)   float64, eksik hücre NaN
+#   ulusal.npy  (gösterge, yıl)       float64, iki dizi aynı yıl eksenini paylaşır
+#   meta.json   eksen etiketleri (göstergeler, yıllar, iller, ID'ler), il
+#               tablosu bulunan yıllar ve ulusal serilerin hangi CSV'den
+#               hangi sütun adlarıyla geldiği
+# Diziler np.load(mmap_mode='r') ile açılır: yalnızca dokunulan sayfalar
+# diskten okunur. Bir göstergenin ardışık yıl aralığı bellekte bitişik
+# olduğundan dilim('Kira', (2010, 2024)) ayrıştırma da kopya da yapmaz;
+# yalnızca il listesiyle seçim yapılırsa seçilen sütunlar kopyalanır.
+#
+# Scriptler depoyu veri_yukleyici üzerinden okur:
+#   ANALIZ_PANEL=panel            -> veri_yukle('message.txt') ve
+#                                    seri_yukle('su_verisi.csv' ...) depodan gelir
+#   ANALIZ_PANEL_YILI=2023        -> il tablosunun yılı (varsayılan: son yıl)
+#
+# Kullanım: python panel_deposu.py olustur --il 2024=message.txt --cikti panel
+#           python panel_deposu.py dilim panel Kira --yillar 2010-2024 --iller Ankara İzmir
+
+DEPO_SURUMU = 2
+META_ADI = 'meta.json'
+IL_DIZISI = 'il.npy'
+ULUSAL_DIZISI = 'ulusal.npy'
+
+# Varsayılan ulusal seriler: dosya adı -> yıl sütunu
+ULUSAL_KAYNAKLAR = {'su_verisi.csv': 'Yıl', 'emisyon_gsyh.csv': 'Yil'}
+
+
+def depo_mu(yol):
+    """yol bir panel deposu klasörü mü?"""
+    return os.path.isfile(os.path.join(yol, META_ADI))
+
+
+def _kimlik_metni(deger):
+    # Şema ID'yi tamsayıya çözer; depoda message.txt'deki metin hali tutulur
+    if pd.isna(deger):
+        return None
+    return f"{KIMLIK_ONEKI}{int(deger)}" if isinstance(deger, (int, np.integer)) else str(deger)
+
+
+def depo_yaz(dizin, il_tablolari, ulusal=None, gostergeler=None, iller=None):
+    """
+    Depoyu (yeniden) yazar.
+
+    il_tablolari: {yıl: veri_yukle biçiminde il tablosu (Il, ID + göstergeler)}
+    ulusal: {kaynak dosya adı: (yıl sütunu, DataFrame)} ulusal yıllık seriler
+    gostergeler, iller: var olan depodaki sıra (bkz. depoyu_oku). Verilenler
+    önce, tablolarda yeni görülen göstergeler ve iller ilk görülme sırasıyla
+    sona eklenir; böylece eski bir yıl eklemek tablo() sütun sırasını bozmaz.
+    Yarım depo okunmasın diye geçici klasöre yazılıp yer değiştirilir.
+    """
+    ulusal = ulusal or {}
+    gostergeler, iller = list(gostergeler or []), list(iller or [])
+    kimlikler = dict.fromkeys(iller)
+    for yil in sorted(il_tablolari):
+        df = il_tablolari[yil]
+        for il, kimlik in zip(df['Il'].astype(str), df['ID'] if 'ID' in df.columns else [None] * len(df)):
+            if il not in kimlikler:
+                iller.append(il)
+            kimlikler[il] = _kimlik_metni(kimlik)
+        gostergeler += [c for c in df.select_dtypes(include='number').columns
+                        if c != 'ID' and c not in gostergeler]
+
+    ulusal_gostergeler, kaynaklar = [], {}
+    for dosya, (yil_sutunu, df) in ulusal.items():
+        sutunlar = [c for c in df.columns if c != yil_sutunu]
+        cakisan = set(sutunlar) & set(ulusal_gostergeler)
+        if cakisan:
+            raise ValueError(f"Ulusal seriler aynı sütun adını paylaşıyor: {', '.join(sorted(cakisan))}")
+        kaynaklar[dosya] = {'yil': yil_sutunu, 'sutunlar': sutunlar}
+        ulusal_gostergeler += sutunlar
+
+    yillar = sorted({int(y) for y in il_tablolari} |
+                    {int(y) for yil_sutunu, df in ulusal.values() for y in df[yil_sutunu].dropna()})
+    yil_sira = {y: k for k, y in enumerate(yillar)}
+    il_sira = {il: k for k, il in enumerate(iller)}
+
+    gecici = dizin.rstrip(os.sep) + '.yaziliyor'
+    shutil.rmtree(gecici, ignore_errors=True)
+    os.makedirs(gecici)
+    il_dizisi = np.lib.format.open_memmap(os.path.join(gecici, IL_DIZISI), mode='w+', dtype=np.float64,
+                                          shape=(len(gostergeler), len(yillar), len(iller)))
+    il_dizisi[:] = np.nan
+    for yil, df in il_tablolari.items():
+        sutun = np.array([il_sira[il] for il in df['Il'].astype(str)])
+        for g, ad in enumerate(gostergeler):
+            if ad in df.columns:
+                il_dizisi[g, yil_sira[int(yil)], sutun] = df[ad].to_numpy(dtype=float, na_value=np.nan)
+    il_dizisi.flush()
+    del il_dizisi
+
+    ulusal_dizisi = np.lib.format.open_memmap(os.path.join(gecici, ULUSAL_DIZISI), mode='w+', dtype=np.float64,
+                                              shape=(len(ulusal_gostergeler), len(yillar)))
+    ulusal_dizisi[:] = np.nan
+    for yil_sutunu, df in ulusal.values():
+        satir = np.array([yil_sira[int(y)] for y in df[yil_sutunu]], dtype=int)
+        for ad in df.columns:
+            if ad != yil_sutunu:
+                ulusal_dizisi[ulusal_gostergeler.index(ad), satir] = pd.to_numeric(df[ad], errors='coerce')
+    ulusal_dizisi.flush()
+    del ulusal_dizisi
+
+    meta = {'surum': DEPO_SURUMU, 'gostergeler': gostergeler, 'yillar': yillar, 'iller': iller,
+            'kimlikler': [kimlikler[il] for il in iller], 'il_yillari': sorted(int(y) for y in il_tablolari),
+            'ulusal': {'gostergeler': ulusal_gostergeler, 'kaynaklar': kaynaklar}}
+    with open(os.path.join(gecici, META_ADI), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+
+    eski = dizin.rstrip(os.sep) + '.eski'
+    shutil.rmtree(eski, ignore_errors=True)
+    if os.path.exists(dizin):
+        os.replace(dizin, eski)
+    os.replace(gecici, dizin)
+    shutil.rmtree(eski, ignore_errors=True)
+    return dizin
+
+
+class PanelDeposu:
+    """Salt okunur depo; diziler ilk erişimde belleğe eşlenir."""
+
+    def __init__(self, dizin):
+        if not depo_mu(dizin):
+            raise FileNotFoundError(errno.ENOENT, "Panel deposu bulunamadı", dizin)
+        self.dizin = dizin
+        with open(os.path.join(dizin, META_ADI), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('surum') != DEPO_SURUMU:
+            raise ValueError(f"Desteklenmeyen panel deposu sürümü: {self.meta.get('surum')}")
+        self.gostergeler = self.meta['gostergeler']
+        self.yillar = np.array(self.meta['yillar'], dtype=int)
+        self.iller = self.meta['iller']
+        self.il_yillari = self.meta['il_yillari']
+        self.ulusal_gostergeler = self.meta['ulusal']['gostergeler']
+        self._il_sira = {il: k for k, il in enumerate(self.iller)}
+        self._il = self._ulusal = None
+
+    @property
+    def il_dizisi(self):
+        """(gösterge, yıl, il) dizisi (salt okunur, belleğe eşlenmiş)."""
+        if self._il is None:
+            self._il = np.load(os.path.join(self.dizin, IL_DIZISI), mmap_mode='r')
+        return self._il
+
+    @property
+    def ulusal_dizisi(self):
+        """(gösterge, yıl) dizisi (salt okunur, belleğe eşlenmiş)."""
+        if self._ulusal is None:
+            self._ulusal = np.load(os.path.join(self.dizin, ULUSAL_DIZISI), mmap_mode='r')
+        return self._ulusal
+
+    def _gosterge(self, ad, liste):
+        try:
+            return liste.index(ad)
+        except ValueError:
+            raise KeyError(f"Depoda olmayan gösterge: {ad}") from None
+
+    def _yil_araligi(self, yillar):
+        """None, tek yıl ya da (bas, bit) kapalı aralığı -> yıl ekseninde dilim."""
+        if yillar is None:
+            return slice(None)
+        bas, bit = (yillar, yillar) if np.isscalar(yillar) else yillar
+        return slice(int(np.searchsorted(self.yillar, bas, side='left')),
+                     int(np.searchsorted(self.yillar, bit, side='right')))
+
+    def _il_konumlari(self, iller):
+        try:
+            return [self._il_sira[il] for il in iller]
+        except KeyError as e:
+            raise KeyError(f"Depoda olmayan il: {e.args[0]}") from None
+
+    def dilim(self, gosterge, yillar=None, iller=None):
+        """
+        Bir il göstergesinin (yıl x il) dizisi. yillar: tek yıl ya da (bas, bit)
+        kapalı aralık; iller verilmezse bütün iller ve dönüş belleğe eşlenmiş
+        dizinin bir görünümüdür (kopya yok).
+        """
+        blok = self.il_dizisi[self._gosterge(gosterge, self.gostergeler), self._yil_araligi(yillar)]
+        return blok if iller is None else blok[:, self._il_konumlari(iller)]
+
+    def cerceve(self, gosterge, yillar=None, iller=None):
+        """dilim() sonucunu yıl indeksli, il sütunlu DataFrame olarak sarar."""
+        yil_dilimi = self._yil_araligi(yillar)
+        return pd.DataFrame(self.dilim(gosterge, yillar, iller), index=pd.Index(self.yillar[yil_dilimi], name='Yil'),
+                            columns=self.iller if iller is None else list(iller), copy=False)
+
+    def seri(self, gosterge, il=None, yillar=None):
+        """Yıl indeksli seri: ulusal gösterge ya da verilen ilin göstergesi."""
+        yil_dilimi = self._yil_araligi(yillar)
+        if il is None:
+            degerler = self.ulusal_dizisi[self._gosterge(gosterge, self.ulusal_gostergeler), yil_dilimi]
+        else:
+            degerler = self.dilim(gosterge, yillar)[:, self._il_konumlari([il])[0]]
+        return pd.Series(degerler, index=pd.Index(self.yillar[yil_dilimi], name='Yil'), name=gosterge)
+
+    def son_yil(self):
+        """İl tablosu bulunan en son yıl."""
+        if not self.il_yillari:
+            raise ValueError("Depoda il verisi yok")
+        return self.il_yillari[-1]
+
+    def tablo(self, yil=None, gostergeler=None):
+        """
+        Bir yılın il tablosu, veri_yukle ile aynı biçimde (ID, Il + göstergeler,
+        SEMA tipleri). O yıl hiç verisi olmayan iller çıkarılır.
+        """
+        yil = self.son_yil() if yil is None else int(yil)
+        if yil not in self.il_yillari:
+            raise KeyError(f"Depoda il tablosu olmayan yıl: {yil}")
+        gostergeler = self.gostergeler if gostergeler is None else list(gostergeler)
+        k = self._yil_araligi(yil).start
+        blok = self.il_dizisi[[self._gosterge(g, self.gostergeler) for g in gostergeler], k]   # gösterge x il
+        var = ~np.isnan(blok).all(axis=0)
+        sutunlar = {'ID': np.array(self.meta['kimlikler'], dtype=object)[var],
+                    'Il': np.array(self.iller, dtype=object)[var]}
+        for g, degerler in zip(gostergeler, blok[:, var]):
+            # Sayısal sütunlar doğrudan şema tipinde kurulur (tek tek astype yok)
+            dizi = sema_dizisi(degerler, SEMA[g]) if g in SEMA and SEMA[g] not in ('kimlik', 'category') else None
+            sutunlar[g] = degerler if dizi is None else dizi
+        return semaya_cevir(pd.DataFrame(sutunlar), {'ID': SEMA['ID'], 'Il': SEMA['Il']})
+
+    def ulusal_tablo(self, kaynak):
+        """
+        Ulusal serinin CSV'deki biçimi (ör. 'su_verisi.csv' -> Yıl,
+        Toplam_Su_Miktari_Bin_m3, Nüfus); tamamen boş yıllar çıkarılır.
+        """
+        try:
+            bilgi = self.meta['ulusal']['kaynaklar'][os.path.basename(kaynak)]
+        except KeyError:
+            raise KeyError(f"Depoda olmayan ulusal seri: {kaynak}") from None
+        sutunlar = {ad: self.ulusal_dizisi[self.ulusal_gostergeler.index(ad)] for ad in bilgi['sutunlar']}
+        df = pd.DataFrame({bilgi['yil']: self.yillar, **sutunlar})
+        df = df[df[bilgi['sutunlar']].notna().any(axis=1)].reset_index(drop=True)
+        # CSV'de tamsayı olan sütunlar tamsayıya döner (ör. Nüfus)
+        for ad in bilgi['sutunlar']:
+            degerler = df[ad].to_numpy()
+            if not np.isnan(degerler).any() and (degerler == np.round(degerler)).all():
+                df[ad] = degerler.astype(np.int64)
+        return df
+
+    def icerir(self, kaynak):
+        return os.path.basename(kaynak) in self.meta['ulusal']['kaynaklar']
+
+
+def depoyu_oku(dizin):
+    """
+    Depodaki bütün yılları depo_yaz'ın beklediği biçimde döndürür (ekleme için):
+    (il_tablolari, ulusal, sira); sira depo_yaz'a **sira olarak verilir ve
+    gösterge/il sırasını korur.
+    """
+    depo = PanelDeposu(dizin)
+    il_tablolari = {yil: depo.tablo(yil) for yil in depo.il_yillari}
+    ulusal = {dosya: (bilgi['yil'], depo.ulusal_tablo(dosya))
+              for dosya, bilgi in depo.meta['ulusal']['kaynaklar'].items()}
+    return il_tablolari, ulusal, {'gostergeler': depo.gostergeler, 'iller': depo.iller}
+
+
+def yil_ekle(dizin, yil, df):
+    """Depoya bir yılın il tablosunu ekler ya da o yılı değiştirir (depo yeniden yazılır)."""
+    il_tablolari, ulusal, sira = depoyu_oku(dizin) if depo_mu(dizin) else ({}, {}, {})
+    il_tablolari[int(yil)] = df
+    return depo_yaz(dizin, il_tablolari, ulusal, **sira)
+
+
+def _yil_degeri(metin):
+    yil, _, yol = metin.partition('=')
+    if not yol:
+        raise argparse.ArgumentTypeError(f"YIL=YOL biçiminde olmalı: {metin}")
+    return int(yil), yol
+
+
+def _yil_araligi_degeri(metin):
+    bas, _, bit = metin.partition('-')
+    return int(bas), int(bit or bas)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Çok yıllı il paneli deposu (belleğe eşlenmiş diziler).")
+    komutlar = parser.add_subparsers(dest='komut', required=True)
+
+    olustur = komutlar.add_parser('olustur', help="CSV dosyalarından depo oluşturur / yeniden yazar")
+    olustur.add_argument('--il', nargs='+', type=_yil_degeri, default=[(2024, 'message.txt')], metavar='YIL=YOL',
+                         help="Yıl başına message.txt biçiminde il tablosu (varsayılan: 2024=message.txt)")
+    olustur.add_argument('--ulusal', nargs='*', default=list(ULUSAL_KAYNAKLAR), metavar='CSV',
+                         help="Ulusal yıllık seriler (varsayılan: su_verisi.csv emisyon_gsyh.csv)")
+    olustur.add_argument('--ekle', action='store_true', help="Var olan depodaki yılları koru")
+    olustur.add_argument('--cikti', default='panel')
+
+    goster = komutlar.add_parser('goster', help="Depo özetini yazdırır")
+    goster.add_argument('dizin')
+
+    dilim = komutlar.add_parser('dilim', help="Bir göstergenin yıl x il dilimini yazdırır")
+    dilim.add_argument('dizin')
+    dilim.add_argument('gosterge')
+    dilim.add_argument('--yillar', type=_yil_araligi_degeri, default=None, help="ör. 2010-2024")
+    dilim.add_argument('--iller', nargs='+', default=None)
+    args = parser.parse_args()
+
+    try:
+        if args.komut == 'olustur':
+            il_tablolari, ulusal, sira = depoyu_oku(args.cikti) if args.ekle and depo_mu(args.cikti) else ({}, {}, {})
+            for yil, yol in args.il:
+                il_tablolari[yil] = ham_oku(yol)
+            for yol in args.ulusal:
+                ad = os.path.basename(yol)
+                if ad not in ULUSAL_KAYNAKLAR:
+                    print(f"HATA: {ad} için yıl sütunu bilinmiyor ({', '.join(ULUSAL_KAYNAKLAR)}).")
+                    exit()
+                ulusal[ad] = (ULUSAL_KAYNAKLAR[ad], pd.read_csv(yol))
+            depo_yaz(args.cikti, il_tablolari, ulusal, **sira)
+            args.dizin = args.cikti
+
+        depo = PanelDeposu(args.dizin)
+        if args.komut == 'dilim':
+            print(depo.cerceve(args.gosterge, args.yillar, args.iller).to_string(float_format=lambda v: f"{v:,.2f}"))
+        else:
+            print(f"{depo.dizin}: {len(depo.gostergeler)} il göstergesi x {len(depo.yillar)} yıl "
+                  f"({depo.yillar.min()}-{depo.yillar.max()}) x {len(depo.iller)} il, "
+                  f"{len(depo.ulusal_gostergeler)} ulusal gösterge")
+            print(f"  İl göstergeleri: {', '.join(depo.gostergeler)}")
+            print(f"  Ulusal seriler: " + "; ".join(f"{d} ({', '.join(b['sutunlar'])})"
+                                                    for d, b in depo.meta['ulusal']['kaynaklar'].items()))
+    except FileNotFoundError as e:
+        print(f"HATA: {e.filename or e} bulunamadı.")
+        exit()
+    except (KeyError, ValueError) as e:
+        print(f"HATA: {e.args[0]}")
+        exit()
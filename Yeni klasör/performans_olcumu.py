@@ -0,0 +1,480 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import sentetik_veri
+from sonuc_onbellegi import ONBELLEK_DIZINI
+
+# ---------------------------------------------------------
+# PERFORMANS ÖLÇÜM TAKIMI
+# ---------------------------------------------------------
+# Scriptler içe aktarılınca çalışıyor, pencere açıyor ve 20 satırlık gömülü
+# sözlükler ya da 81 satırlık message.txt kullanıyor; bir değişikliğin sıcak
+# yolu hızlandırıp hızlandırmadığı ölçülemiyordu. Bu takım:
+#   1. sentetik_veri.py ile 81 / 10k / 1M / 10M satırlık message.txt
+#      biçiminde tablolar ve su/emisyon biçiminde seriler üretir (bir kez,
+#      .onbellek/performans/ altına).
+#   2. Her analizin hesaplama zincirini scriptlerdeki çağrılarla aynı
+#      fonksiyonlar üzerinden aşama aşama çalıştırır ve ayrı ayrı süreler:
+#        yukleme   -> CSV ayrıştırma, snapshot okuma
+#        temizleme -> sütun standartlaştırma + sayısal dönüşüm
+#        turetme   -> türetilmiş endeksler (EFDE, Baski_Endeksi, ...)
+#        test      -> hipotez/normallik testleri, aykırı değer, korelasyon
+#        regresyon -> regresyon ve model araması
+#        cizim     -> grafik oluşturma + Agg ile çizim (ekran açılmaz)
+#   3. Sonuçları (her tekrarın duvar ve CPU süresi, en küçük ve medyan)
+#      ortam bilgisiyle (git sürümü, Python/NumPy/pandas) JSON'a yazar.
+#      --karsilastir eski.json ile iki sürüm adım adım karşılaştırılır.
+# Sonuç önbelleği (sonuc_onbellegi.py) ölçüm sırasında kapatılır; aksi halde
+# ikinci tekrardan itibaren diskten okuma ölçülürdü. --onbellek ile önbellek
+# boş bir geçici dizinde açık tutulur: her adımın ilk tekrarı kayıp (anahtar
+# + hesap + yazma), sonrakiler isabet (anahtar + okuma) süresidir; önbelleğe
+# alınan adımların gerçekten kazandırıp kazandırmadığı böyle görülür.
+#
+# Kullanım: python performans_olcumu.py [--olcek 81,10k,1m,10m] [--analiz egitim_firsati ...]
+#                                       [--tekrar 3] [--cikti sonuc.json] [--karsilastir eski.json]
+#                                       [--onbellek]
+
+DIZIN = os.path.dirname(os.path.abspath(__file__))
+PERFORMANS_DIZINI = os.path.join(DIZIN, ONBELLEK_DIZINI, 'performans')
+SONUC_SURUMU = 1
+VARSAYILAN_OLCEKLER = '81,10k,1m'
+ASAMALAR = ('yukleme', 'temizleme', 'turetme', 'test', 'regresyon', 'cizim')
+
+# Satır sayısıyla karesel/çarpımsal büyüyen adımlar için üst sınırlar; bu
+# boyutun üstünde adım atlanır ve sonuçta 'atlandi' olarak işaretlenir
+SINIRLAR = {
+    'permutasyon_testi': 100_000,      # (örnek x n) argsort
+    'duyarlilik_analizi': 1_000,       # (ağırlık x şehir çifti) Kendall uzaklıkları
+    'scatterplot': 1_000_000,          # satır başına bir işaretçi
+}
+SERI_SINIRI = 10_000                   # sentetik yıllık serilerin en fazla uzunluğu
+KIRILMA_SINIRI = 2_000                 # kirilma_noktalari O(n²) bellek
+
+
+class Olcum:
+    """Aşama sürelerini toplar."""
+
+    def __init__(self, tekrar=3):
+        self.tekrar = tekrar
+        self.kayitlar = []
+
+    def olc(self, analiz, asama, adim, satir, fonksiyon, tekrar=None, **parametreler):
+        """fonksiyon'u tekrar kez çalıştırır, süreleri kaydeder ve son sonucu döndürür."""
+        duvar, cpu = [], []
+        sonuc = None
+        for _ in range(tekrar or self.tekrar):
+            d0, c0 = time.perf_counter(), time.process_time()
+            sonuc = fonksiyon()
+            duvar.append(time.perf_counter() - d0)
+            cpu.append(time.process_time() - c0)
+        self.kayitlar.append({
+            'analiz': analiz, 'asama': asama, 'adim': adim, 'satir': int(satir),
+            'tekrar': len(duvar), 'sure_min': min(duvar), 'sure_medyan': statistics.median(duvar),
+            'sure_ilk': duvar[0],
+            'cpu_min': min(cpu), 'sureler': duvar, 'parametreler': parametreler, 'atlandi': False,
+        })
+        return sonuc
+
+    def atla(self, analiz, asama, adim, satir, neden):
+        self.kayitlar.append({'analiz': analiz, 'asama': asama, 'adim': adim, 'satir': int(satir),
+                              'atlandi': True, 'not': neden})
+
+    def sinirli(self, analiz, asama, adim, satir, sinir_adi, fonksiyon, **parametreler):
+        """SINIRLAR'daki üst sınırı aşan boyutlarda adımı atlar."""
+        sinir = SINIRLAR[sinir_adi]
+        if satir > sinir:
+            self.atla(analiz, asama, adim, satir, f"{sinir_adi} sınırı: {sinir:,} satır")
+            return None
+        return self.olc(analiz, asama, adim, satir, fonksiyon, **parametreler)
+
+
+def _figur():
+    import matplotlib.pyplot as plt
+
+    return plt.figure(figsize=(12, 8))
+
+
+def _ciz(fig):
+    """Figürü Agg tuvaline çizer ve kapatır (cizim aşamasının sonu)."""
+    import matplotlib.pyplot as plt
+
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+# ---------------------------------------------------------
+# ANALİZLER: scriptlerdeki hesaplama zincirinin aynısı
+# ---------------------------------------------------------
+
+def egitim_firsati(olcum, df, n):
+    from istatistik_cekirdek import dogrusal_regresyon
+    from regresyon_grafik import regresyon_ciz
+    from etiket_yerlesimi import etiketle
+    from yogunluk_grafigi import dagilim_ciz
+
+    a = 'egitim_firsati'
+    regresyon = olcum.olc(a, 'regresyon', 'dogrusal_regresyon', n,
+                          lambda: dogrusal_regresyon(df['EFDE'], df['Egitim_Norm']))
+
+    def ciz():
+        fig = _figur()
+        regresyon_ciz(regresyon, df['EFDE'], color='red')
+        dagilim_ciz(df, 'EFDE', 'Egitim_Norm', boyut='Nufus', renk='EFDE',
+                    sizes=(100, 1000), alpha=0.7, palette="viridis", edgecolor="w")
+        kritik = df[df['Il'].isin(['İstanbul', 'Ankara', 'Bursa', 'İzmir', 'Antalya', 'Hakkari'])]
+        etiketle(fig.gca(), kritik['EFDE'], kritik['Egitim_Norm'], kritik['Il'], oncelik=kritik['Nufus'])
+        _ciz(fig)
+    olcum.olc(a, 'cizim', 'dagilim+regresyon+etiket', n, ciz)
+
+
+def baski_endeksi(olcum, df, n):
+    from aykiri_deger import KuantilTaslagi
+    from etiket_yerlesimi import etiketle
+    from istatistik_cekirdek import dogrusal_regresyon
+    from regresyon_grafik import regresyon_ciz
+    from yogunluk_grafigi import dagilim_ciz
+
+    a = 'baski_endeksi'
+    sinir = olcum.olc(a, 'test', 'kuantil_taslagi', n,
+                      lambda: KuantilTaslagi().guncelle(df['Baski_Endeksi']).kuantil(0.95))
+    endeks, kira = df['Baski_Endeksi'].to_numpy(dtype=float), df['Kira'].to_numpy(dtype=float)
+    normal = endeks <= sinir
+    aykirilar = np.flatnonzero(~normal)
+    regresyon = olcum.olc(a, 'regresyon', 'dogrusal_regresyon', n,
+                          lambda: dogrusal_regresyon(endeks[normal], kira[normal]))
+
+    def ciz():
+        fig = _figur()
+        regresyon_ciz(regresyon, endeks[normal], color='red')
+        dagilim_ciz(df, 'Baski_Endeksi', 'Kira', boyut='Nufus', renk='Kira',
+                    sizes=(100, 1000), alpha=0.7, palette="magma", edgecolor="w")
+        # baski_endeksi_analizi.py ile aynı: aykırı halkaları tek çağrıda,
+        # aykırı ve önemli şehir yazıları tek etiketle() çağrısında
+        fig.gca().scatter(endeks[aykirilar], kira[aykirilar], s=2500, facecolors='none', edgecolors='red',
+                          linewidths=2, linestyle='--')
+        onemli = np.flatnonzero(df['Il'].isin(['İstanbul', 'Ankara', 'İzmir', 'Şırnak', 'Hakkari']).to_numpy()
+                                & normal)
+        sira = np.concatenate([aykirilar, onemli])
+        oncelik = np.concatenate([len(onemli) + df['Baski_Endeksi'].iloc[aykirilar].rank().to_numpy(),
+                                  df['Nufus'].iloc[onemli].rank().to_numpy()])
+        metinler = [f"Aykırı: {il}" for il in df['Il'].iloc[aykirilar]] + list(df['Il'].iloc[onemli])
+        etiketle(fig.gca(), endeks[sira], kira[sira], metinler, oncelik=oncelik,
+                 renkler=['red'] * len(aykirilar) + ['black'] * len(onemli),
+                 kayma=np.r_[np.full(len(aykirilar), 7.0), np.ones(len(onemli))], fontsize=9, fontweight='bold')
+        _ciz(fig)
+    olcum.olc(a, 'cizim', 'dagilim+regresyon+aykiri+etiket', n, ciz)
+
+
+def issizlik_egitim_suc(olcum, df, n):
+    from istatistik_cekirdek import dogrusal_regresyon
+    from regresyon_grafik import regresyon_ciz
+    from segmentasyon import segment_ata
+    from yogunluk_grafigi import dagilim_ciz
+
+    a = 'issizlik_egitim_suc'
+    tablo = {(True, False): 'IDEAL', (False, True): 'RISKLI', (True, True): 'CELISKILI', (False, False): 'PASIF'}
+    bolge, _ = olcum.olc(a, 'test', 'segment_ata', n,
+                         lambda: segment_ata(df['Ekonomik_Rahatlik'], df['Suc'], tablo))
+    veri = df.assign(Bolge=bolge)
+    regresyon = olcum.olc(a, 'regresyon', 'dogrusal_regresyon', n,
+                          lambda: dogrusal_regresyon(df['Ekonomik_Rahatlik'], df['Suc']))
+
+    def ciz():
+        fig = _figur()
+        regresyon_ciz(regresyon, df['Ekonomik_Rahatlik'], color='red')
+        dagilim_ciz(veri, 'Ekonomik_Rahatlik', 'Suc', boyut='Nufus', renk='Bolge',
+                    sizes=(100, 1000), alpha=0.7, palette='deep')
+        _ciz(fig)
+    olcum.olc(a, 'cizim', 'dagilim+regresyon', n, ciz)
+
+
+def sicaklik_enerji(olcum, df, n):
+    from aykiri_deger import aykiri_skorlari
+    from istatistik_cekirdek import dogrusal_regresyon
+    from regresyon_grafik import regresyon_ciz
+
+    a = 'sicaklik_enerji'
+    z = olcum.olc(a, 'test', 'aykiri_z', n, lambda: aykiri_skorlari(df['Kişi_Basi_Enerji'], 'z', esik=2))
+    olcum.olc(a, 'test', 'aykiri_mad', n, lambda: aykiri_skorlari(df['Kişi_Basi_Enerji'], 'mad'))
+    regresyon = olcum.olc(a, 'regresyon', 'dogrusal_regresyon', n,
+                          lambda: dogrusal_regresyon(df['Sicaklik'], df['Kişi_Basi_Enerji']))
+
+    def ciz():
+        import seaborn as sns
+
+        fig = _figur()
+        normal = df[~z['aykiri']]
+        sns.scatterplot(x=normal['Sicaklik'], y=normal['Kişi_Basi_Enerji'], s=100, alpha=0.6)
+        regresyon_ciz(regresyon, df['Sicaklik'], color='red')
+        _ciz(fig)
+    olcum.sinirli(a, 'cizim', 'scatterplot+regresyon', n, 'scatterplot', ciz)
+
+
+def karar_matrisi(olcum, df, n):
+    from scipy import stats
+
+    from korelasyon_matrisi import korelasyon_matrisi
+    from yeniden_ornekleme import permutasyon_testi
+
+    a = 'karar_matrisi'
+    olcum.olc(a, 'test', 'korelasyon_matrisi', n,
+              lambda: korelasyon_matrisi(df, ['Gelir', 'Kira', 'Tasarruf', 'Suc']))
+    yuksek = df.loc[df['Suc'] >= df['Suc'].mean(), 'Tasarruf']
+    dusuk = df.loc[df['Suc'] < df['Suc'].mean(), 'Tasarruf']
+    # shapiro 5000 üstünde p-değeri için uyarı veriyor; grup başına ilk 5000 gözlem
+    olcum.olc(a, 'test', 'shapiro', n, lambda: (stats.shapiro(yuksek[:5000]), stats.shapiro(dusuk[:5000])),
+              en_fazla_gozlem=5000)
+    olcum.olc(a, 'test', 'ttest_ind', n, lambda: stats.ttest_ind(yuksek, dusuk))
+    olcum.sinirli(a, 'test', 'permutasyon_testi', n, 'permutasyon_testi',
+                  lambda: permutasyon_testi(yuksek, dusuk, ornek_sayisi=10_000), ornek_sayisi=10_000)
+
+
+def yasam_kalite(olcum, df, n):
+    from scipy import stats
+
+    from agirlik_duyarlilik import agirlik_ornekle, duyarlilik_analizi
+    from istatistik_cekirdek import dogrusal_regresyon
+
+    a = 'yasam_kalite'
+    veri = df.rename(columns={'Il': 'Sehir', 'Gelir': 'Maas', 'Egitim': 'Eğitim', 'Suc': 'Suc_Orani'})
+    cols = ['Maas', 'Eğitim', 'Kira', 'Issizlik', 'Suc_Orani']
+
+    def endeks():
+        norm = (veri[cols] - veri[cols].min()) / (veri[cols].max() - veri[cols].min())
+        puan = (norm['Maas'] + norm['Eğitim']) - (norm['Kira'] + norm['Issizlik'] + norm['Suc_Orani'])
+        return norm, puan
+    df_norm, puan = olcum.olc(a, 'turetme', 'yasam_puan', n, endeks)
+
+    yuksek = puan[veri['Eğitim'] >= veri['Eğitim'].mean()]
+    dusuk = puan[veri['Eğitim'] < veri['Eğitim'].mean()]
+    olcum.olc(a, 'test', 'ttest_ind', n, lambda: stats.ttest_ind(yuksek, dusuk))
+    W = agirlik_ornekle(1_000, len(cols))
+    olcum.sinirli(a, 'test', 'duyarlilik_analizi', n, 'duyarlilik_analizi',
+                  lambda: duyarlilik_analizi(df_norm, veri['Sehir'], W, ilk=5), agirlik_sayisi=len(W))
+    olcum.olc(a, 'regresyon', 'dogrusal_regresyon', n, lambda: dogrusal_regresyon(veri['Issizlik'], puan))
+
+
+def gelir_etkisi(olcum, df, n):
+    from model_secimi import gram_hazirla, model_kur, tum_altkumeler
+
+    a = 'gelir_etkisi'
+    features = ['Suc', 'Egitim', 'Issizlik', 'Nufus', 'Elektrik']
+    gram = olcum.olc(a, 'regresyon', 'gram_hazirla', n, lambda: gram_hazirla(df, features, 'Gelir'))
+    olcum.olc(a, 'regresyon', 'model_kur', n, lambda: model_kur(gram, features))
+    olcum.olc(a, 'regresyon', 'tum_altkumeler', n, lambda: tum_altkumeler(gram))
+
+
+def su_tuketim(olcum, seri_su, n):
+    from istatistik_cekirdek import dogrusal_regresyon
+    from zaman_serisi import kayan_regresyon, kirilma_noktalari, kirilma_noktasi
+
+    a = 'su_tuketim'
+    m = len(seri_su)
+    kisi_basi = olcum.olc(a, 'turetme', 'kisi_basi', m, lambda: seri_su['Toplam_Su_Miktari_Bin_m3'] * 1_000_000
+                          / (seri_su['Nüfus'] * 365))
+    olcum.olc(a, 'regresyon', 'dogrusal_regresyon', m, lambda: dogrusal_regresyon(seri_su['Yıl'], kisi_basi))
+    olcum.olc(a, 'regresyon', 'kayan_regresyon', m, lambda: kayan_regresyon(seri_su['Yıl'], kisi_basi, pencere=10))
+    olcum.olc(a, 'test', 'kirilma_noktasi', m, lambda: kirilma_noktasi(seri_su['Yıl'], kisi_basi))
+    if m > KIRILMA_SINIRI:
+        olcum.atla(a, 'test', 'kirilma_noktalari', m, f"kirilma_noktalari sınırı: {KIRILMA_SINIRI:,} yıl")
+    else:
+        olcum.olc(a, 'test', 'kirilma_noktalari', m, lambda: kirilma_noktalari(seri_su['Yıl'], kisi_basi))
+
+
+def emisyon_gsyh(olcum, seri_emisyon, n):
+    from istatistik_cekirdek import dogrusal_regresyon
+    from kuznets import kuznets_uydur
+    from zaman_serisi import kayan_regresyon, kirilma_noktasi
+
+    a = 'emisyon_gsyh'
+    m = len(seri_emisyon)
+    x, y = seri_emisyon['GSYH_Milyar_USD'], seri_emisyon['Toplam_Emisyon']
+    olcum.olc(a, 'regresyon', 'dogrusal_regresyon', m, lambda: dogrusal_regresyon(x, y))
+    olcum.olc(a, 'regresyon', 'kayan_regresyon', m, lambda: kayan_regresyon(seri_emisyon['Yil'], y, x=x, pencere=8))
+    olcum.olc(a, 'test', 'kirilma_noktasi', m, lambda: kirilma_noktasi(seri_emisyon['Yil'], y, x=x))
+    olcum.olc(a, 'regresyon', 'kuznets_uydur', m, lambda: kuznets_uydur(x, y, derece=2))
+
+
+# Tablo tabanlı analizler (türetilmiş il tablosu alır) ve seri analizleri
+TABLO_ANALIZLERI = {
+    'egitim_firsati': egitim_firsati,
+    'baski_endeksi': baski_endeksi,
+    'issizlik_egitim_suc': issizlik_egitim_suc,
+    'sicaklik_enerji': sicaklik_enerji,
+    'karar_matrisi': karar_matrisi,
+    'yasam_kalite': yasam_kalite,
+    'gelir_etkisi': gelir_etkisi,
+}
+SERI_ANALIZLERI = {'su_tuketim': su_tuketim, 'emisyon_gsyh': emisyon_gsyh}
+
+
+def veri_dosyasi(olcek, tohum=42):
+    """Ölçeğin sentetik tablosunu (yoksa üretip) döndürür: (yol, satır, üretim süresi|None)."""
+    n = sentetik_veri.olcek_coz(olcek)
+    yol = os.path.join(PERFORMANS_DIZINI, f'message_{olcek}_{tohum}.txt')
+    if os.path.exists(yol):
+        return yol, n, None
+    bas = time.perf_counter()
+    sentetik_veri.il_verisi_yaz(yol, n, tohum)
+    return yol, n, time.perf_counter() - bas
+
+
+def olcek_calistir(olcum, olcek, analizler, tohum=42):
+    from turetilmis_sutunlar import tumunu_turet
+    from veri_yukleyici import sayisala_cevir, sutunlari_standartlastir, veri_yukle
+
+    yol, n, uretim = veri_dosyasi(olcek, tohum)
+    if uretim is not None:
+        print(f"  {olcek}: {n:,} satır üretildi ({uretim:.1f} sn) -> {yol}")
+
+    ham = olcum.olc('ortak', 'yukleme', 'read_csv', n, lambda: pd.read_csv(yol))
+    temiz = olcum.olc('ortak', 'temizleme', 'standartlastir+sayisala_cevir', n,
+                      lambda: sayisala_cevir(sutunlari_standartlastir(ham.copy())))
+    veri_yukle(yol)  # snapshot'ı oluştur; ölçülen sıcak okuma
+    olcum.olc('ortak', 'yukleme', 'snapshot_okuma', n, lambda: veri_yukle(yol))
+    df = olcum.olc('ortak', 'turetme', 'tumunu_turet', n, lambda: tumunu_turet(temiz.copy(deep=False)))
+    del ham
+
+    for ad in analizler:
+        if ad in TABLO_ANALIZLERI:
+            TABLO_ANALIZLERI[ad](olcum, df, n)
+
+    # Seriler: 81 ölçeğinde gerçek dosyalarla aynı uzunluk, büyüklerde satır sayısı (sınırlı)
+    seri_analizleri = [ad for ad in analizler if ad in SERI_ANALIZLERI]
+    if seri_analizleri:
+        su_n, emisyon_n = (19, 23) if n <= 81 else (min(n, SERI_SINIRI),) * 2
+        seriler = {'su_tuketim': sentetik_veri.su_serisi(su_n, tohum),
+                   'emisyon_gsyh': sentetik_veri.emisyon_serisi(emisyon_n, tohum)}
+        for ad in seri_analizleri:
+            SERI_ANALIZLERI[ad](olcum, seriler[ad], n)
+
+
+def _git_surumu():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DIZIN, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def ortam_bilgisi():
+    import matplotlib
+    import scipy
+
+    return {
+        'zaman': datetime.datetime.now().isoformat(timespec='seconds'),
+        'git': _git_surumu(),
+        'python': platform.python_version(),
+        'numpy': np.__version__, 'pandas': pd.__version__,
+        'scipy': scipy.__version__, 'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(), 'cpu_sayisi': os.cpu_count(),
+    }
+
+
+def karsilastir(yeni, eski, esik=0.10, en_az_fark=0.001):
+    """
+    İki sonuç dosyasının ortak adımları için sure_min oranları (yeni / eski).
+    Oran esik'ten fazla saparsa ve fark en_az_fark saniyeyi aşarsa işaretlenir.
+    """
+    anahtar = lambda k: (k['analiz'], k['asama'], k['adim'], k['satir'])
+    onceki = {anahtar(k): k for k in eski['sonuclar'] if not k.get('atlandi')}
+    satirlar = []
+    for k in yeni['sonuclar']:
+        e = onceki.get(anahtar(k))
+        if k.get('atlandi') or e is None or e['sure_min'] <= 0:
+            continue
+        oran = k['sure_min'] / e['sure_min']
+        anlamli = abs(k['sure_min'] - e['sure_min']) > en_az_fark
+        durum = '' if not anlamli else 'YAVAŞ' if oran > 1 + esik else ('HIZLI' if oran < 1 - esik else '')
+        satirlar.append({'analiz': k['analiz'], 'adim': k['adim'], 'satir': k['satir'],
+                         'eski_sn': e['sure_min'], 'yeni_sn': k['sure_min'], 'oran': oran, 'durum': durum})
+    return pd.DataFrame(satirlar)
+
+
+def ozet_tablosu(kayitlar, deger='sure_min'):
+    tablo = pd.DataFrame([k for k in kayitlar if not k.get('atlandi')])
+    if tablo.empty:
+        return tablo
+    return tablo.pivot_table(index=['analiz', 'asama', 'adim'], columns='satir', values=deger, sort=False)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Analizlerin aşama bazında performans ölçümü.")
+    parser.add_argument('--olcek', default=VARSAYILAN_OLCEKLER,
+                        help=f"Virgülle ayrılmış satır sayıları (81, 10k, 1m, 10m; varsayılan {VARSAYILAN_OLCEKLER})")
+    parser.add_argument('--analiz', nargs='+', choices=list(TABLO_ANALIZLERI) + list(SERI_ANALIZLERI),
+                        help="Yalnızca bu analizler (varsayılan: hepsi)")
+    parser.add_argument('--tekrar', type=int, default=3, help="Her adımın tekrar sayısı")
+    parser.add_argument('--tohum', type=int, default=42)
+    parser.add_argument('--cikti', help="Sonuç JSON dosyası (varsayılan: .onbellek/performans/sonuc_<git>_<zaman>.json)")
+    parser.add_argument('--karsilastir', help="Karşılaştırılacak önceki sonuç JSON dosyası")
+    parser.add_argument('--onbellek', action='store_true',
+                        help="Sonuç önbelleğini boş bir geçici dizinde açık tut (ilk tekrar kayıp, sonrakiler isabet)")
+    args = parser.parse_args()
+
+    # Ölçüm sırasında sonuç önbelleği kapalı (ya da boş bir dizinde açık), grafikler ekransız
+    if args.onbellek:
+        os.environ['SONUC_ONBELLEGI'] = '1'
+        os.makedirs(PERFORMANS_DIZINI, exist_ok=True)
+        os.environ['SONUC_ONBELLEGI_DIZINI'] = tempfile.mkdtemp(prefix='sonuclar_', dir=PERFORMANS_DIZINI)
+    else:
+        os.environ['SONUC_ONBELLEGI'] = '0'
+    import matplotlib
+    matplotlib.use('Agg')
+
+    analizler = args.analiz or list(TABLO_ANALIZLERI) + list(SERI_ANALIZLERI)
+    olcekler = [o.strip() for o in args.olcek.split(',') if o.strip()]
+    olcum = Olcum(args.tekrar)
+    ortam = ortam_bilgisi()
+
+    # Isınma turu (kaydedilmez): tembel içe aktarmalar (scipy, seaborn), yazı
+    # tipi önbelleği vb. ilk ölçülen adımın süresine eklenmesin
+    olcek_calistir(Olcum(1), '81', analizler, args.tohum)
+    if args.onbellek:
+        # Isınma turunun yazdığı kayıtlar ölçülen ilk tekrarı isabete çevirmesin
+        shutil.rmtree(os.environ['SONUC_ONBELLEGI_DIZINI'], ignore_errors=True)
+
+    baslangic = time.perf_counter()
+    for olcek in olcekler:
+        print(f"Ölçek {olcek} ...")
+        olcek_calistir(olcum, olcek, analizler, args.tohum)
+
+    sonuc = {'surum': SONUC_SURUMU, 'ortam': ortam,
+             'ayarlar': {'olcekler': olcekler, 'analizler': analizler, 'tekrar': args.tekrar,
+                         'tohum': args.tohum, 'sinirlar': SINIRLAR, 'seri_siniri': SERI_SINIRI,
+                         'onbellek': args.onbellek},
+             'toplam_sure': time.perf_counter() - baslangic, 'sonuclar': olcum.kayitlar}
+    cikti = args.cikti or os.path.join(
+        PERFORMANS_DIZINI, f"sonuc_{ortam['git'] or 'yerel'}_{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(cikti)), exist_ok=True)
+    with open(cikti, 'w', encoding='utf-8') as f:
+        json.dump(sonuc, f, ensure_ascii=False, indent=1)
+
+    with pd.option_context('display.width', 200, 'display.max_rows', None, 'display.max_columns', None,
+                           'display.float_format', lambda v: f"{v:.4f}"):
+        if args.onbellek:
+            print("\nİlk tekrar, önbellek kaybı (sn):")
+            print(ozet_tablosu(olcum.kayitlar, 'sure_ilk'))
+        print("\nEn kısa süreler (sn):" if not args.onbellek else "\nEn kısa süreler, önbellek isabeti (sn):")
+        print(ozet_tablosu(olcum.kayitlar))
+        atlananlar = [k for k in olcum.kayitlar if k.get('atlandi')]
+        for k in atlananlar:
+            print(f"  atlandı: {k['analiz']}/{k['adim']} @ {k['satir']:,} ({k['not']})")
+        if args.karsilastir:
+            with open(args.karsilastir, encoding='utf-8') as f:
+                print(f"\nKarşılaştırma ({args.karsilastir} -> {cikti}):")
+                print(karsilastir(sonuc, json.load(f)).to_string(index=False))
+    print(f"\nSonuçlar: {cikti}")
+    if args.onbellek:
+        shutil.rmtree(os.environ['SONUC_ONBELLEGI_DIZINI'], ignore_errors=True)
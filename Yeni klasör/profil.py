@@ -0,0 +1,283 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# ---------------------------------------------------------
+# AŞAMA PROFİLLEYİCİ (SÜRE, CPU, BELLEK, SATIR)
+# ---------------------------------------------------------
+# Scriptler VERİ YÜKLEME, HESAPLAMALAR, İSTATİSTİKSEL ANALİZLER ve
+# GÖRSELLEŞTİRME bölümlerine ayrılmış durumda; bu modül her bölümün ve
+# içindeki pahalı adımların (regresyon bandı, etiket yerleşimi, bootstrap
+# ...) ne kadar sürdüğünü kaydeder:
+#   bolum('HESAPLAMALAR', satir=len(df))  -> önceki bölümü kapatıp yenisini açar
+#   with asama('shapiro'): ...            -> açık bölümün altında iç içe adım
+#   @profillenir()                        -> kütüphane fonksiyonunu adım yapar
+# Her kayıtta duvar saati, CPU süresi, satır sayısı, o anki RSS ve sürecin
+# tepe RSS'i (ve adım boyunca tepe değerdeki artış) tutulur.
+#
+# Ortam değişkenleri:
+#   ANALIZ_PROFIL=1              -> profillemeyi açar
+#   ANALIZ_PROFIL_DIZINI=yol     -> iz dosyalarının dizini (varsayılan .onbellek/profil)
+# Kapalıyken bolum() tek bir bayrak kontrolüdür, asama() paylaşılan boş bir
+# bağlam döndürür. Açıkken süreç biterken iz JSON'a yazılır (Chrome/Perfetto
+# "traceEvents" biçimi ve düz "asamalar" listesi) ve özet tablo stderr'e
+# basılır; stdout'taki analiz raporları değişmez.
+
+PROFIL_DIZINI = os.path.join('.onbellek', 'profil')
+
+
+def _acik_mi():
+    return os.environ.get('ANALIZ_PROFIL', '').strip().lower() not in ('', '0', 'false', 'hayir', 'hayır')
+
+
+class _Durum:
+    def __init__(self):
+        self.acik = _acik_mi()
+        self.betik = os.path.splitext(os.path.basename(sys.argv[0] or 'python'))[0] or 'python'
+        self.kayitlar = []
+        self.yigin = []
+
+
+_durum = _Durum()
+
+
+def etkinlestir(acik=True):
+    """Profillemeyi bu süreçte açar/kapatır (alt süreçler için ortam değişkeni de ayarlanır)."""
+    _durum.acik = acik
+    os.environ['ANALIZ_PROFIL'] = '1' if acik else '0'
+
+
+def acik_mi():
+    return _durum.acik
+
+
+def betik_ayarla(ad):
+    """Sonraki kayıtların ait olduğu script adı (toplu_calistir her script için değiştirir)."""
+    _durum.betik = os.path.splitext(os.path.basename(ad))[0]
+
+
+def _bellek():
+    """(o anki RSS, süreç tepe RSS) bayt cinsinden; ölçülemezse None."""
+    simdi = tepe = None
+    if resource is not None:
+        tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        tepe *= 1 if sys.platform == 'darwin' else 1024    # Linux'ta KB
+        try:
+            with open('/proc/self/statm') as f:
+                simdi = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except OSError:
+            pass
+    else:
+        try:
+            import psutil
+
+            bilgi = psutil.Process().memory_info()
+            simdi, tepe = bilgi.rss, getattr(bilgi, 'peak_wset', None)
+        except ImportError:
+            pass
+    return simdi, tepe
+
+
+def _mb(bayt):
+    return None if bayt is None else round(bayt / 1024 ** 2, 2)
+
+
+class Asama:
+    """Tek bir ölçüm aralığı; with bloğu olarak ya da bolum() ile açılır."""
+
+    def __init__(self, ad, satir=None):
+        self.ad = ad
+        self.satir = satir
+
+    def __enter__(self):
+        ust = _durum.yigin[-1] if _durum.yigin else None
+        self.yol = f"{ust.yol}/{self.ad}" if ust else self.ad
+        self.derinlik = len(_durum.yigin)
+        _durum.yigin.append(self)
+        self._tepe = _bellek()[1]
+        self._unix = time.time()
+        self._cpu = time.process_time()
+        self._bas = time.perf_counter()
+        return self
+
+    def __exit__(self, *hata):
+        duvar = time.perf_counter() - self._bas
+        cpu = time.process_time() - self._cpu
+        if self not in _durum.yigin:
+            return False    # bolum() tarafından zaten kapatıldı
+        # İçeride kapatılmamış adımlar varsa önce onlar kapanır
+        while _durum.yigin[-1] is not self:
+            _durum.yigin[-1].__exit__(None, None, None)
+        _durum.yigin.pop()
+        simdi, tepe = _bellek()
+        _durum.kayitlar.append({
+            'betik': _durum.betik, 'pid': os.getpid(), 'ad': self.ad, 'yol': self.yol,
+            'derinlik': self.derinlik, 'baslangic_unix': self._unix,
+            'duvar_sn': duvar, 'cpu_sn': cpu, 'satir': self.satir,
+            'rss_mb': _mb(simdi), 'tepe_rss_mb': _mb(tepe),
+            'tepe_artis_mb': _mb(tepe - self._tepe) if tepe is not None and self._tepe is not None else None,
+        })
+        return False
+
+
+class _KapaliAsama:
+    """Profil kapalıyken kullanılan paylaşılan, hiçbir şey yapmayan bağlam."""
+    satir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *hata):
+        return False
+
+    def __setattr__(self, ad, deger):
+        pass
+
+
+_KAPALI = _KapaliAsama()
+
+
+def asama(ad, satir=None):
+    """
+    İç içe ölçüm bloğu: with asama('regplot', satir=len(df)) as a: ...
+    Satır sayısı blok içinde a.satir = ... ile de verilebilir.
+    """
+    return Asama(ad, satir) if _durum.acik else _KAPALI
+
+
+def bolum(ad, satir=None):
+    """Açık bölümleri kapatıp yeni bir üst düzey bölüm açar (girintisiz işaretçi)."""
+    if not _durum.acik:
+        return
+    bitir()
+    Asama(ad, satir).__enter__()
+
+
+def bitir():
+    """Açık bütün bölüm/adımları kapatır."""
+    while _durum.yigin:
+        _durum.yigin[0].__exit__(None, None, None)
+
+
+def _satir_say(args, sonuc=None):
+    for v in args:
+        if hasattr(v, 'shape') and getattr(v, 'ndim', 0) >= 1:
+            return int(v.shape[0])
+    if hasattr(sonuc, 'shape') and getattr(sonuc, 'ndim', 0) >= 1:
+        return int(sonuc.shape[0])
+    return None
+
+
+def profillenir(ad=None):
+    """
+    Fonksiyonu profil adımı yapar (profil kapalıyken yalnızca bayrak kontrolü).
+    Satır sayısı ilk dizi/tablo argümanından, yoksa sonuçtan alınır.
+    """
+    def sarmala(fonksiyon):
+        etiket = ad or fonksiyon.__name__
+
+        @functools.wraps(fonksiyon)
+        def sarici(*args, **kwargs):
+            if not _durum.acik:
+                return fonksiyon(*args, **kwargs)
+            with Asama(etiket, _satir_say(args)) as a:
+                sonuc = fonksiyon(*args, **kwargs)
+                if a.satir is None:
+                    a.satir = _satir_say((), sonuc)
+                return sonuc
+        return sarici
+    return sarmala
+
+
+def kayit_sayisi():
+    return len(_durum.kayitlar)
+
+
+def kayitlari_al(baslangic=0):
+    """
+    Açık aşamaları kapatır; baslangic sırasından sonraki kayıtları döndürüp
+    listeden çıkarır (öncekiler, ör. fork ile devralınanlar, yerinde kalır).
+    """
+    bitir()
+    kayitlar = _durum.kayitlar[baslangic:]
+    del _durum.kayitlar[baslangic:]
+    return kayitlar
+
+
+def iz_olaylari(kayitlar):
+    """
+    Kayıtları Chrome/Perfetto 'traceEvents' biçimine çevirir. Her süreç
+    (işçi) bir satır grubu, içinde çalıştırdığı her script bir iş parçacığı satırıdır.
+    """
+    olaylar, satirlar = [], {}
+    for k in kayitlar:
+        tid = satirlar.setdefault((k['pid'], k['betik']), len(satirlar))
+        olaylar.append({'name': k['ad'], 'ph': 'X', 'pid': k['pid'], 'tid': tid,
+                        'ts': round(k['baslangic_unix'] * 1e6), 'dur': round(k['duvar_sn'] * 1e6),
+                        'args': {a: k[a] for a in ('satir', 'cpu_sn', 'rss_mb', 'tepe_rss_mb', 'tepe_artis_mb')}})
+    olaylar += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': betik}}
+                for (pid, betik), tid in satirlar.items()]
+    return olaylar
+
+
+def rapor_yaz(kayitlar, yol=None, ad=None):
+    """İzi JSON olarak yazar; yazılan yolu döndürür."""
+    if yol is None:
+        dizin = os.environ.get('ANALIZ_PROFIL_DIZINI') or PROFIL_DIZINI
+        zaman = time.strftime('%Y%m%d_%H%M%S')
+        yol = os.path.join(dizin, f"{ad or _durum.betik}_{zaman}_{os.getpid()}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(yol)), exist_ok=True)
+    with open(yol, 'w', encoding='utf-8') as f:
+        json.dump({'python': sys.version.split()[0], 'platform': sys.platform,
+                   'asamalar': kayitlar, 'traceEvents': iz_olaylari(kayitlar)},
+                  f, ensure_ascii=False, indent=1)
+    return yol
+
+
+def ozet_tablosu(kayitlar):
+    """Script başına iç içe aşama tablosu; birden çok script varsa bölüm toplamları da eklenir."""
+    def sayi(v, bicim):
+        return '-' if v is None else format(v, bicim)
+
+    satirlar = [f"{'Aşama':<44} {'Satır':>10} {'Duvar sn':>9} {'CPU sn':>8} {'Tepe MB':>9} {'+Tepe MB':>9}"]
+    betik = None
+    # Kayıtlar kapanış sırasında; tabloda açılış sırası (ebeveyn önce) gösterilir
+    for k in sorted(kayitlar, key=lambda k: (k['pid'], k['baslangic_unix'], k['derinlik'])):
+        if k['betik'] != betik:
+            betik = k['betik']
+            satirlar.append(f"[{betik}]")
+        ad = ('  ' * (k['derinlik'] + 1) + k['ad'])[:44]
+        satirlar.append(f"{ad:<44} {sayi(k['satir'], ','):>10} {k['duvar_sn']:>9.3f} {k['cpu_sn']:>8.3f} "
+                        f"{sayi(k['tepe_rss_mb'], '.1f'):>9} {sayi(k['tepe_artis_mb'], '.1f'):>9}")
+
+    if len({k['betik'] for k in kayitlar}) > 1:
+        toplam = {}
+        for k in kayitlar:
+            if k['derinlik'] == 0:
+                t = toplam.setdefault(k['ad'], [0.0, 0.0])
+                t[0] += k['duvar_sn']
+                t[1] += k['cpu_sn']
+        satirlar.append("[bölüm toplamları]")
+        for ad, (duvar, cpu) in sorted(toplam.items(), key=lambda t: -t[1][0]):
+            satirlar.append(f"{'  ' + ad:<44} {'':>10} {duvar:>9.3f} {cpu:>8.3f}")
+    return "\n".join(satirlar)
+
+
+@atexit.register
+def _cikista():
+    # Tek başına çalışan script: iz dosyası + özet (toplu_calistir kayıtları
+    # kendisi topladığı için burada boş liste kalır)
+    if not _durum.acik:
+        return
+    kayitlar = kayitlari_al()
+    if kayitlar:
+        yol = rapor_yaz(kayitlar)
+        print("\n" + ozet_tablosu(kayitlar) + f"\nProfil izi: {yol}", file=sys.stderr)
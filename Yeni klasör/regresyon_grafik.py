@@ -0,0 +1,59 @@
+import numpy as np
+
+from profil import profillenir
+
+# ---------------------------------------------------------
+# KAPALI FORM REGRESYON GÜVEN BANTLARI (sns.regplot YERİNE)
+# ---------------------------------------------------------
+# sns.regplot yalnızca bir bant çizmek için modeli varsayılan olarak 1000
+# kez bootstrap ile yeniden uyduruyor; bant da her çalıştırmada biraz
+# değişiyor. Scriptte zaten hesaplanan dogrusal_regresyon sonucundan
+# (istatistik_cekirdek.RegresyonSonucu) bantlar doğrudan çıkar:
+#   ortalama yanıt : ŷ ± t · s · sqrt(1/n + (x - x̄)² / Sxx)
+#   tahmin         : ŷ ± t · s · sqrt(1 + 1/n + (x - x̄)² / Sxx)
+# s = artık standart sapması, t = Student t kritik değeri (n - 2 sd).
+
+
+def guven_bantlari(sonuc, x, guven=0.95):
+    """
+    Verilen x noktalarında (ŷ, ortalama_alt, ortalama_ust, tahmin_alt, tahmin_ust).
+    Yeniden uydurma yapılmaz; yalnızca sonuc'taki özet değerler kullanılır.
+    """
+    from scipy.special import stdtrit  # t dağılımının ters CDF'i
+
+    x = np.asarray(x, dtype=float)
+    t_kritik = stdtrit(sonuc.n - 2, 1 - (1 - guven) / 2)
+    yhat = sonuc.tahmin(x)
+    kaldirac = 1.0 / sonuc.n + (x - sonuc.ort_x) ** 2 / sonuc.sxx
+    ortalama_pay = t_kritik * sonuc.artik_std * np.sqrt(kaldirac)
+    tahmin_pay = t_kritik * sonuc.artik_std * np.sqrt(1.0 + kaldirac)
+    return yhat, yhat - ortalama_pay, yhat + ortalama_pay, yhat - tahmin_pay, yhat + tahmin_pay
+
+
+@profillenir()
+def regresyon_ciz(sonuc, x, y=None, ax=None, guven=0.95, tahmin_bandi=False, color='red',
+                  scatter_kws=None, line_kws=None, nokta_sayisi=100):
+    """
+    sns.regplot(..., ci=95) karşılığı: doğru ve ortalama yanıt bandı
+    (tahmin_bandi=True ise tahmin bandı da) çizilir. y verilirse noktalar da
+    çizilir (regplot'taki scatter=True). Doğru verinin x aralığıyla sınırlıdır
+    (truncate=True). Çizilen eksen döner.
+    """
+    import matplotlib.pyplot as plt
+
+    ax = ax if ax is not None else plt.gca()
+    x = np.asarray(x, dtype=float)
+
+    if y is not None:
+        nokta = {'color': color, 'alpha': 0.8, **(scatter_kws or {})}
+        ax.scatter(x, np.asarray(y, dtype=float), **nokta)
+
+    izgara = np.linspace(np.nanmin(x), np.nanmax(x), nokta_sayisi)
+    yhat, ort_alt, ort_ust, tah_alt, tah_ust = guven_bantlari(sonuc, izgara, guven)
+    cizgi = {'color': color, **(line_kws or {})}
+    ax.plot(izgara, yhat, **cizgi)
+    bant_rengi = cizgi['color']
+    ax.fill_between(izgara, ort_alt, ort_ust, color=bant_rengi, alpha=0.15, linewidth=0)
+    if tahmin_bandi:
+        ax.fill_between(izgara, tah_alt, tah_ust, color=bant_rengi, alpha=0.07, linewidth=0)
+    return ax
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# VEKTÖREL BÖLGE / SEGMENT ATAMA MOTORU
+# ---------------------------------------------------------
+# "4 Bölgeli Karar Matrisi.py" ve işsizlik_eğitim_suc.py'deki satır satır
+# df.apply(..., axis=1) sınıflandırmasının ortak hali. İki eksen eşiklerle
+# karşılaştırılır, her satıra 0-3 arası bir kod verilir ve sonuç tek
+# seferde kategorik (category) sütuna dönüştürülür.
+
+
+def esik_hesapla(seri, esik):
+    """'ortalama', 'medyan' veya doğrudan sayısal bir eşik değeri döndürür."""
+    if esik == 'ortalama':
+        return float(np.nanmean(seri))
+    if esik == 'medyan':
+        return float(np.nanmedian(seri))
+    if isinstance(esik, (int, float, np.number)):
+        return float(esik)
+    raise ValueError(f"Bilinmeyen eşik türü: {esik!r} ('ortalama', 'medyan' veya sayı olmalı)")
+
+
+def segment_ata(x, y, etiketler, x_esik='ortalama', y_esik='ortalama',
+                x_esit_yuksek=True, y_esit_yuksek=True):
+    """
+    İki eksene göre her satırı bir segmente atar.
+
+    etiketler: {(x_yuksek, y_yuksek): 'Etiket'} sözlüğü; dört kombinasyonun
+        hepsi verilmelidir. Kategorilerin sırası sözlüğün sırasıdır.
+    x_esit_yuksek / y_esit_yuksek: eşiğe tam eşit değerin "yüksek" sayılıp
+        sayılmayacağı (>= veya >).
+
+    Eksenlerden biri NaN olan satırlar NaN kategorisi alır.
+    Dönüş: (kategorik Seri, (x_esik_degeri, y_esik_degeri))
+    """
+    anahtarlar = [(True, True), (True, False), (False, True), (False, False)]
+    eksik = [k for k in anahtarlar if k not in etiketler]
+    if eksik:
+        raise ValueError(f"Etiket tablosunda eksik kombinasyon(lar): {eksik}")
+
+    x_deger = np.asarray(x, dtype=float)
+    y_deger = np.asarray(y, dtype=float)
+    x_sinir = esik_hesapla(x_deger, x_esik)
+    y_sinir = esik_hesapla(y_deger, y_esik)
+
+    x_yuksek = x_deger >= x_sinir if x_esit_yuksek else x_deger > x_sinir
+    y_yuksek = y_deger >= y_sinir if y_esit_yuksek else y_deger > y_sinir
+
+    # Etiket tablosunu (x_yuksek, y_yuksek) -> kategori kodu eşlemesine çevir
+    kategoriler = list(dict.fromkeys(etiketler.values()))
+    kod_tablosu = np.empty(4, dtype=np.int8)
+    for (xk, yk), etiket in etiketler.items():
+        kod_tablosu[2 * int(xk) + int(yk)] = kategoriler.index(etiket)
+
+    kodlar = kod_tablosu[2 * x_yuksek.astype(np.int8) + y_yuksek.astype(np.int8)]
+    kodlar[np.isnan(x_deger) | np.isnan(y_deger)] = -1
+
+    sonuc = pd.Categorical.from_codes(kodlar, categories=kategoriler)
+    indeks = x.index if isinstance(x, pd.Series) else None
+    return pd.Series(sonuc, index=indeks), (x_sinir, y_sinir)
@@ -0,0 +1,91 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from istatistik_cekirdek import dogrusal_regresyon
+from profil import profillenir
+
+# ---------------------------------------------------------
+# MONTE CARLO DOĞURGANLIK SENARYO MOTORU (Nüfus_Tahmin.py)
+# ---------------------------------------------------------
+# Nüfus_Tahmin.py yıl yıl döngüyle tek bir deterministik yol üretir. Bu motor
+# binlerce doğurganlık yolunu aynı anda (senaryo x yıl) dizisi olarak üretir:
+#   1. Parametre belirsizliği: (seviye, eğim) OLS kovaryansından çekilir.
+#      Yıl ekseni ortalamaya göre merkezlendiği için iki parametre bağımsızdır.
+#   2. Yıllık şoklar: regresyon artıkları yerine koymalı yeniden örneklenir.
+# Nüfus, scriptteki formülle ve np.cumprod ile tek adımda ilerletilir.
+# Rastgelelik SeedSequence ile sabit büyüklükteki parçalara bölünür; sonuç
+# işçi sayısından bağımsız olarak aynı tohumla birebir tekrarlanır.
+
+YENILENME_DUZEYI = 2.10
+PARCA_BOYUTU = 1000
+
+
+def dogurganlik_modeli(yillar, hizlar):
+    """Yıl -> doğurganlık regresyonundan senaryo üretimi için gereken parametreler."""
+    yillar = np.asarray(yillar, dtype=float)
+    hizlar = np.asarray(hizlar, dtype=float)
+    sonuc = dogrusal_regresyon(yillar, hizlar)
+    return {
+        'regresyon': sonuc,
+        'ort_yil': sonuc.ort_x,
+        'seviye': sonuc.kesisim + sonuc.egim * sonuc.ort_x,   # ortalama yıldaki tahmin
+        'seviye_se': sonuc.artik_std / np.sqrt(sonuc.n),
+        'egim': sonuc.egim,
+        'egim_se': sonuc.egim_se,
+        'artiklar': hizlar - sonuc.tahmin(yillar),
+    }
+
+
+def nufus_yollari(hizlar, baslangic_nufusu, yenilenme_duzeyi=YENILENME_DUZEYI):
+    """
+    Nüfus_Tahmin.py'deki güncellemenin vektörel hali:
+        yuzde = (hiz - 2.10) / 2.10 * 100 ;  nufus *= 1 + yuzde / 1000
+    hizlar: (senaryo x yıl) dizisi. Dönüş aynı biçimde nüfus dizisi.
+    """
+    carpan = 1.0 + ((hizlar - yenilenme_duzeyi) / yenilenme_duzeyi * 100) / 1000
+    return baslangic_nufusu * np.cumprod(carpan, axis=-1)
+
+
+def _parca_uret(is_):
+    model, gelecek_yillar, baslangic_nufusu, adet, tohum = is_
+    rng = np.random.default_rng(tohum)
+    x = np.asarray(gelecek_yillar, dtype=float) - model['ort_yil']
+
+    seviye = rng.normal(model['seviye'], model['seviye_se'], size=(adet, 1))
+    egim = rng.normal(model['egim'], model['egim_se'], size=(adet, 1))
+    artiklar = model['artiklar']
+    soklar = artiklar[rng.integers(0, artiklar.size, size=(adet, x.size))]
+
+    hizlar = seviye + egim * x + soklar
+    return hizlar, nufus_yollari(hizlar, baslangic_nufusu)
+
+
+@profillenir()
+def senaryo_uret(model, gelecek_yillar, baslangic_nufusu, senaryo_sayisi=10_000,
+                 tohum=42, isci_sayisi=1, parca_boyutu=PARCA_BOYUTU):
+    """
+    (senaryo_sayisi x len(gelecek_yillar)) boyutunda doğurganlık ve nüfus
+    dizileri döndürür. isci_sayisi > 1 ise parçalar süreç havuzunda üretilir.
+    """
+    adetler = [parca_boyutu] * (senaryo_sayisi // parca_boyutu)
+    if senaryo_sayisi % parca_boyutu:
+        adetler.append(senaryo_sayisi % parca_boyutu)
+    tohumlar = np.random.SeedSequence(tohum).spawn(len(adetler))
+    isler = [(model, list(gelecek_yillar), baslangic_nufusu, a, t) for a, t in zip(adetler, tohumlar)]
+
+    if isci_sayisi == 1 or len(isler) == 1:
+        parcalar = [_parca_uret(i) for i in isler]
+    else:
+        with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+            parcalar = list(havuz.map(_parca_uret, isler))
+
+    hizlar = np.concatenate([p[0] for p in parcalar])
+    nufuslar = np.concatenate([p[1] for p in parcalar])
+    return hizlar, nufuslar
+
+
+def yuzdelik_bantlari(yollar, yuzdelikler=(5, 25, 50, 75, 95)):
+    """Her yıl için {yüzdelik: değerler} sözlüğü döndürür."""
+    degerler = np.percentile(yollar, yuzdelikler, axis=0)
+    return dict(zip(yuzdelikler, degerler))
@@ -0,0 +1,190 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# SENTETİK VERİ ÜRETECİ (İL/İLÇE TABLOSU + YILLIK SERİLER)
+# ---------------------------------------------------------
+# Performans ölçümü için message.txt, su_verisi.csv ve emisyon_gsyh.csv ile
+# aynı biçimde, istenen boyutta veri üretir.
+#   - İl tablosu: Gauss kopulası. Gerçek 81 ilin sayısal sütunlarından
+#     Spearman korelasyonu alınır, Pearson'a çevrilir (r = 2 sin(π ρ / 6))
+#     ve çok değişkenli normal örneklemler Φ ile [0, 1]'e, oradan her
+#     sütunun gerçek ampirik dağılımına (kuantil enterpolasyonu) taşınır.
+#     Böylece marjinal dağılımlar ve sütunlar arası ilişkiler korunur.
+#   - Su serisi: nüfus gerçek seri hızında geometrik büyür, kişi başı
+#     tüketim gerçek serinin doğrusal eğilimi + gürültüdür; yıllar 1-2 yıl
+#     arayla düzensizdir.
+#   - Emisyon serisi: GSYH log-rastgele yürüyüş, emisyon gerçek veriye
+#     uydurulan kuadratik Kuznets eğrisi + gürültüdür.
+# Büyük tablolar (ör. 10M satır) parça parça üretilip dosyaya eklenir;
+# her parçanın tohumu SeedSequence'tan türetildiği için sonuç parça
+# boyutundan bağımsız olarak tekrarlanabilirdir.
+
+DIZIN = os.path.dirname(os.path.abspath(__file__))
+SABLON = os.path.join(DIZIN, 'message.txt')
+PARCA_BOYUTU = 1_000_000
+
+# message.txt'deki ham sütun sırası ve tamsayı olarak yazılan sütunlar
+SUTUNLAR = ['ID', 'Il', 'yıllık_ortalama_sicaklik', 'Nufus', 'Elektrik', 'Issizlik',
+            'Ortalama_Maas', 'Kira', 'Eğitim', 'Suc_Orani']
+TAMSAYI_SUTUNLARI = ['Ortalama_Maas', 'Kira', 'Eğitim']
+
+# Ölçek adları (performans_olcumu.py ile ortak)
+OLCEKLER = {'81': 81, '10k': 10_000, '1m': 1_000_000, '10m': 10_000_000}
+
+
+def olcek_coz(deger):
+    """'10k', '1m', '81' ya da sayı -> satır sayısı."""
+    deger = str(deger).strip().lower()
+    if deger in OLCEKLER:
+        return OLCEKLER[deger]
+    carpan = {'k': 1_000, 'm': 1_000_000}.get(deger[-1:], 1)
+    return int(float(deger.rstrip('km')) * carpan)
+
+
+class KopulaModeli:
+    """Şablon tablodan öğrenilen sıralı marjinaller ve korelasyon Cholesky çarpanı."""
+
+    def __init__(self, sablon=SABLON):
+        ham = pd.read_csv(sablon)
+        ham.columns = ham.columns.str.strip()
+        self.sayisal = [s for s in SUTUNLAR if s not in ('ID', 'Il')]
+        X = ham[self.sayisal].apply(pd.to_numeric, errors='coerce')
+        self.marjinaller = [np.sort(X[s].dropna().to_numpy(dtype=float)) for s in self.sayisal]
+        self.isimler = ham['Il'].astype(str).tolist()
+
+        rho = X.rank().corr().to_numpy()
+        R = 2 * np.sin(np.pi * rho / 6)
+        # Pozitif tanımlılık için özdeğerler kırpılır
+        deger, vektor = np.linalg.eigh(R)
+        R = vektor @ np.diag(np.clip(deger, 1e-6, None)) @ vektor.T
+        d = np.sqrt(np.diag(R))
+        self.L = np.linalg.cholesky(R / np.outer(d, d))
+
+    def ornekle(self, n, rng, baslangic=0):
+        from scipy.special import ndtr  # standart normal CDF
+
+        z = rng.standard_normal((n, len(self.sayisal))) @ self.L.T
+        u = ndtr(z)
+        veri = {}
+        for k, (ad, marjinal) in enumerate(zip(self.sayisal, self.marjinaller)):
+            # Ampirik kuantil fonksiyonu: sıralı değerler arasında doğrusal enterpolasyon
+            konum = u[:, k] * (marjinal.size - 1)
+            veri[ad] = np.interp(konum, np.arange(marjinal.size), marjinal)
+        df = pd.DataFrame(veri)
+        for ad in TAMSAYI_SUTUNLARI:
+            df[ad] = np.round(df[ad]).astype(np.int64)
+        df['Nufus'] = np.round(df['Nufus'])
+        df['Elektrik'] = np.round(df['Elektrik'])
+        for ad in ('yıllık_ortalama_sicaklik', 'Issizlik'):
+            df[ad] = np.round(df[ad], 1)
+        df['Suc_Orani'] = np.round(df['Suc_Orani'], 2)
+
+        sira = np.arange(baslangic, baslangic + n)
+        df.insert(0, 'ID', [f'id_{i + 1}' for i in sira])
+        # İlk 81 satır gerçek il adları, sonrası "Ad-k" biçiminde ilçe benzeri adlar
+        isim_sayisi = len(self.isimler)
+        df.insert(1, 'Il', [self.isimler[i] if i < isim_sayisi else
+                            f'{self.isimler[i % isim_sayisi]}-{i // isim_sayisi}' for i in sira])
+        return df[SUTUNLAR]
+
+
+def il_verisi(n, tohum=42, sablon=SABLON, parca_boyutu=PARCA_BOYUTU):
+    """message.txt biçiminde n satırlık tablo (bellekte)."""
+    return pd.concat(list(il_verisi_parcalari(n, tohum, sablon, parca_boyutu)), ignore_index=True)
+
+
+def il_verisi_parcalari(n, tohum=42, sablon=SABLON, parca_boyutu=PARCA_BOYUTU):
+    """Tabloyu parça parça üretir (büyük boyutlar için bellek sınırlı)."""
+    model = KopulaModeli(sablon)
+    parca_sayisi = max(1, -(-n // parca_boyutu))
+    tohumlar = np.random.SeedSequence(tohum).spawn(parca_sayisi)
+    for k, t in enumerate(tohumlar):
+        bas = k * parca_boyutu
+        adet = min(parca_boyutu, n - bas)
+        yield model.ornekle(adet, np.random.default_rng(t), baslangic=bas)
+
+
+def il_verisi_yaz(yol, n, tohum=42, sablon=SABLON, parca_boyutu=PARCA_BOYUTU):
+    """Tabloyu parça parça CSV'ye yazar (yarım dosya kalmasın diye önce geçici dosyaya)."""
+    os.makedirs(os.path.dirname(os.path.abspath(yol)), exist_ok=True)
+    gecici = yol + '.tmp'
+    for k, parca in enumerate(il_verisi_parcalari(n, tohum, sablon, parca_boyutu)):
+        parca.to_csv(gecici, mode='w' if k == 0 else 'a', header=(k == 0), index=False)
+    os.replace(gecici, yol)
+    return yol
+
+
+def su_serisi(yil_sayisi=19, tohum=42, baslangic_yili=1994, sablon=None):
+    """
+    su_verisi.csv biçiminde seri: Yıl, Toplam_Su_Miktari_Bin_m3, Nüfus.
+    Nüfus artış hızı ile kişi başı tüketimin eğilimi ve gürültüsü şablon
+    dosyadan (varsayılan su_verisi.csv) öğrenilir.
+    """
+    sablon = sablon or os.path.join(DIZIN, 'su_verisi.csv')
+    gercek = pd.read_csv(sablon).sort_values('Yıl')
+    g_yil = gercek['Yıl'].to_numpy(float)
+    g_nufus = gercek['Nüfus'].to_numpy(float)
+    g_kisi = gercek['Toplam_Su_Miktari_Bin_m3'].to_numpy(float) * 1_000_000 / (g_nufus * 365)
+    buyume = np.polyfit(g_yil, np.log(g_nufus), 1)[0]
+    egim, kesisim = np.polyfit(g_yil, g_kisi, 1)
+    artik_std = float(np.std(g_kisi - (kesisim + egim * g_yil)))
+
+    rng = np.random.default_rng(tohum)
+    # Gerçek seri gibi 1-2 yıl arayla düzensiz yıllar
+    yillar = baslangic_yili + np.concatenate([[0], np.cumsum(rng.integers(1, 3, yil_sayisi - 1))])
+    # Uzun serilerde 40 yıllık dönem tekrarlanır: değerler taşmaz ve seri
+    # kırılma araması için gerçek kırılmalar içerir
+    donem = (yillar - baslangic_yili) % 40
+    nufus = g_nufus[0] * np.exp(buyume * donem) * rng.normal(1, 0.002, yil_sayisi)
+    kisi_basi = kesisim + egim * (baslangic_yili + donem) + rng.normal(0, artik_std, yil_sayisi)
+    toplam = kisi_basi * nufus * 365 / 1_000_000
+    return pd.DataFrame({'Yıl': yillar, 'Toplam_Su_Miktari_Bin_m3': np.round(toplam).astype(np.int64),
+                         'Nüfus': np.round(nufus).astype(np.int64)})
+
+
+def emisyon_serisi(yil_sayisi=23, tohum=42, baslangic_yili=2001, sablon=None):
+    """
+    emisyon_gsyh.csv biçiminde seri: Yil, Toplam_Emisyon, GSYH_Milyar_USD.
+    Kuznets eğrisi ve gürültü düzeyi şablon dosyadan (varsayılan
+    emisyon_gsyh.csv) öğrenilir.
+    """
+    sablon = sablon or os.path.join(DIZIN, 'emisyon_gsyh.csv')
+    gercek = pd.read_csv(sablon).dropna()
+    x, y = gercek['GSYH_Milyar_USD'].to_numpy(float), gercek['Toplam_Emisyon'].to_numpy(float)
+    katsayi = np.polyfit(x, y, 2)
+    artik_std = float(np.std(y - np.polyval(katsayi, x)))
+    log_fark = np.diff(np.log(x))
+
+    rng = np.random.default_rng(tohum)
+    # Log-rastgele yürüyüş; çok uzun serilerde GSYH gerçek aralığa geri yansıtılır
+    adimlar = rng.normal(log_fark.mean(), log_fark.std(), yil_sayisi - 1)
+    log_gsyh = np.log(x[0]) + np.concatenate([[0.0], np.cumsum(adimlar)])
+    alt, ust = np.log(x.min()), np.log(x.max() * 1.5)
+    genislik = ust - alt
+    log_gsyh = alt + np.abs(((log_gsyh - alt) + genislik) % (2 * genislik) - genislik)
+    gsyh = np.exp(log_gsyh)
+    emisyon = np.polyval(katsayi, gsyh) + rng.normal(0, artik_std, yil_sayisi)
+    return pd.DataFrame({'Yil': baslangic_yili + np.arange(yil_sayisi),
+                         'Toplam_Emisyon': np.round(emisyon, 1), 'GSYH_Milyar_USD': np.round(gsyh, 1)})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="message.txt / su_verisi / emisyon_gsyh biçiminde sentetik veri üretir.")
+    parser.add_argument('--satir', default='10k', help="İl tablosu satır sayısı (81, 10k, 1m, 10m ya da sayı)")
+    parser.add_argument('--yil', type=int, default=None, help="Seri uzunluğu (varsayılan: gerçek dosyalarla aynı)")
+    parser.add_argument('--tohum', type=int, default=42)
+    parser.add_argument('--cikti', default='sentetik', help="Çıktı klasörü")
+    args = parser.parse_args()
+
+    n = olcek_coz(args.satir)
+    yol = il_verisi_yaz(os.path.join(args.cikti, f'message_{args.satir}.txt'), n, args.tohum)
+    print(f"{yol}: {n:,} satır")
+    su = su_serisi(args.yil or 19, args.tohum)
+    su.to_csv(os.path.join(args.cikti, 'su_verisi.csv'), index=False)
+    emisyon = emisyon_serisi(args.yil or 23, args.tohum)
+    emisyon.to_csv(os.path.join(args.cikti, 'emisyon_gsyh.csv'), index=False)
+    print(f"{args.cikti}/su_verisi.csv: {len(su)} yıl, {args.cikti}/emisyon_gsyh.csv: {len(emisyon)} yıl")
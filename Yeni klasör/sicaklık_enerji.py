@@ -1,27 +1,24 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from scipy import stats
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
+from istatistik_cekirdek import dogrusal_regresyon
+from veri_yukleyici import veri_yukle
+from turetilmis_sutunlar import turet
+from aykiri_deger import aykiri_skorlari
+from regresyon_grafik import regresyon_ciz
+from etiket_yerlesimi import etiketle
+from grafik_cikti import goster
+from profil import bolum
 
 # =========================================================
 # 1. VERİ YÜKLEME VE BİLİMSEL HAZIRLIK
 # =========================================================
+bolum('VERİ YÜKLEME')
 try:
-    df = pd.read_csv('message.txt')
-    # Sütun isimlerini temizle
-    df.columns = df.columns.str.strip()
-    
-    # İsimleri standartlaştır
-    df = df.rename(columns={
-        'yıllık_ortalama_sicaklik': 'Sicaklik',
-        'Elektrik': 'Toplam_Enerji'
-    })
-    
-    # KRİTİK ADIM: Kişi Başına Enerji Tüketimi (Normalizasyon)
-    df['Kişi_Basi_Enerji'] = df['Toplam_Enerji'] / df['Nufus']
+    # Sütun temizleme ve standart isimler ortak yükleyiciden geliyor
+    df = veri_yukle('message.txt')
+
+    # KRİTİK ADIM: Kişi Başına Enerji Tüketimi (Normalizasyon) -> Elektrik / Nufus
+    df = turet(df, ['Kişi_Basi_Enerji'])
+    df = df.rename(columns={'Elektrik': 'Toplam_Enerji'})
 
     # Eksik verileri at
     df = df.dropna(subset=['Sicaklik', 'Kişi_Basi_Enerji'])
@@ -33,15 +30,21 @@ except FileNotFoundError:
 # =========================================================
 # 2. AYKIRI DEĞER ANALİZİ (OUTLIER DETECTION - Z-SCORE)
 # =========================================================
+bolum('HESAPLAMALAR', satir=len(df))
 # Ortalamadan 2 standart sapma sapanları yakala
-z_scores = stats.zscore(df['Kişi_Basi_Enerji'])
+# stats.zscore ile aynı: (x - ortalama) / std (ddof=0)
 threshold = 2
-df['Aykiri_Mi'] = np.abs(z_scores) > threshold
+z_sonuc = aykiri_skorlari(df['Kişi_Basi_Enerji'], 'z', esik=threshold)
+df['Aykiri_Mi'] = z_sonuc['aykiri']
 aykiri_sehirler = df[df['Aykiri_Mi'] == True]
 
+# Kontrol: z-skoru aykırı değerlerin kendisinden etkilenir; medyan/MAD değil
+mad_sonuc = aykiri_skorlari(df['Kişi_Basi_Enerji'], 'mad')
+
 # =========================================================
 # 3. BİLİMSEL ANALİZ MOTORU (RAPORLAMA)
 # =========================================================
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
 print("\n" + "="*65)
 print("             BİLİMSEL ANALİZ RAPORU (SICAKLIK vs ENERJİ)")
 print("="*65)
@@ -49,7 +52,9 @@ print("="*65)
 # A) KORELASYON
 x_col = 'Sicaklik'
 y_col = 'Kişi_Basi_Enerji'
-r_val, p_val = stats.pearsonr(df[x_col], df[y_col])
+# r, p ve regresyon katsayıları tek geçişte (istatistik_cekirdek.py)
+regresyon = dogrusal_regresyon(df[x_col], df[y_col])
+r_val, p_val = regresyon.r, regresyon.p
 
 print(f"[1] KORELASYON ANALİZİ:")
 print(f"    Katsayı (r): {r_val:.4f}")
@@ -63,31 +68,34 @@ print(f"\n[2] HİPOTEZ TESTİ (P-Value: {p_val:.5f}):")
 print(f"    Sonuç: İlişki istatistiksel olarak {durum}DİR.")
 
 # C) REGRESYON BAŞARISI (R2)
-X = df[[x_col]].values
-y = df[y_col].values
-model = LinearRegression()
-model.fit(X, y)
-r2 = r2_score(y, model.predict(X))
+r2 = regresyon.r2
 
 print(f"\n[3] REGRESYON BAŞARISI (R2):")
 print(f"    Değer: {r2:.4f}")
 print(f"    Açıklama: Enerji tüketiminin %{r2*100:.1f}'i sıcaklık ile açıklanabilir.")
+
+print(f"\n[4] AYKIRI DEĞERLER:")
+print(f"    Z-skoru (|z| > {threshold}): {', '.join(aykiri_sehirler['Il']) or 'yok'}")
+mad_aykiri = df.loc[mad_sonuc['aykiri'], 'Il']
+print(f"    Medyan/MAD (|skor| > 3.5): {', '.join(mad_aykiri) or 'yok'}")
 print("="*65 + "\n")
 
 # =========================================================
 # 4. GÖRSELLEŞTİRME (KORİDORLU & AYKIRI DEĞERLİ)
 # =========================================================
+bolum('GÖRSELLEŞTİRME', satir=len(df))
+import seaborn as sns  # yalnızca grafik çizilirken gerekli
+
 plt.figure(figsize=(12, 7))
 
 # A) ANA ANALİZ + KORİDOR (Güven Aralığı)
-# sns.regplot buradaki sihirli değnek.
-# ci=95 -> %95 Güven Aralığı (O gölgeli koridor)
+# %95 Güven Aralığı (o gölgeli koridor) yukarıdaki regresyondan kapalı formda
+# hesaplanır; regplot'un bootstrap'i gibi her çalıştırmada değişmez.
 # scatter_kws -> Mavi noktaların stili
 # line_kws -> Kırmızı çizginin stili
-sns.regplot(x='Sicaklik', y='Kişi_Basi_Enerji', data=df,
-            ci=95,  
-            scatter_kws={'s': 80, 'alpha': 0.6, 'color': 'tab:blue', 'label': 'Normal Şehirler'}, 
-            line_kws={'color': 'red', 'linewidth': 2, 'label': f'Trend ve %95 Güven Koridoru'})
+regresyon_ciz(regresyon, df[x_col], df[y_col], guven=0.95,
+              scatter_kws={'s': 80, 'alpha': 0.6, 'color': 'tab:blue', 'label': 'Normal Şehirler'},
+              line_kws={'color': 'red', 'linewidth': 2, 'label': f'Trend ve %95 Güven Koridoru'})
 
 # B) AYKIRI DEĞERLERİ ÜZERİNE ÇAK (Kırmızı X)
 # Koridorun ve mavi noktaların üstüne basması için zorder=5 verdim
@@ -95,10 +103,9 @@ sns.scatterplot(x=aykiri_sehirler['Sicaklik'], y=aykiri_sehirler['Kişi_Basi_Ene
                 s=200, color='red', marker='X', label='Aykırı Değerler (Outliers)', zorder=5)
 
 # C) AYKIRI ŞEHİRLERİN İSİMLERİ
-for i, row in aykiri_sehirler.iterrows():
-    # Yazıların noktaların üzerine binmemesi için hafif yukarı kaydırdım (+ değer ekleyerek)
-    plt.text(row['Sicaklik'], row['Kişi_Basi_Enerji'], f"  {row['Il']}", 
-             fontsize=11, fontweight='bold', color='darkred', va='center')
+# Yazılar noktaya ve birbirine binmeyecek şekilde yerleştirilir (en aykırı önce)
+etiketle(plt.gca(), aykiri_sehirler['Sicaklik'], aykiri_sehirler['Kişi_Basi_Enerji'], aykiri_sehirler['Il'],
+         oncelik=z_sonuc.loc[aykiri_sehirler.index, 'skor'].abs(), fontsize=11, fontweight='bold', color='darkred', kayma=2.5)
 
 # EKSEN VE BAŞLIK AYARLARI
 plt.title(f"Sıcaklık ve Enerji Analizi\n(Güven Aralığı ve Aykırı Değer Tespiti)", fontsize=14)
@@ -108,4 +115,4 @@ plt.grid(True, linestyle="--", alpha=0.5)
 plt.legend(loc='upper right')
 
 plt.tight_layout()
-plt.show()
\ No newline at end of file
+goster('sicaklik_enerji')
\ No newline at end of file
@@ -0,0 +1,377 @@
+import argparse
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+
+import numpy as np
+
+# ---------------------------------------------------------
+# İÇERİK ADRESLİ SONUÇ ÖNBELLEĞİ (DİSK, BOYUT SINIRLI LRU)
+# ---------------------------------------------------------
+# Zamanlayıcı veri klasöründeki herhangi bir dosya değişince bütün scriptleri
+# yeniden çalıştırıyor; analizlerin çoğu ise aynı girdileri görüyor. Bu modül
+# sonuçları girdi dizilerinin kendisiyle anahtarlar:
+#   anahtar = sha256(fonksiyon adı, sürüm, kod özeti, bütün argümanlar)
+# Diziler/Series/DataFrame'ler dtype, şekil, ham bayt (ve etiketler) olarak,
+# diğer parametreler (alfa, eşikler, özellik listesi, tohum ...) değer olarak
+# özete girer. Varsayılan değerler de dahil edilir; f(x, y) ile f(x=x, y=y)
+# aynı anahtarı verir. Kod özeti fonksiyonun ve çağırdığı aynı modüldeki
+# yardımcıların bayt kodu ile sabitlerinden çıkar; hesaplama değişince eski
+# kayıtlar elle sürüm artırmadan geçersizleşir (yorum/satır kayması etkilemez).
+# Sonuçlar .onbellek/sonuclar/<ilk 2 karakter>/<anahtar>.pkl altında tutulur.
+# Okunan dosyanın mtime'ı güncellenir; toplam boyut sınırı aşılınca en eski
+# erişilenler silinir (LRU). Toplam boyut ilk yazmada bir kez taranır, sonra
+# yazılan baytlarla güncellenir; dizin yalnızca sınır aşılınca yeniden taranır. Yazma geçici dosya + os.replace ile yapıldığı
+# için aynı anda çalışan süreçler birbirini bozmaz.
+#
+# Ortam değişkenleri:
+#   SONUC_ONBELLEGI=0            -> önbelleği kapatır
+#   SONUC_ONBELLEGI_DIZINI=yol   -> depolama dizini
+#   SONUC_ONBELLEGI_MB=256       -> boyut sınırı (MB)
+#
+# Anahtar için bütün girdi baytları özetlendiğinden yalnızca girdi boyutuna
+# göre pahalı hesaplamalar önbelleğe alınır: permütasyon/bootstrap, Kuznets
+# bootstrap'i, model araması, ağırlık duyarlılığı, O(n²) kırılma araması.
+# Kapalı form regresyon/korelasyon ve scipy testleri O(n)'dir; bunlarda
+# sha256 özeti yeniden hesaplamaktan pahalı olduğu için isabet bile kayıptır.
+
+ONBELLEK_DIZINI = '.onbellek'          # veri_yukleyici ile aynı kök
+ANAHTAR_SURUMU = 2
+VARSAYILAN_MB = 256
+
+_YOK = object()
+
+
+class _Ozetleyici:
+    """Argümanları kararlı bir bayt akışı olarak sha256'ya besler."""
+
+    def __init__(self):
+        self.h = hashlib.sha256()
+        self.eleman = 0
+
+    def _yaz(self, etiket, veri=b''):
+        self.h.update(etiket.encode() + b'\x00' + str(len(veri)).encode() + b'\x00')
+        self.h.update(veri)
+
+    def _dizi(self, a):
+        a = np.asarray(a)
+        self.eleman += a.size
+        if a.dtype.hasobject:
+            # Metin/karışık diziler: öğelerin repr'i
+            self._yaz(f'nd:O:{a.shape}', '\x1f'.join(map(repr, a.ravel().tolist())).encode())
+        else:
+            self._yaz(f'nd:{a.dtype.str}:{a.shape}', np.ascontiguousarray(a).tobytes())
+
+    def ekle(self, v):
+        if v is None or isinstance(v, (bool, int, float, complex, str, bytes)):
+            self._yaz(f'{type(v).__name__}:{v!r}')
+        elif isinstance(v, np.generic):
+            self._yaz(f'np:{v.dtype.str}:{v!r}')
+        elif isinstance(v, np.ndarray):
+            self._dizi(v)
+        elif type(v).__module__.startswith('pandas'):
+            self._pandas(v)
+        elif isinstance(v, tuple):
+            # NamedTuple'lar (ör. model_secimi.Gram) tip adıyla ayrışır
+            self._yaz(f'tuple:{type(v).__qualname__}:{len(v)}')
+            for o in v:
+                self.ekle(o)
+        elif isinstance(v, list):
+            self._yaz(f'list:{len(v)}')
+            for o in v:
+                self.ekle(o)
+        elif isinstance(v, dict):
+            self._yaz(f'dict:{len(v)}')
+            for k in sorted(v, key=repr):
+                self.ekle(k)
+                self.ekle(v[k])
+        elif isinstance(v, (set, frozenset)):
+            self._yaz(f'set:{len(v)}')
+            for o in sorted(v, key=repr):
+                self.ekle(o)
+        elif callable(v):
+            self._yaz(f'fn:{getattr(v, "__module__", "")}.{getattr(v, "__qualname__", repr(v))}')
+        else:
+            # Bilinmeyen nesneler: pickle baytları (pickle edilemezse TypeError)
+            try:
+                self._yaz(f'pkl:{type(v).__qualname__}', pickle.dumps(v, protocol=4))
+            except Exception as e:
+                raise TypeError(f"Önbellek anahtarı üretilemedi: {type(v).__name__}") from e
+
+    def _pandas(self, v):
+        import pandas as pd
+
+        if isinstance(v, pd.DataFrame):
+            self._yaz(f'df:{v.shape}')
+            self.ekle(v.index)
+            self.ekle(list(map(str, v.columns)))
+            for ad in v.columns:
+                self.ekle(v[ad])
+        elif isinstance(v, pd.Series):
+            self._yaz(f'seri:{v.name!r}:{v.dtype}')
+            self.ekle(v.index)
+            self._pandas_degerler(v.array)
+        elif isinstance(v, pd.Index):
+            if isinstance(v, pd.RangeIndex):
+                # RangeIndex'in bütün bilgisi başlangıç/bitiş/adım
+                self._yaz(f'range:{v.start}:{v.stop}:{v.step}')
+            else:
+                self._yaz(f'index:{v.dtype}')
+                self._pandas_degerler(v.array)
+        else:
+            self._yaz(f'pkl:{type(v).__qualname__}', pickle.dumps(v, protocol=4))
+
+    def _pandas_degerler(self, dizi):
+        import pandas as pd
+
+        if isinstance(dizi, pd.Categorical):
+            self._dizi(dizi.codes)
+            self._dizi(np.asarray(dizi.categories, dtype=object))
+        else:
+            self._dizi(np.asarray(dizi))
+
+    def sonuc(self):
+        return self.h.hexdigest()
+
+
+def _sabit_metni(sabit):
+    if inspect.iscode(sabit):
+        return 'kod'                      # iç içe kod nesneleri ayrıca eklenir (repr adres içerir)
+    if isinstance(sabit, frozenset):
+        # Küme sırası PYTHONHASHSEED'e bağlı
+        return 'frozenset(' + ','.join(sorted(map(repr, sabit))) + ')'
+    if isinstance(sabit, tuple):
+        return '(' + ','.join(map(_sabit_metni, sabit)) + ')'
+    return repr(sabit)
+
+
+def _kodu_ekle(kod, ozet, gorulen, genel, modul):
+    ozet.update(kod.co_code)
+    ozet.update('\x1f'.join(map(_sabit_metni, kod.co_consts)).encode())
+    ozet.update('\x1f'.join(kod.co_names).encode())
+    for sabit in kod.co_consts:
+        if inspect.iscode(sabit):
+            _kodu_ekle(sabit, ozet, gorulen, genel, modul)
+    # Aynı modülde tanımlı, adıyla çağrılan yardımcı fonksiyonlar da özete girer
+    for ad in kod.co_names:
+        nesne = genel.get(ad)
+        nesne = inspect.unwrap(nesne) if inspect.isfunction(nesne) else None
+        if nesne is not None and nesne.__module__ == modul and nesne not in gorulen:
+            gorulen.add(nesne)
+            _kodu_ekle(nesne.__code__, ozet, gorulen, nesne.__globals__, modul)
+
+
+def kod_ozeti(fonksiyon):
+    """Fonksiyonun ve çağırdığı aynı modüldeki yardımcıların bayt kodu özeti."""
+    fonksiyon = inspect.unwrap(fonksiyon)
+    ozet = hashlib.sha256()
+    _kodu_ekle(fonksiyon.__code__, ozet, {fonksiyon}, fonksiyon.__globals__, fonksiyon.__module__)
+    return ozet.hexdigest()[:16]
+
+
+def anahtar_hesapla(ad, degerler):
+    """(anahtar, toplam dizi eleman sayısı); degerler isim -> değer sözlüğü."""
+    ozet = _Ozetleyici()
+    ozet.ekle(ANAHTAR_SURUMU)
+    ozet.ekle(ad)
+    ozet.ekle(degerler)
+    return ozet.sonuc(), ozet.eleman
+
+
+class SonucOnbellegi:
+    """Dosya başına bir sonuç tutan, toplam boyutu sınırlı disk önbelleği."""
+
+    def __init__(self, dizin, azami_bayt=VARSAYILAN_MB * 1024 * 1024):
+        self.dizin = dizin
+        self.azami_bayt = azami_bayt
+        self.isabet = 0
+        self.kayip = 0
+        self._toplam = None               # bilinen toplam bayt (ilk yazmada taranır)
+
+    def _yol(self, anahtar):
+        return os.path.join(self.dizin, anahtar[:2], anahtar + '.pkl')
+
+    def oku(self, anahtar):
+        yol = self._yol(anahtar)
+        try:
+            with open(yol, 'rb') as f:
+                sonuc = pickle.load(f)
+        except FileNotFoundError:
+            self.kayip += 1
+            return _YOK
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Bozuk ya da eski sınıflara ait kayıt: sil ve yeniden hesapla
+            self.kayip += 1
+            try:
+                os.remove(yol)
+            except OSError:
+                pass
+            return _YOK
+        try:
+            os.utime(yol)                 # LRU için son erişim zamanı
+        except OSError:
+            pass
+        self.isabet += 1
+        return sonuc
+
+    def yaz(self, anahtar, sonuc):
+        yol = self._yol(anahtar)
+        try:
+            veri = pickle.dumps(sonuc, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False                  # pickle edilemeyen sonuçlar önbelleğe alınmaz
+        if len(veri) > self.azami_bayt:
+            return False
+        try:
+            os.makedirs(os.path.dirname(yol), exist_ok=True)
+            gecici = f"{yol}.{os.getpid()}.tmp"
+            with open(gecici, 'wb') as f:
+                f.write(veri)
+            os.replace(gecici, yol)
+        except OSError:
+            # Salt okunur dizinlerde önbellek yazılamaz; analiz yine de devam eder
+            return False
+        if self._toplam is None:
+            self._toplam = sum(b for _, b, _ in self.kayitlar())
+        else:
+            self._toplam += len(veri)
+        # Diğer süreçlerin yazdıkları ancak bir sonraki taramada görülür;
+        # sınır aşılınca budama dizini yeniden tarar ve toplamı düzeltir
+        if self._toplam > self.azami_bayt:
+            self.budama()
+        return True
+
+    def kayitlar(self):
+        """(yol, boyut, mtime) listesi."""
+        liste = []
+        if not os.path.isdir(self.dizin):
+            return liste
+        for alt in os.scandir(self.dizin):
+            if not alt.is_dir():
+                continue
+            for g in os.scandir(alt.path):
+                if g.name.endswith('.pkl'):
+                    try:
+                        d = g.stat()
+                    except OSError:
+                        continue
+                    liste.append((g.path, d.st_size, d.st_mtime_ns))
+        return liste
+
+    def budama(self, hedef_oran=0.9):
+        """Toplam boyut sınırı aşıldıysa en eski erişilenleri sınırın %90'ına inene kadar siler."""
+        kayitlar = self.kayitlar()
+        toplam = self._toplam = sum(b for _, b, _ in kayitlar)
+        if toplam <= self.azami_bayt:
+            return 0
+        silinen = 0
+        for yol, boyut, _ in sorted(kayitlar, key=lambda k: k[2]):
+            if toplam <= self.azami_bayt * hedef_oran:
+                break
+            try:
+                os.remove(yol)
+            except OSError:
+                continue
+            toplam -= boyut
+            silinen += 1
+        self._toplam = toplam
+        return silinen
+
+    def temizle(self):
+        for yol, _, _ in self.kayitlar():
+            try:
+                os.remove(yol)
+            except OSError:
+                pass
+        self._toplam = None
+
+    def durum(self):
+        kayitlar = self.kayitlar()
+        return {'dizin': self.dizin, 'kayit': len(kayitlar), 'bayt': sum(b for _, b, _ in kayitlar),
+                'azami_bayt': self.azami_bayt, 'isabet': self.isabet, 'kayip': self.kayip}
+
+
+_VARSAYILAN = None
+
+
+def varsayilan_onbellek():
+    """Ortam değişkenlerine göre süreç genelindeki önbellek (kapalıysa None)."""
+    global _VARSAYILAN
+    if os.environ.get('SONUC_ONBELLEGI', '1').strip().lower() in ('0', 'false', 'hayir', 'hayır'):
+        return None
+    dizin = os.environ.get('SONUC_ONBELLEGI_DIZINI') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), ONBELLEK_DIZINI, 'sonuclar')
+    azami = int(float(os.environ.get('SONUC_ONBELLEGI_MB', VARSAYILAN_MB)) * 1024 * 1024)
+    if _VARSAYILAN is None or _VARSAYILAN.dizin != dizin or _VARSAYILAN.azami_bayt != azami:
+        _VARSAYILAN = SonucOnbellegi(dizin, azami)
+    return _VARSAYILAN
+
+
+def _cagir(fonksiyon, ad, args, kwargs, surum, en_az_eleman, yoksay):
+    onbellek = varsayilan_onbellek()
+    if onbellek is None:
+        return fonksiyon(*args, **kwargs)
+    try:
+        baglanti = inspect.signature(fonksiyon).bind(*args, **kwargs)
+        baglanti.apply_defaults()
+        degerler = {k: v for k, v in baglanti.arguments.items() if k not in yoksay}
+    except (TypeError, ValueError):
+        # İmzası okunamayan (ör. C) fonksiyonlar: argümanlar olduğu gibi
+        degerler = {'args': args, 'kwargs': kwargs}
+    try:
+        anahtar, eleman = anahtar_hesapla(f'{ad}@{surum}', degerler)
+    except TypeError:
+        return fonksiyon(*args, **kwargs)
+    if eleman < en_az_eleman:
+        return fonksiyon(*args, **kwargs)
+
+    sonuc = onbellek.oku(anahtar)
+    if sonuc is _YOK:
+        sonuc = fonksiyon(*args, **kwargs)
+        onbellek.yaz(anahtar, sonuc)
+    return sonuc
+
+
+def onbellekli(surum=1, en_az_eleman=0, yoksay=()):
+    """
+    Fonksiyon sonucunu içerik adresli önbelleğe alan dekoratör. Fonksiyonun
+    (ve aynı modüldeki yardımcılarının) kod özeti anahtara kendiliğinden girer.
+    surum: kod özetinin göremediği değişikliklerde (başka modüldeki
+    yardımcılar, sonuç biçimi) artırılır. en_az_eleman: girdilerdeki toplam
+    dizi elemanı bunun altındaysa önbellek atlanır. yoksay: sonucu
+    etkilemeyen parametreler (ör. isci_sayisi).
+    """
+    def dekorator(fonksiyon):
+        ad = f'{fonksiyon.__module__}.{fonksiyon.__qualname__}'
+        kod = []                          # ilk çağrıda hesaplanır; yardımcılar o zaman tanımlı
+
+        @functools.wraps(fonksiyon)
+        def sarici(*args, **kwargs):
+            if not kod:
+                kod.append(kod_ozeti(fonksiyon))
+            return _cagir(fonksiyon, ad, args, kwargs, f'{surum}:{kod[0]}', en_az_eleman, yoksay)
+
+        sarici.onbelleksiz = fonksiyon
+        return sarici
+    return dekorator
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Sonuç önbelleğinin durumunu gösterir / temizler.")
+    parser.add_argument('--temizle', action='store_true', help="Bütün kayıtları siler")
+    parser.add_argument('--buda', action='store_true', help="Boyut sınırını aşan en eski kayıtları siler")
+    args = parser.parse_args()
+
+    onbellek = varsayilan_onbellek()
+    if onbellek is None:
+        print("Sonuç önbelleği kapalı (SONUC_ONBELLEGI=0).")
+        exit()
+    if args.temizle:
+        onbellek.temizle()
+    if args.buda:
+        print(f"Silinen kayıt: {onbellek.budama()}")
+    d = onbellek.durum()
+    print(json.dumps({k: d[k] for k in ('dizin', 'kayit', 'bayt', 'azami_bayt')}, ensure_ascii=False, indent=2))
@@ -1,17 +1,19 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import numpy as np
-from scipy import stats
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
+from istatistik_cekirdek import dogrusal_regresyon
+from veri_yukleyici import seri_yukle
+from zaman_serisi import kayan_regresyon, kirilma_noktasi, kirilma_noktalari
+from grafik_cikti import goster
+from profil import bolum
 
 # ==============================
 # 1. VERİ YÜKLEME VE HAZIRLIK
 # ==============================
+bolum('VERİ YÜKLEME')
 try:
     # CSV dosyasının çalıştığın klasörde olduğundan emin ol
-    df = pd.read_csv("su_verisi.csv")
+    df = seri_yukle("su_verisi.csv")
     df = df.sort_values("Yıl")
+    df_tum = df  # kırılma testi için filtresiz seri
     # 2008 öncesi veriler eksik/tutarsız olabilir diye filtreledim
     df = df[df["Yıl"] >= 2008].copy()
 except FileNotFoundError:
@@ -23,10 +25,12 @@ except FileNotFoundError:
 df["Kisi_Basi_Gunluk_Su_Litre"] = (
     df["Toplam_Su_Miktari_Bin_m3"] * 1_000_000
 ) / (df["Nüfus"] * 365)
+kisi_basi_tum = df_tum["Toplam_Su_Miktari_Bin_m3"] * 1_000_000 / (df_tum["Nüfus"] * 365)
 
 # ==============================
 # 2. BİLİMSEL ANALİZ MOTORU (GEÇMİŞ VERİ İÇİN)
 # ==============================
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
 print("\n" + "="*65)
 print("             BİLİMSEL ANALİZ RAPORU (GEÇMİŞ DÖNEM)")
 print("="*65)
@@ -35,7 +39,9 @@ print("="*65)
 x_col = 'Yıl'
 y_col = 'Kisi_Basi_Gunluk_Su_Litre'
 
-r_val, p_korelasyon = stats.pearsonr(df[x_col], df[y_col])
+# r, p ve regresyon katsayıları tek geçişte (istatistik_cekirdek.py)
+regresyon = dogrusal_regresyon(df[x_col], df[y_col])
+r_val, p_korelasyon = regresyon.r, regresyon.p
 
 print(f"[1] KORELASYON ANALİZİ:")
 print(f"    Katsayı (r): {r_val:.4f}")
@@ -51,21 +57,30 @@ print(f"    P-Value Değeri: {p_korelasyon:.6f}")
 print(f"    SONUÇ: Tespit edilen trend {durum}DIR.")
 
 # C) REGRESYON ANALİZİ (R-Kare - Mevcut Trend Eğilimi)
-X = df[[x_col]].values
-y = df[y_col].values
-model = LinearRegression()
-model.fit(X, y)
-r2 = r2_score(y, model.predict(X))
+r2 = regresyon.r2
 
 print(f"\n[3] REGRESYON PERFORMANSI:")
 print(f"    R-Kare (R2): {r2:.4f}")
 print(f"    Açıklama: Su tüketimindeki değişimin %{r2*100:.1f}'i zaman faktörü ile açıklanabilir.")
-print(f"    Model Denklemi: Tüketim = {model.intercept_:.2f} + ({model.coef_[0]:.4f} * Yıl)")
+print(f"    Model Denklemi: Tüketim = {regresyon.kesisim:.2f} + ({regresyon.egim:.4f} * Yıl)")
+
+# D) YAPISAL KIRILMA (2008 filtresi veriyle destekleniyor mu?)
+# Bütün seri (1994-2024, düzensiz yıl aralıklı) üzerinde her aday bölme taranır
+kirilma = kirilma_noktasi(df_tum["Yıl"], kisi_basi_tum)
+coklu = kirilma_noktalari(df_tum["Yıl"], kisi_basi_tum)
+kayan = kayan_regresyon(df_tum["Yıl"], kisi_basi_tum, pencere=10).dropna()
+
+print(f"\n[4] YAPISAL KIRILMA ({int(df_tum['Yıl'].min())}-{int(df_tum['Yıl'].max())}, tüm veri):")
+print(f"    En olası kırılma yılı: {kirilma['yil']:.0f} (Chow F = {kirilma['chow_f']:.2f}, p = {kirilma['p']:.6f})")
+print(f"    Çoklu kırılma (BIC): {', '.join(f'{y:.0f}' for y in coklu['yillar']) or 'yok'}")
+son = kayan.iloc[-1]
+print(f"    Son 10 yıllık pencere ({son['bas']:.0f}-{son['bit']:.0f}) eğimi: {son['egim']:.2f} L/yıl (r = {son['r']:.2f})")
 print("="*65 + "\n")
 
 # ==============================
 # 4. GÖRSELLEŞTİRME (SADELEŞTİRİLMİŞ)
 # ==============================
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 fig, ax1 = plt.subplots(figsize=(12, 7))
 
 # A) Gerçek Veri (Mavi Noktalar ve Çizgi)
@@ -73,7 +88,7 @@ ax1.plot(df["Yıl"], df["Kisi_Basi_Gunluk_Su_Litre"], marker="o", color="tab:blu
 
 # B) Regresyon Doğrusu (Kırmızı Tarihsel Trend)
 # Bu bir tahmin değil, mevcut verinin ortalamasını gösteren matematiksel çizgidir.
-regresyon_y = model.predict(X)
+regresyon_y = regresyon.tahmin(df[x_col])
 ax1.plot(df["Yıl"], regresyon_y, color="red", linestyle="-", linewidth=3, label=f"Genel Eğilim (Trend R2={r2:.2f})")
 
 # --- İPTAL EDİLEN YEŞİL ÇİZGİ ---
@@ -105,4 +120,4 @@ ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left", frameon=True, s
 plt.tight_layout()
 # Grafiği kaydetmek istersen aşağıdaki satırı açabilirsin:
 # plt.savefig("su_tuketim_analizi_sade.png", dpi=300)
-plt.show()
\ No newline at end of file
+goster('su_tuketim')
\ No newline at end of file
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Modüller script klasöründe düz adlarla içe aktarılıyor (ör. from aykiri_deger import ...)
+DIZIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DIZIN)
+
+# Testler diskteki sonuç önbelleğinden okumasın/yazmasın
+os.environ.setdefault('SONUC_ONBELLEGI', '0')
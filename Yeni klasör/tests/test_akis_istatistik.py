@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+import pytest
+
+from akis_istatistik import ENDEKSLER, EsMoment, Welford, akis_ozeti
+from aykiri_deger import KuantilTaslagi
+from istatistik_cekirdek import dogrusal_regresyon
+from turetilmis_sutunlar import turet
+from veri_yukleyici import veri_yukle
+
+VERI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'message.txt')
+
+# Scriptlerin tam bellekli hesabı: (dropna alt kümesi, x, y, aykırı kesim kuantili)
+SCRIPTLER = {
+    # Egitim_Fırsatı.py
+    'EFDE': (['Egitim', 'Gelir', 'Issizlik', 'Suc', 'Nufus'], 'EFDE', 'Egitim_Norm', None),
+    # baski_endeksi_analizi.py
+    'Baski_Endeksi': (['Kira', 'Gelir', 'Egitim', 'Issizlik', 'Suc', 'Nufus'], 'Baski_Endeksi', 'Kira', 0.95),
+    # işsizlik_eğitim_suc.py
+    'Ekonomik_Rahatlik': (['Gelir', 'Kira', 'Suc', 'Issizlik', 'Nufus'], 'Ekonomik_Rahatlik', 'Suc', None),
+}
+
+
+def _bellekte(ad):
+    alt_kume, x_col, y_col, kesim = SCRIPTLER[ad]
+    df = veri_yukle(VERI).dropna(subset=alt_kume)
+    df = turet(df, [c for c in (x_col, y_col) if c not in df.columns])
+    x, y = df[x_col].to_numpy(dtype=float), df[y_col].to_numpy(dtype=float)
+    if kesim is not None:
+        normal = x <= KuantilTaslagi().guncelle(df[x_col]).kuantil(kesim)
+        x, y = x[normal], y[normal]
+    return df[x_col], dogrusal_regresyon(x, y)
+
+
+def test_her_endeksin_script_karsiligi_var():
+    assert set(SCRIPTLER) == set(ENDEKSLER)
+
+
+@pytest.mark.parametrize('parca_boyutu', [7, 20, 100_000])
+@pytest.mark.parametrize('ad', sorted(SCRIPTLER))
+def test_akis_sonucu_scriptle_ayni(ad, parca_boyutu):
+    seri, beklenen = _bellekte(ad)
+    ozet = akis_ozeti(VERI, parca_boyutu)[ad]
+
+    assert ozet['n'] == len(seri)
+    assert ozet['ortalama'] == pytest.approx(seri.mean(), rel=1e-9)
+    assert ozet['std'] == pytest.approx(seri.std(), rel=1e-9)
+    assert ozet['n_korelasyon'] == beklenen.n
+    for alan in ('r', 'p', 'egim', 'kesisim'):
+        assert ozet[alan] == pytest.approx(getattr(beklenen, alan), rel=1e-9, abs=1e-12), alan
+
+
+def test_baski_endeksi_aykirilari_korelasyondan_cikarir():
+    ozet = akis_ozeti(VERI)['Baski_Endeksi']
+    assert ozet['kesim_siniri'] is not None
+    assert ozet['n_korelasyon'] < ozet['n']
+
+
+def test_birlestir_tek_parcayla_ayni():
+    rng = np.random.default_rng(3)
+    x, y = rng.normal(size=1000), rng.normal(size=1000)
+    parcali_w, parcali_e = Welford(), EsMoment()
+    for bas in range(0, 1000, 130):
+        parcali_w.birlestir(Welford().guncelle(x[bas:bas + 130]))
+        parcali_e.birlestir(EsMoment().guncelle(x[bas:bas + 130], y[bas:bas + 130]))
+    tek_w, tek_e = Welford().guncelle(x), EsMoment().guncelle(x, y)
+    assert parcali_w.varyans == pytest.approx(tek_w.varyans, rel=1e-12)
+    assert parcali_e.r == pytest.approx(tek_e.r, rel=1e-12)
+    assert parcali_e.egim == pytest.approx(tek_e.egim, rel=1e-12)
@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pytest
+
+from artimli_endeks import ArtimliEndeks
+from aykiri_deger import KuantilTaslagi
+from istatistik_cekirdek import dogrusal_regresyon
+from turetilmis_sutunlar import turet
+from veri_yukleyici import veri_yukle
+
+VERI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'message.txt')
+
+
+@pytest.fixture
+def df():
+    return veri_yukle(VERI)
+
+
+def _scriptler(df):
+    """Her çift için scriptlerin tam bellekli hesabı: çift -> (r, n)."""
+    sonuc = {}
+    efde = turet(df.dropna(subset=['Egitim', 'Gelir', 'Issizlik', 'Suc', 'Nufus']), ['Egitim_Norm', 'EFDE'])
+    r = dogrusal_regresyon(efde['EFDE'], efde['Egitim_Norm'])
+    sonuc['EFDE ~ Egitim_Norm'] = (r.r, r.n)
+
+    baski = turet(df.dropna(subset=['Kira', 'Gelir', 'Egitim', 'Issizlik', 'Suc', 'Nufus']), ['Baski_Endeksi'])
+    normal = baski['Baski_Endeksi'] <= KuantilTaslagi().guncelle(baski['Baski_Endeksi']).kuantil(0.95)
+    r = dogrusal_regresyon(baski.loc[normal, 'Baski_Endeksi'], baski.loc[normal, 'Kira'])
+    sonuc['Baski_Endeksi ~ Kira'] = (r.r, r.n)
+
+    sutunlar = ['Gelir', 'Egitim', 'Kira', 'Issizlik', 'Suc']
+    yasam = df.dropna(subset=sutunlar)
+    norm = (yasam[sutunlar] - yasam[sutunlar].min()) / (yasam[sutunlar].max() - yasam[sutunlar].min())
+    puan = (norm['Gelir'] + norm['Egitim']) - (norm['Kira'] + norm['Issizlik'] + norm['Suc'])
+    sonuc['Gelir ~ Yasam_Puan'] = (yasam['Gelir'].corr(puan), len(yasam))
+    return sonuc
+
+
+def _ayni(motor, beklenen):
+    # Scriptler float32 sütunlarla (Issizlik, Suc) hesaplar, motor float64 tutar
+    for cift, s in motor.korelasyonlar().items():
+        r, n = beklenen[cift]
+        assert s['n'] == n, cift
+        assert s['r'] == pytest.approx(r, abs=1e-7), cift
+
+
+def test_korelasyonlar_scriptlerle_ayni(df):
+    _ayni(ArtimliEndeks(df), _scriptler(df))
+
+
+def test_baski_kira_aykirilari_disarida_birakir(df):
+    motor = ArtimliEndeks(df)
+    kesim = motor.kesimler['Baski_Endeksi']
+    assert kesim.sinir == pytest.approx(np.quantile(motor.endeksler['Baski_Endeksi'], 0.95))
+    assert motor.korelasyonlar()['Baski_Endeksi ~ Kira']['n'] == kesim.normal.sum() < len(df)
+
+
+def test_duzeltmeden_sonra_scriptlerle_ayni(df):
+    motor = ArtimliEndeks(df)
+    motor.il_guncelle('Ankara', Kira=21000)
+    # Aykırı bir il sınırın altına iner: sınır ve korelasyona giren satırlar değişir
+    aykiri = motor.iller[np.argmax(motor.endeksler['Baski_Endeksi'])]
+    motor.il_guncelle(aykiri, Issizlik=5, Suc=0.1)
+    duzeltilmis = df.copy()
+    duzeltilmis.loc[duzeltilmis['Il'] == 'Ankara', 'Kira'] = 21000
+    duzeltilmis.loc[duzeltilmis['Il'] == aykiri, ['Issizlik', 'Suc']] = [5, 0.1]
+    _ayni(motor, _scriptler(duzeltilmis))
+
+
+def test_artimli_guncelleme_bastan_hesapla_ayni(df):
+    motor = ArtimliEndeks(df)
+    rng = np.random.default_rng(7)
+    for adim in range(400):
+        i = int(rng.integers(len(motor.iller)))
+        sutun = str(rng.choice(motor.SUTUNLAR))
+        v = motor.ham[sutun]
+        # Çoğu düzeltme aralık içinde kalır, bazıları min/max'ı değiştirir
+        alt, ust = (v.min() * 0.9, v.max() * 1.1) if adim % 10 == 0 else np.quantile(v, [0.05, 0.95])
+        motor.satir_guncelle(i, **{sutun: float(rng.uniform(alt, ust))})
+        if adim % 50 == 49:
+            bastan = ArtimliEndeks(motor.tablo())
+            kesim, beklenen = motor.kesimler['Baski_Endeksi'], bastan.kesimler['Baski_Endeksi']
+            assert kesim.sinir == beklenen.sinir
+            assert np.array_equal(kesim.normal, beklenen.normal)
+            assert np.array_equal(kesim.sirali, motor.endeksler['Baski_Endeksi'][kesim.sira])
+            for cift, s in motor.korelasyonlar().items():
+                b = bastan.korelasyonlar()[cift]
+                assert s['n'] == b['n'], cift
+                assert s['r'] == pytest.approx(b['r'], abs=1e-9), cift
+                assert s['egim'] == pytest.approx(b['egim'], rel=1e-9), cift
+    assert 0 < motor.tam_tarama_sayisi < 400
+
+
+def test_bilinmeyen_il_ve_sutun(df):
+    motor = ArtimliEndeks(df)
+    with pytest.raises(KeyError):
+        motor.il_guncelle('Atlantis', Kira=1)
+    with pytest.raises(KeyError):
+        motor.il_guncelle('Ankara', Nufus=1)
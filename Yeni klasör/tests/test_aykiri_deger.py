@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from aykiri_deger import KuantilTaslagi
+
+KUANTILLER = np.linspace(0.01, 0.99, 99)
+
+
+def _gercek_sira_hatasi(taslak, sirali):
+    """Taslağın kuantillerinin verideki gerçek sırası ile istenen sıra arasındaki en büyük fark."""
+    sira = np.searchsorted(sirali, taslak.kuantil(KUANTILLER)) / sirali.size
+    return float(np.abs(sira - KUANTILLER).max())
+
+
+@pytest.mark.parametrize('n', [10_000, 1_000_000, 10_000_000])
+def test_sira_hatasi_n_ile_buyumez(n):
+    x = np.random.default_rng(n).lognormal(0, 1, n)
+    taslak = KuantilTaslagi(k=200)
+    for bas in range(0, n, 100_000):
+        taslak.guncelle(x[bas:bas + 100_000])
+
+    hata = _gercek_sira_hatasi(taslak, np.sort(x))
+    assert hata <= taslak.sira_hatasi
+    # Bildirilen sınır ~O(1/k): n'den bağımsız
+    assert taslak.sira_hatasi < 4 / taslak.k
+    # Toplam kapasite ~3k öğe
+    assert sum(s.size for s in taslak.seviyeler) <= 3 * taslak.k + 2 * len(taslak.seviyeler)
+
+
+def test_kucuk_veride_kesin():
+    x = np.random.default_rng(0).normal(size=150)
+    taslak = KuantilTaslagi(k=200).guncelle(x)
+    assert taslak.sira_hatasi == 0.0
+    assert taslak.kuantil(0.95) == pytest.approx(np.quantile(x, 0.95))
+
+
+def test_birlestir_tek_taslakla_ayni_hata_sinifinda():
+    x = np.random.default_rng(1).exponential(size=1_000_000)
+    parcalar = [KuantilTaslagi(tohum=i).guncelle(p) for i, p in enumerate(np.array_split(x, 8))]
+    toplam = parcalar[0]
+    for p in parcalar[1:]:
+        toplam.birlestir(p)
+    assert toplam.n == x.size
+    assert _gercek_sira_hatasi(toplam, np.sort(x)) <= toplam.sira_hatasi < 4 / toplam.k
@@ -0,0 +1,124 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from segmentasyon import esik_hesapla, segment_ata
+from veri_yukleyici import veri_yukle
+
+VERI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'message.txt')
+
+ETIKETLER = {(True, True): 'YY', (True, False): 'YD', (False, True): 'DY', (False, False): 'DD'}
+
+# 4 Bölgeli Karar Matrisi.py ve işsizlik_eğitim_suc.py'deki tablolar
+KATEGORI_TABLOSU = {
+    (True, False): 'İdeal (Zengin & Güvenli)',
+    (True, True): 'Riskli Cazibe (Zengin ama Tehlikeli)',
+    (False, False): 'Mütevazı Liman (Fakir ama Güvenli)',
+    (False, True): 'Alarm Veren (Fakir & Tehlikeli)',
+}
+BOLGE_TABLOSU = {
+    (True, False): "Yüksek Rahatlık & Düşük Suç (İDEAL)",
+    (False, True): "Düşük Rahatlık & Yüksek Suç (RİSKLİ)",
+    (True, True): "Pahalı ve Sorunlu Rahatlık (ÇELİŞKİLİ)",
+    (False, False): "Gelişime Açık (PASİF)",
+}
+
+
+def test_esige_esit_deger_esit_yuksek_ile_belirlenir():
+    # Ortalama 2: ortadaki değer tam eşikte
+    x = pd.Series([1.0, 2.0, 3.0])
+    y = pd.Series([5.0, 5.0, 5.0])
+    yuksek, _ = segment_ata(x, y, ETIKETLER, x_esit_yuksek=True, y_esit_yuksek=True)
+    dusuk, _ = segment_ata(x, y, ETIKETLER, x_esit_yuksek=False, y_esit_yuksek=False)
+    assert list(yuksek) == ['DY', 'YY', 'YY']
+    assert list(dusuk) == ['DD', 'DD', 'YD']
+
+
+def test_nan_satir_nan_kategori_alir_ve_esigi_etkilemez():
+    x = pd.Series([1.0, np.nan, 3.0, 4.0], index=[10, 11, 12, 13])
+    y = pd.Series([1.0, 2.0, np.nan, 3.0], index=[10, 11, 12, 13])
+    segment, (x_esik, y_esik) = segment_ata(x, y, ETIKETLER)
+    assert (x_esik, y_esik) == (pytest.approx(8 / 3), 2.0)
+    assert segment.isna().tolist() == [False, True, True, False]
+    assert segment.index.tolist() == [10, 11, 12, 13]
+    assert list(segment.cat.categories) == ['YY', 'YD', 'DY', 'DD']
+    assert segment[10] == 'DD' and segment[13] == 'YY'
+
+
+@pytest.mark.parametrize('esik, beklenen', [
+    ('ortalama', 4.0),
+    ('medyan', 2.5),
+    (3, 3.0),
+    (np.float32(1.5), 1.5),
+])
+def test_esik_turleri(esik, beklenen):
+    x = pd.Series([1.0, 2.0, 3.0, 10.0])
+    assert esik_hesapla(x.to_numpy(), esik) == pytest.approx(beklenen)
+    segment, (x_esik, _) = segment_ata(x, x, ETIKETLER, x_esik=esik, y_esik=0)
+    assert x_esik == pytest.approx(beklenen)
+    assert list(segment) == ['YY' if v >= beklenen else 'DY' for v in x]
+
+
+def test_bilinmeyen_esik_ve_eksik_etiket():
+    x = pd.Series([1.0, 2.0])
+    with pytest.raises(ValueError):
+        segment_ata(x, x, ETIKETLER, x_esik='mod')
+    with pytest.raises(ValueError):
+        segment_ata(x, x, {(True, True): 'YY'})
+
+
+def _kategori_belirle(df, avg_tasarruf, avg_suc):
+    # 4 Bölgeli Karar Matrisi.py'nin eski satır satır sınıflandırması
+    def kategori_belirle(row):
+        if row['Tasarruf'] >= avg_tasarruf and row['Suc_Orani'] <= avg_suc:
+            return 'İdeal (Zengin & Güvenli)'
+        elif row['Tasarruf'] >= avg_tasarruf and row['Suc_Orani'] > avg_suc:
+            return 'Riskli Cazibe (Zengin ama Tehlikeli)'
+        elif row['Tasarruf'] < avg_tasarruf and row['Suc_Orani'] <= avg_suc:
+            return 'Mütevazı Liman (Fakir ama Güvenli)'
+        else:
+            return 'Alarm Veren (Fakir & Tehlikeli)'
+    return df.apply(kategori_belirle, axis=1)
+
+
+def _rahatlik_bolge_belirle(df, ort_skor, ort_suc):
+    # işsizlik_eğitim_suc.py'nin eski satır satır sınıflandırması
+    def rahatlik_bolge_belirle(row):
+        if row['Ekonomik_Rahatlik'] >= ort_skor and row['Suc'] < ort_suc:
+            return "Yüksek Rahatlık & Düşük Suç (İDEAL)"
+        elif row['Ekonomik_Rahatlik'] < ort_skor and row['Suc'] >= ort_suc:
+            return "Düşük Rahatlık & Yüksek Suç (RİSKLİ)"
+        elif row['Ekonomik_Rahatlik'] >= ort_skor and row['Suc'] >= ort_suc:
+            return "Pahalı ve Sorunlu Rahatlık (ÇELİŞKİLİ)"
+        else:
+            return "Gelişime Açık (PASİF)"
+    return df.apply(rahatlik_bolge_belirle, axis=1)
+
+
+def test_kategori_belirle_ile_ayni():
+    df = veri_yukle(VERI)
+    df = pd.DataFrame({'Tasarruf': (df['Gelir'] - df['Kira']).astype(float), 'Suc_Orani': df['Suc'].astype(float)})
+    segment, (avg_tasarruf, avg_suc) = segment_ata(
+        df['Tasarruf'], df['Suc_Orani'], KATEGORI_TABLOSU,
+        x_esik='ortalama', y_esik='ortalama', x_esit_yuksek=True, y_esit_yuksek=False)
+    eski = _kategori_belirle(df, df['Tasarruf'].mean(), df['Suc_Orani'].mean())
+    assert (avg_tasarruf, avg_suc) == (pytest.approx(df['Tasarruf'].mean()), pytest.approx(df['Suc_Orani'].mean()))
+    assert segment.astype(str).tolist() == eski.tolist()
+    assert eski.nunique() == 4
+
+
+def test_rahatlik_bolge_belirle_ile_ayni():
+    df = veri_yukle(VERI).dropna(subset=['Gelir', 'Kira', 'Suc', 'Issizlik', 'Nufus'])
+    # Eski scriptteki hesap (turet öncesi)
+    gelir_norm = (df['Gelir'] - df['Gelir'].min()) / (df['Gelir'].max() - df['Gelir'].min() + 1e-6)
+    df = pd.DataFrame({'Ekonomik_Rahatlik': (gelir_norm / (df['Kira'] * df['Issizlik'] + 1e-6)).astype(float),
+                       'Suc': df['Suc'].astype(float)})
+    segment, _ = segment_ata(
+        df['Ekonomik_Rahatlik'], df['Suc'], BOLGE_TABLOSU,
+        x_esik='ortalama', y_esik='ortalama', x_esit_yuksek=True, y_esit_yuksek=True)
+    eski = _rahatlik_bolge_belirle(df, df['Ekonomik_Rahatlik'].mean(), df['Suc'].mean())
+    assert segment.astype(str).tolist() == eski.tolist()
+    # message.txt'de dört bölgenin de dolu olduğu bir karşılaştırma olsun
+    assert eski.nunique() == 4
@@ -0,0 +1,46 @@
+import types
+
+import numpy as np
+
+from sonuc_onbellegi import SonucOnbellegi, kod_ozeti, onbellekli
+
+
+def _modul(kaynak):
+    """Kaynaktan geçici bir modül; fonksiyonların __module__'ü ortak olur."""
+    modul = types.ModuleType('gecici_modul')
+    exec(kaynak, modul.__dict__)
+    return modul
+
+
+def test_kod_ozeti_yardimci_degisince_degisir():
+    eski = _modul("def _parti(n):\n    return 10_000\n\ndef hesapla(n):\n    return _parti(n)\n")
+    yeni = _modul("def _parti(n):\n    return max(1, 2**26 // (16 * n))\n\ndef hesapla(n):\n    return _parti(n)\n")
+    assert kod_ozeti(eski.hesapla) != kod_ozeti(yeni.hesapla)
+
+
+def test_kod_ozeti_yorum_ve_satir_kaymasindan_etkilenmez():
+    a = _modul("def hesapla(x):\n    return x * 2\n")
+    b = _modul("# açıklama\n\n\ndef hesapla(x):\n    # iki katı\n    return x * 2\n")
+    assert kod_ozeti(a.hesapla) == kod_ozeti(b.hesapla)
+
+
+def test_kod_degisince_eski_kayit_kullanilmaz(tmp_path, monkeypatch):
+    monkeypatch.setenv('SONUC_ONBELLEGI', '1')
+    monkeypatch.setenv('SONUC_ONBELLEGI_DIZINI', str(tmp_path))
+    x = np.arange(10.0)
+    eski = onbellekli()(_modul("def f(x):\n    return float(x.sum())\n").f)
+    yeni = onbellekli()(_modul("def f(x):\n    return float(x.mean())\n").f)
+    assert eski(x) == 45.0
+    assert yeni(x) == 4.5
+
+
+def test_budama_yalnizca_sinir_asilinca_tarar(tmp_path, monkeypatch):
+    onbellek = SonucOnbellegi(str(tmp_path), azami_bayt=20_000)
+    taramalar = []
+    asil = SonucOnbellegi.kayitlar
+    monkeypatch.setattr(SonucOnbellegi, 'kayitlar', lambda self: taramalar.append(1) or asil(self))
+    for i in range(40):
+        onbellek.yaz(f'{i:064x}', b'x' * 1_000)
+    # İlk yazmada bir tarama, sonra yalnızca sınırı aşan yazmalarda
+    assert len(taramalar) < 10
+    assert sum(b for _, b, _ in asil(onbellek)) <= onbellek.azami_bayt
@@ -0,0 +1,44 @@
+import numpy as np
+
+from yogunluk_grafigi import altigen_kutula
+
+
+def _en_yakin_merkez(merkezler, adim, nokta):
+    """Altıgen ölçeğinde (y ekseni sqrt(3) ile) noktaya en yakın merkez."""
+    sx, sy = adim
+    d = ((merkezler[:, 0] - nokta[0]) / sx) ** 2 + 3.0 * ((merkezler[:, 1] - nokta[1]) / sy) ** 2
+    return merkezler[np.argmin(d)]
+
+
+def test_kenardaki_nokta_sonraki_satira_tasmaz():
+    # kutu=10 -> nx=10, ny=6; (10, 5.833) sağ kenarda, v=3.5
+    x, y = np.array([10.0]), np.array([35 / 6])
+    merkezler, toplam, _, (sx, sy) = altigen_kutula(x, y, kutu=10, x_aralik=(0, 10), y_aralik=(0, 10))
+    assert toplam.tolist() == [1.0]
+    cx, cy = merkezler[0]
+    # Eskiden (0.5, 7.5) kutusuna düşüyordu: ızgaranın öbür ucu
+    assert abs(cx - x[0]) <= sx and abs(cy - y[0]) <= sy
+
+
+def test_kenar_noktalari_kendi_kutusunda():
+    kenar = np.linspace(0, 10, 61)
+    x = np.concatenate([kenar, np.full(61, 10.0), kenar, np.zeros(61)])
+    y = np.concatenate([np.zeros(61), kenar, np.full(61, 10.0), kenar])
+    merkezler, toplam, _, adim = altigen_kutula(x, y, kutu=10, x_aralik=(0, 10), y_aralik=(0, 10))
+    assert toplam.sum() == x.size
+    # Her nokta dolu kutular arasında kendisine en yakın merkeze yakın olmalı
+    for nokta in zip(x, y):
+        m = _en_yakin_merkez(merkezler, adim, nokta)
+        assert abs(m[0] - nokta[0]) <= adim[0] and abs(m[1] - nokta[1]) <= adim[1]
+
+
+def test_ic_noktalar_en_yakin_merkezin_kutusunda():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 10, 5000), rng.uniform(0, 10, 5000)
+    merkezler, toplam, _, adim = altigen_kutula(x, y, kutu=10, x_aralik=(0, 10), y_aralik=(0, 10))
+    assert toplam.sum() == x.size
+    # Her nokta kendisine en yakın ızgara merkezinin kutusunda sayılır
+    tek = [altigen_kutula(x[i:i + 1], y[i:i + 1], kutu=10, x_aralik=(0, 10), y_aralik=(0, 10))[0][0]
+           for i in range(0, 5000, 250)]
+    for i, m in zip(range(0, 5000, 250), tek):
+        assert np.allclose(m, _en_yakin_merkez(merkezler, adim, (x[i], y[i])))
@@ -0,0 +1,186 @@
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import profil
+from veri_yukleyici import bellege_al, veri_yukle
+from turetilmis_sutunlar import tumunu_turet
+
+# ---------------------------------------------------------
+# TOPLU ÇALIŞTIRICI (GECE RAPORU)
+# ---------------------------------------------------------
+# Bütün analiz scriptlerini tek komutla çalıştırır:
+#   1. message.txt bir kez yüklenir ve bütün türetilmiş sütunlar
+#      (Gelir_Norm, EFDE, Tasarruf, Barinma_Yuku ...) bir kez hesaplanır.
+#   2. Hazır tablo süreç içi belleğe alınır; scriptlerdeki veri_yukle()
+#      ve turet() çağrıları bunu yeniden hesaplamadan kullanır.
+#   3. Birbirinden bağımsız analizler bir süreç havuzunda paralel çalışır.
+# Linux'ta işçiler 'fork' ile başlatıldığı için hazır tabloyu kopyalamadan
+# devralır; 'spawn' kullanan sistemlerde her işçi snapshot'tan yükler.
+#
+# --cikti verildiğinde grafikler (grafik_cikti.goster) pencere açılmadan
+# dosyaya yazılır; her script kendi işçisinde çizildiği için grafikler de
+# paralel üretilir.
+#
+# --profil verildiğinde (ya da ANALIZ_PROFIL=1) her scriptin bölüm/adım
+# ölçümleri (bkz. profil.py) işçilerden toplanır, tek bir iz dosyasına yazılır
+# ve özet tablo raporun sonuna eklenir.
+#
+# Kullanım: python toplu_calistir.py [--isci 4] [--sadece Egitim_Fırsatı.py ...]
+#                                    [--cikti grafikler --format png,svg --dpi 200]
+#                                    [--profil]
+
+DIZIN = os.path.dirname(os.path.abspath(__file__))
+VERI_DOSYASI = 'message.txt'
+
+ANALIZLER = [
+    '4 Bölgeli Karar Matrisi.py',
+    'BarınmaYükü.py',
+    'Egitim_Fırsatı.py',
+    'Geliri_En_Çok_Etkileyen.py',
+    'Nüfus_Tahmin.py',
+    'baski_endeksi_analizi.py',
+    'emisyon_gsyh_analizi.py',
+    'işsizlik_eğitim_suc.py',
+    'sicaklık_enerji.py',
+    'su_tuketim_analizi.py',
+    'yaşam_kalite_endeksi.py',
+]
+
+
+def veriyi_hazirla(yol=VERI_DOSYASI):
+    """Tabloyu bir kez yükler, türetilmiş sütunları ekler ve belleğe alır."""
+    with profil.asama('veriyi_hazirla') as a:
+        df = tumunu_turet(veri_yukle(yol))
+        bellege_al(yol, df)
+        a.satir = len(df)
+    return df
+
+
+def analiz_calistir(script):
+    """
+    Bir scripti bu süreçte __main__ olarak çalıştırır.
+    Dönüş: (script, çıktı metni, süre (sn), hata metni veya None, profil kayıtları)
+    """
+    cikti = io.StringIO()
+    hata = None
+    # Yalnızca bu scriptin kayıtları döner (fork ile devralınanlar hariç)
+    ilk_kayit = profil.kayit_sayisi()
+    profil.betik_ayarla(script)
+    baslangic = time.perf_counter()
+    with contextlib.redirect_stdout(cikti), contextlib.redirect_stderr(cikti):
+        try:
+            runpy.run_path(os.path.join(DIZIN, script), run_name='__main__')
+        except SystemExit as e:
+            # Scriptler dosya bulunamayınca exit() çağırıyor
+            if e.code not in (None, 0):
+                hata = f"exit({e.code})"
+        except Exception:
+            hata = traceback.format_exc()
+        finally:
+            if 'matplotlib.pyplot' in sys.modules:
+                sys.modules['matplotlib.pyplot'].close('all')
+    sure = time.perf_counter() - baslangic
+    return script, cikti.getvalue(), sure, hata, profil.kayitlari_al(ilk_kayit)
+
+
+def _kutuphaneleri_isit():
+    # 'fork' ile başlayan işçiler bu modülleri hazır devralır; her script
+    # için scipy/sklearn/seaborn içe aktarma süresi tekrar ödenmez.
+    for modul in ('matplotlib.pyplot', 'seaborn', 'scipy.stats', 'sklearn.linear_model'):
+        try:
+            __import__(modul)
+        except ImportError:
+            pass
+
+
+def _havuz_baglami():
+    yontemler = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('fork' if 'fork' in yontemler else 'spawn')
+
+
+def toplu_calistir(scriptler=ANALIZLER, isci_sayisi=None):
+    """Scriptleri paralel çalıştırır; sonuçları verilen sırayla döndürür."""
+    os.chdir(DIZIN)
+    # İşçilerde plt.show() bloklamasın; pencere açmayan arka uç
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    veriyi_hazirla()
+
+    if isci_sayisi == 1:
+        return [analiz_calistir(s) for s in scriptler]
+    baglam = _havuz_baglami()
+    if baglam.get_start_method() == 'fork':
+        _kutuphaneleri_isit()
+    with ProcessPoolExecutor(max_workers=isci_sayisi, mp_context=baglam) as havuz:
+        return list(havuz.map(analiz_calistir, scriptler))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bütün analizleri tek süreçte, paylaşılan veriyle çalıştırır.")
+    parser.add_argument('--isci', type=int, default=None, help="Süreç havuzundaki işçi sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--sadece', nargs='+', metavar='SCRIPT', help="Yalnızca bu scriptleri çalıştır")
+    parser.add_argument('--cikti', metavar='DIZIN', help="Grafikleri bu klasöre kaydet (başsız mod)")
+    parser.add_argument('--format', default=None, help="Grafik formatları, ör. png,svg (varsayılan: png)")
+    parser.add_argument('--dpi', type=int, default=None, help="Grafik çözünürlüğü (varsayılan: 150)")
+    parser.add_argument('--profil', action='store_true', help="Bölüm/adım süre ve bellek profili çıkar (bkz. profil.py)")
+    args = parser.parse_args(argv)
+
+    # İşçi süreçler ortam değişkenlerini devralır (bkz. grafik_cikti.py)
+    if args.cikti:
+        os.environ['GRAFIK_DIZINI'] = os.path.abspath(args.cikti)
+    if args.format:
+        os.environ['GRAFIK_FORMAT'] = args.format
+    if args.dpi:
+        os.environ['GRAFIK_DPI'] = str(args.dpi)
+    if args.profil:
+        profil.etkinlestir()
+
+    scriptler = args.sadece or ANALIZLER
+    bilinmeyen = [s for s in scriptler if not os.path.exists(os.path.join(DIZIN, s))]
+    if bilinmeyen:
+        print(f"HATA: Script(ler) bulunamadı: {', '.join(bilinmeyen)}")
+        return 1
+
+    toplam_baslangic = time.perf_counter()
+    try:
+        sonuclar = toplu_calistir(scriptler, args.isci)
+    except FileNotFoundError:
+        print(f"HATA: {VERI_DOSYASI} dosyası bulunamadı.")
+        return 1
+
+    for script, cikti, _, hata, _ in sonuclar:
+        print("\n" + "#" * 65)
+        print(f"# {script}")
+        print("#" * 65)
+        print(cikti.rstrip())
+        if hata:
+            print(f"!!! HATA: {hata}")
+
+    print("\n" + "=" * 65)
+    print("                 TOPLU ÇALIŞTIRMA ÖZETİ")
+    print("=" * 65)
+    for script, _, sure, hata, _ in sonuclar:
+        durum = "HATA" if hata else "TAMAM"
+        print(f"{script:<40} {sure:>8.2f} sn   {durum}")
+    print("-" * 65)
+    print(f"{'Toplam (duvar saati)':<40} {time.perf_counter() - toplam_baslangic:>8.2f} sn")
+    print("=" * 65)
+
+    if profil.acik_mi():
+        kayitlar = profil.kayitlari_al() + [k for s in sonuclar for k in s[4]]
+        yol = profil.rapor_yaz(kayitlar, os.path.join(DIZIN, profil.PROFIL_DIZINI,
+                                                       f"toplu_{time.strftime('%Y%m%d_%H%M%S')}.json"))
+        print("\n" + profil.ozet_tablosu(kayitlar))
+        print(f"Profil izi: {yol}")
+    return 1 if any(s[3] for s in sonuclar) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
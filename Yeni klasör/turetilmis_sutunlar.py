@@ -0,0 +1,102 @@
+import pandas as pd
+
+# ---------------------------------------------------------
+# TÜRETİLMİŞ SÜTUN GRAFİĞİ
+# ---------------------------------------------------------
+# Birden fazla scriptte ayrı ayrı hesaplanan sütunlar (Gelir_Norm,
+# Egitim_Norm, EFDE, Tasarruf, Barinma_Yuku ...) tek yerde tanımlanır.
+# Her sütun bağımlılıklarıyla birlikte kaydedilir; turet() istenen sütunları
+# bağımlılık sırasına göre ve her birini yalnızca bir kez hesaplar.
+# Tabloda zaten bulunan sütunlar (ör. toplu çalıştırıcının önceden
+# hesapladıkları) yeniden hesaplanmaz.
+
+
+def normalize(column):
+    # baski_endeksi_analizi.py'deki normalize() ile aynı (+1e-6 sıfıra bölmeyi önler)
+    return (column - column.min()) / (column.max() - column.min() + 1e-6)
+
+
+# ad -> (bağımlılıklar, hesaplama fonksiyonu)
+TURETILMIS = {
+    'Gelir_Norm': (['Gelir'], lambda df: normalize(df['Gelir'])),
+    'Egitim_Norm': (['Egitim'], lambda df: normalize(df['Egitim'])),
+    # Egitim_Fırsatı.py: Ekonomik Fırsat Doğurganlık Endeksi
+    'EFDE': (['Gelir_Norm', 'Issizlik', 'Suc'],
+             lambda df: df['Gelir_Norm'] / (df['Issizlik'] + df['Suc'] + 1e-6)),
+    # baski_endeksi_analizi.py: Sosyal baskı / Sosyal refah
+    'Baski_Endeksi': (['Issizlik', 'Suc', 'Gelir_Norm', 'Egitim_Norm'],
+                      lambda df: (df['Issizlik'] + df['Suc']) / (df['Gelir_Norm'] + df['Egitim_Norm'] + 0.1)),
+    # işsizlik_eğitim_suc.py
+    'Ekonomik_Rahatlik': (['Gelir_Norm', 'Kira', 'Issizlik'],
+                          lambda df: df['Gelir_Norm'] / (df['Kira'] * df['Issizlik'] + 1e-6)),
+    # 4 Bölgeli Karar Matrisi.py
+    'Tasarruf': (['Gelir', 'Kira'], lambda df: df['Gelir'] - df['Kira']),
+    # BarınmaYükü.py: Kira / Maaş oranı (%)
+    'Barinma_Yuku': (['Kira', 'Gelir'], lambda df: (df['Kira'] / df['Gelir']) * 100),
+    # sicaklık_enerji.py: Kişi başına enerji tüketimi
+    'Kişi_Basi_Enerji': (['Elektrik', 'Nufus'], lambda df: df['Elektrik'] / df['Nufus']),
+}
+
+
+def hesaplama_sirasi(isimler, grafik=TURETILMIS):
+    """İstenen sütunlar ve bağımlılıkları için topolojik hesaplama sırası."""
+    sira, ziyaret, yolda = [], set(), set()
+
+    def ziyaret_et(ad):
+        if ad in ziyaret or ad not in grafik:
+            return
+        if ad in yolda:
+            raise ValueError(f"Türetilmiş sütunlarda döngüsel bağımlılık: {ad}")
+        yolda.add(ad)
+        for bagimlilik in grafik[ad][0]:
+            ziyaret_et(bagimlilik)
+        yolda.discard(ad)
+        ziyaret.add(ad)
+        sira.append(ad)
+
+    for ad in isimler:
+        if ad not in grafik:
+            raise KeyError(f"Tanımsız türetilmiş sütun: {ad}")
+        ziyaret_et(ad)
+    return sira
+
+
+def turet(df, isimler, grafik=TURETILMIS):
+    """
+    İstenen türetilmiş sütunları df'e ekler (yerinde) ve df'i döndürür.
+
+    Normalizasyonlar tablodaki satır kümesine bağlıdır. Sütunlar önceden
+    hesaplandıktan sonra satır silinmişse (ör. dropna) kayıtlı satır sayısı
+    tutmaz ve istenen sütunlar yeniden hesaplanır.
+    """
+    kayit = dict(df.attrs.get('turetilmis', {}))
+    sira = hesaplama_sirasi(isimler, grafik)
+    yenilenen = set()
+    for ad in sira:
+        guncel = ad in df.columns and kayit.get(ad) == len(df)
+        if guncel and not yenilenen.intersection(grafik[ad][0]):
+            continue
+        deger = grafik[ad][1](df)
+        if pd.api.types.is_extension_array_dtype(deger.dtype) and pd.api.types.is_float_dtype(deger.dtype):
+            # Int32 şema sütunlarından çıkan oranlar (Float64) düz float64 tutulur
+            deger = deger.astype('float64')
+        df[ad] = deger
+        kayit[ad] = len(df)
+        yenilenen.add(ad)
+    df.attrs['turetilmis'] = kayit
+    return df
+
+
+def tumunu_turet(df, grafik=TURETILMIS):
+    """Girdileri tabloda bulunan bütün türetilmiş sütunları hesaplar."""
+    mevcut = set(df.columns)
+    hesaplanabilir = []
+    for ad in grafik:
+        try:
+            sira = hesaplama_sirasi([ad], grafik)
+        except KeyError:
+            continue
+        girdiler = {b for s in sira for b in grafik[s][0]} - set(grafik)
+        if girdiler <= mevcut:
+            hesaplanabilir.append(ad)
+    return turet(df, hesaplanabilir, grafik)
@@ -0,0 +1,318 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from profil import profillenir
+
+# ---------------------------------------------------------
+# ORTAK VERİ YÜKLEYİCİ (message.txt)
+# ---------------------------------------------------------
+# Scriptlerin her birinde tekrar eden okuma + sütun temizleme + sayısal dönüşüm
+# zinciri burada tek sefer yapılır. Ayrıştırılmış tablo, kaynak dosyanın
+# mtime ve içerik özetiyle (sha256) anahtarlanan ikili sütunsal bir
+# anlık görüntüye (.npz) yazılır; sonraki çalıştırmalar metni yeniden
+# ayrıştırmadan bu görüntüyü milisaniyeler içinde yükler.
+#
+# Sütun tipleri SEMA'da bildirilir: Il kategorik, ID ('id_17') tamsayıya
+# çözülür, ondalıklı ölçümler float32, sayımlar boş değer taşıyabilen
+# tamsayılardır (Int32/Int8). Sayısal sütunlar satır başına 64 yerine 39
+# bayt, ID metni yerine 5 bayt tutar; il adları tekrar ettikçe (ilçe
+# tablosu) kategori kodları metinden çok daha küçüktür. Şemaya uymayan
+# değerler (kesirli sayım, aralık dışı değer, 'id_' ile başlamayan kimlik)
+# görülürse o sütun eski tipinde kalır.
+
+ONBELLEK_DIZINI = '.onbellek'
+SNAPSHOT_SURUMU = 2
+
+# Aynı süreç içinde (ör. toplu_calistir.py) tekrar yüklemeyi önleyen bellek içi kayıt:
+# mutlak yol -> ((mtime_ns, boyut), DataFrame)
+_BELLEK = {}
+
+# Scriptlerde elle yapılan yeniden adlandırmaların ortak hali
+SUTUN_ADLARI = {
+    'yıllık_ortalama_sicaklik': 'Sicaklik',
+    'Ortalama_Maas': 'Gelir',
+    'Eğitim': 'Egitim',
+    'Suc_Orani': 'Suc',
+}
+
+# Sayısal olmayan (metin) sütunlar; geri kalan her şey pd.to_numeric'ten geçer
+METIN_SUTUNLARI = ['ID', 'Il']
+
+# Standart sütun adı -> bellekteki tip. float32 ~7 anlamlı basamak taşır;
+# 1-2 ondalıklı ölçümler için yeterli, tutarlar ve nüfus ise tamsayıdır.
+SEMA = {
+    'ID': 'kimlik',
+    'Il': 'category',
+    'Sicaklik': 'float32',
+    'Nufus': 'Int32',
+    'Elektrik': 'Int32',
+    'Issizlik': 'float32',
+    'Gelir': 'Int32',
+    'Kira': 'Int32',
+    'Egitim': 'Int8',
+    'Suc': 'float32',
+}
+KIMLIK_ONEKI = 'id_'
+
+# Çok yıllı panel deposu (panel_deposu.py). ANALIZ_PANEL ayarlıysa
+# message.txt ve ulusal seri CSV'leri yerine depo okunur.
+PANEL_ORTAMI = 'ANALIZ_PANEL'
+PANEL_YILI_ORTAMI = 'ANALIZ_PANEL_YILI'
+
+
+def sutunlari_standartlastir(df):
+    """Sütun adlarını temizler ve ortak isimlere çevirir."""
+    df.columns = df.columns.str.strip().str.replace(' ', '_')
+    return df.rename(columns=SUTUN_ADLARI)
+
+
+def sayisala_cevir(df):
+    """Metin sütunları dışındaki her sütunu errors='coerce' ile sayıya çevirir."""
+    for col in df.columns:
+        if col not in METIN_SUTUNLARI:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def _kimlik_coz(seri):
+    """'id_17' -> 17 (Int32); biçime uymayan kimlikler kategorik kalır."""
+    metin = seri.astype(str)
+    if metin.str.startswith(KIMLIK_ONEKI).all():
+        try:
+            sayi = metin.str.slice(len(KIMLIK_ONEKI)).astype('int64')
+        except ValueError:
+            sayi = None
+        dizi = None if sayi is None else sema_dizisi(sayi.to_numpy(), 'Int32')
+        if dizi is not None:
+            return pd.Series(dizi, index=seri.index, name=seri.name)
+    return seri.astype('category')
+
+
+def sema_dizisi(degerler, tip):
+    """
+    Sayı dizisini (boşlar NaN) 'float32' ya da boş değer taşıyabilen tamsayı
+    (Int32 ...) şema tipine çevirir; değerler tamsayı tipine sığmıyorsa None.
+    """
+    degerler = np.asarray(degerler, dtype=float)
+    if tip == 'float32':
+        return degerler.astype(np.float32)
+    bos = np.isnan(degerler)
+    dolu = degerler[~bos]
+    sinir = np.iinfo(pd.api.types.pandas_dtype(tip).numpy_dtype)
+    if dolu.size and not ((dolu == np.round(dolu)).all() and dolu.min() >= sinir.min and dolu.max() <= sinir.max):
+        return None
+    return pd.arrays.IntegerArray(np.where(bos, 0, degerler).astype(sinir.dtype), bos)
+
+
+def semaya_cevir(df, sema=SEMA):
+    """
+    Standart adlı tabloyu SEMA tiplerine (yerinde) dönüştürür ve döndürür.
+    Şemada olmayan sütunlara dokunulmaz.
+    """
+    for col, tip in sema.items():
+        if col not in df.columns or df[col].dtype == tip:
+            continue
+        if tip == 'kimlik':
+            df[col] = _kimlik_coz(df[col])
+        elif tip == 'category':
+            df[col] = df[col].astype('category')
+        else:
+            dizi = sema_dizisi(df[col].to_numpy(dtype=float, na_value=np.nan), tip)
+            if dizi is not None:
+                df[col] = dizi
+    return df
+
+
+def bellek_kullanimi(df):
+    """Tablonun bellekteki boyutu (bayt; metin/kategori içerikleri dahil)."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _panel_kaynagi(yol):
+    """
+    yol bir panel deposu klasörüyse onu, ANALIZ_PANEL ayarlıyken yol
+    message.txt ise ortamdaki depoyu döndürür; aksi halde None.
+    """
+    if os.path.isfile(os.path.join(yol, 'meta.json')):
+        return yol
+    panel = os.environ.get(PANEL_ORTAMI)
+    if panel and os.path.basename(yol) == 'message.txt':
+        return panel
+    return None
+
+
+def _panel_yili(yil):
+    return yil if yil is not None else (os.environ.get(PANEL_YILI_ORTAMI) or None)
+
+
+def _bellek_anahtari(yol, yil=None):
+    """Süreç içi bellek kaydının anahtarı ve geçerlilik damgası (mtime, boyut)."""
+    panel = _panel_kaynagi(yol)
+    if panel is None:
+        durum = os.stat(yol)
+        return os.path.abspath(yol), (durum.st_mtime_ns, durum.st_size)
+    # Depo her yazılışta meta.json ile birlikte yenilenir
+    durum = os.stat(os.path.join(panel, 'meta.json'))
+    return f"{os.path.abspath(panel)}@{_panel_yili(yil) or 'son'}", (durum.st_mtime_ns, durum.st_size)
+
+
+def _dosya_ozeti(yol):
+    h = hashlib.sha256()
+    with open(yol, 'rb') as f:
+        for blok in iter(lambda: f.read(1 << 20), b''):
+            h.update(blok)
+    return h.hexdigest()
+
+
+def _snapshot_yolu(yol):
+    dizin, ad = os.path.split(os.path.abspath(yol))
+    return os.path.join(dizin, ONBELLEK_DIZINI, ad + '.npz')
+
+
+def _snapshot_oku(snap_yolu):
+    with np.load(snap_yolu, allow_pickle=False) as arsiv:
+        meta = json.loads(str(arsiv['__meta__']))
+        sutunlar = {}
+        for ad in meta['sutunlar']:
+            degerler = arsiv['s_' + ad]
+            if 'k_' + ad in arsiv:
+                # Kategorik: kodlar + kategori listesi
+                degerler = pd.Categorical.from_codes(degerler, arsiv['k_' + ad].tolist())
+            elif 'm_' + ad in arsiv:
+                # Boş değer taşıyabilen tamsayı: değerler + boş maskesi
+                degerler = pd.arrays.IntegerArray(degerler, arsiv['m_' + ad])
+            sutunlar[ad] = degerler
+    return meta, pd.DataFrame(sutunlar)
+
+
+def _snapshot_yaz(snap_yolu, df, meta):
+    os.makedirs(os.path.dirname(snap_yolu), exist_ok=True)
+    meta = dict(meta, sutunlar=list(df.columns))
+    diziler = {}
+    for ad in df.columns:
+        seri = df[ad]
+        if isinstance(seri.dtype, pd.CategoricalDtype):
+            diziler['s_' + ad] = seri.cat.codes.to_numpy()
+            diziler['k_' + ad] = seri.cat.categories.astype(str).to_numpy(dtype=str)
+        elif pd.api.types.is_extension_array_dtype(seri.dtype) and pd.api.types.is_integer_dtype(seri.dtype):
+            diziler['s_' + ad] = seri.to_numpy(dtype=seri.dtype.numpy_dtype, na_value=0)
+            diziler['m_' + ad] = seri.isna().to_numpy()
+        elif ad in METIN_SUTUNLARI:
+            diziler['s_' + ad] = seri.astype(str).to_numpy(dtype=str)
+        else:
+            diziler['s_' + ad] = seri.to_numpy()
+    # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yazıp taşıyoruz
+    gecici = snap_yolu + '.tmp.npz'
+    np.savez(gecici, __meta__=np.array(json.dumps(meta)), **diziler)
+    os.replace(gecici, snap_yolu)
+
+
+def ham_oku(yol='message.txt'):
+    """Snapshot kullanmadan dosyayı ayrıştırır, standartlaştırır ve şemaya çevirir."""
+    df = pd.read_csv(yol)
+    df = sutunlari_standartlastir(df)
+    return semaya_cevir(sayisala_cevir(df))
+
+
+@profillenir()
+def veri_yukle(yol='message.txt', onbellek=True, yil=None):
+    """
+    message.txt biçimindeki il tablosunu standart sütun adlarıyla döndürür.
+
+    Kaynak dosyanın mtime/boyutu değişmediyse snapshot doğrudan kullanılır.
+    mtime değişmiş ama içerik özeti aynıysa (ör. dosyaya sadece dokunulmuşsa)
+    yine snapshot kullanılır ve meta bilgisi güncellenir. Aksi halde dosya
+    yeniden ayrıştırılır. Dosya yoksa FileNotFoundError fırlatılır.
+
+    yol bir panel deposuysa (ya da ANALIZ_PANEL ayarlıysa) tablo depodan
+    kurulur; yil verilmezse ANALIZ_PANEL_YILI, o da yoksa son yıl kullanılır.
+    """
+    panel = _panel_kaynagi(yol)
+    if panel is None:
+        durum = os.stat(yol)
+        if not onbellek:
+            return ham_oku(yol)
+
+    if onbellek:
+        bellek_anahtari, damga = _bellek_anahtari(yol, yil)
+        kayit = _BELLEK.get(bellek_anahtari)
+        if kayit is not None and kayit[0] == damga:
+            # Scriptler tabloyu yerinde değiştirdiği için paylaşılan kopyayı değil
+            # sığ bir kopyasını veriyoruz (veriler kopyalanmaz)
+            return kayit[1].copy(deep=False)
+
+    if panel is not None:
+        from panel_deposu import PanelDeposu
+
+        return PanelDeposu(panel).tablo(_panel_yili(yil))
+
+    snap_yolu = _snapshot_yolu(yol)
+    anahtar = {'surum': SNAPSHOT_SURUMU, 'mtime_ns': durum.st_mtime_ns, 'boyut': durum.st_size}
+
+    meta = df = None
+    if os.path.exists(snap_yolu):
+        try:
+            meta, df = _snapshot_oku(snap_yolu)
+        except (OSError, ValueError, KeyError):
+            meta = df = None
+
+    if meta is not None and meta.get('surum') == SNAPSHOT_SURUMU:
+        if meta['mtime_ns'] == anahtar['mtime_ns'] and meta['boyut'] == anahtar['boyut']:
+            return df
+        ozet = _dosya_ozeti(yol)
+        if meta['sha256'] == ozet:
+            try:
+                _snapshot_yaz(snap_yolu, df, dict(anahtar, sha256=ozet))
+            except OSError:
+                pass
+            return df
+    else:
+        ozet = _dosya_ozeti(yol)
+
+    df = ham_oku(yol)
+    try:
+        _snapshot_yaz(snap_yolu, df, dict(anahtar, sha256=ozet))
+    except OSError:
+        # Salt okunur dizinlerde snapshot yazılamaz; analiz yine de devam eder
+        pass
+    return df
+
+
+def bellege_al(yol, df, yil=None):
+    """
+    Hazırlanmış tabloyu (ör. türetilmiş sütunları eklenmiş hali) süreç içi
+    belleğe kaydeder; aynı dosya için sonraki veri_yukle çağrıları bunu döndürür.
+    """
+    anahtar, damga = _bellek_anahtari(yol, yil)
+    _BELLEK[anahtar] = (damga, df)
+
+
+def seri_yukle(yol):
+    """
+    su_verisi.csv / emisyon_gsyh.csv gibi ulusal yıllık seriyi CSV'deki
+    sütunlarıyla okur. ANALIZ_PANEL ayarlıysa ve depo bu seriyi içeriyorsa
+    seri depodan (ayrıştırmadan) kurulur. Dosya yoksa FileNotFoundError.
+    """
+    panel = os.environ.get(PANEL_ORTAMI)
+    if panel:
+        from panel_deposu import PanelDeposu
+
+        depo = PanelDeposu(panel)
+        if depo.icerir(yol):
+            return depo.ulusal_tablo(yol)
+    return pd.read_csv(yol)
+
+
+def parcali_oku(yol='message.txt', parca_boyutu=100_000):
+    """
+    Dosyayı parça parça okur; her parça veri_yukle ile aynı sütun adlarına ve
+    tiplere sahiptir (Il kategorileri parçaya özeldir). Bellek kullanımı parça
+    boyutuyla sınırlıdır.
+    """
+    for parca in pd.read_csv(yol, chunksize=parca_boyutu):
+        parca = sutunlari_standartlastir(parca)
+        yield semaya_cevir(sayisala_cevir(parca))
@@ -5,10 +5,16 @@ import numpy as np
 from scipy import stats
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score
+from yeniden_ornekleme import grup_karsilastir
+from agirlik_duyarlilik import agirlik_ornekle, duyarlilik_analizi
+from etiket_yerlesimi import etiketle
+from grafik_cikti import goster
+from profil import bolum
 
 # ---------------------------------------------------------
 # 1. VERİYİ OKUMA (Mock Data Oluşturuyoruz)
 # ---------------------------------------------------------
+bolum('VERİ YÜKLEME')
 # 'message.txt' olmadığı için kodun çalışması adına örnek veri seti.
 # Sen kendi dosyanı okutmak için alttaki satırın yorumunu kaldırabilirsin:
 # df = pd.read_csv('message.txt')
@@ -36,12 +42,11 @@ df = df.rename(columns={'Il': 'Sehir', 'Ortalama_Maas': 'Maas'})
 # ---------------------------------------------------------
 # 2. YAŞAM KALİTESİ ENDEKSİ HESABI (Orijinal Kod)
 # ---------------------------------------------------------
+bolum('HESAPLAMALAR', satir=len(df))
 cols = ['Maas', 'Eğitim', 'Kira', 'Issizlik', 'Suc_Orani']
-df_norm = df.copy()
-
-for col in cols:
-    # Normalizasyon
-    df_norm[col] = (df[col] - df[col].min()) / (df[col].max() - df[col].min())
+# Normalizasyon: tablonun tam kopyası yerine yalnızca bu sütunlar hesaplanır
+enk, enb = df[cols].min(), df[cols].max()
+df_norm = (df[cols] - enk) / (enb - enk)
 
 # Endeks Formülü
 df['Yasam_Puan'] = (df_norm['Maas'] + df_norm['Eğitim']) - (df_norm['Kira'] + df_norm['Issizlik'] + df_norm['Suc_Orani'])
@@ -49,6 +54,7 @@ df['Yasam_Puan'] = (df_norm['Maas'] + df_norm['Eğitim']) - (df_norm['Kira'] + d
 # ---------------------------------------------------------
 # 2.5 BİLİMSEL ANALİZ ENTEGRASYONU (PDF EKLENTİSİ)
 # ---------------------------------------------------------
+bolum('İSTATİSTİKSEL ANALİZLER', satir=len(df))
 print("\n--- BİLİMSEL ANALİZ RAPORU ---")
 
 # A) KORELASYON ANALİZİ (Correlation Analysis)
@@ -73,6 +79,10 @@ if p_val < 0.05:
 else:
     print("Sonuç: H0 Reddedilemedi. Fark tesadüfi olabilir.")
 
+# Normallik varsayımı gerektirmeyen kontrol: permütasyon testi + bootstrap GA
+yo = grup_karsilastir(grup_yuksek, grup_dusuk)
+print(f"Permütasyon p-değeri: {yo['p']:.4f} | Ortalama Fark %95 GA: [{yo['alt']:.2f}, {yo['ust']:.2f}]")
+
 # C) REGRESYON ANALİZİ (Regression Analysis)
 # Soru: İşsizlik oranını bilirsek Yaşam Puanını tahmin edebilir miyiz?
 X = df[['Issizlik']]
@@ -85,11 +95,22 @@ y_pred = model.predict(X)
 print(f"\n[3] Regresyon Analizi:")
 print(f"Model: Puan = {model.intercept_:.2f} + ({model.coef_[0]:.2f} x İşsizlik)")
 print(f"Başarı (R2): {r2:.2f}")
+
+# D) AĞIRLIK DUYARLILIĞI
+# Soru: Eşit ağırlıklar yerine farklı ağırlıklar seçilseydi sıralama ne kadar değişirdi?
+W = agirlik_ornekle(10_000, len(cols))
+ilk_n = 5
+duyarlilik, kendall = duyarlilik_analizi(df_norm, df['Sehir'], W, ilk=ilk_n)
+print(f"\n[4] Ağırlık Duyarlılığı ({len(W)} Dirichlet ağırlık vektörü):")
+print(duyarlilik.head(ilk_n)[['Sehir', 'Yayimlanan_Sira', 'Medyan_Sira', 'Sira_%5', 'Sira_%95', f'Ilk{ilk_n}_Orani']]
+      .to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+print(f"Kendall uzaklığı (medyan / %95): {np.median(kendall):.3f} / {np.percentile(kendall, 95):.3f}")
 print("-" * 40)
 
 # ---------------------------------------------------------
 # 3. GÖRSELLEŞTİRME (Güncellenmiş)
 # ---------------------------------------------------------
+bolum('GÖRSELLEŞTİRME', satir=len(df))
 # Orijinal grafiği koruyoruz, yanına bilimsel analizi ekliyoruz.
 fig, axes = plt.subplots(1, 2, figsize=(16, 7))
 
@@ -111,9 +132,9 @@ sns.scatterplot(x=df['Issizlik'], y=df['Yasam_Puan'], s=100, color='blue', alpha
 # Kırmızı Regresyon Doğrusu
 axes[1].plot(df['Issizlik'], y_pred, color='red', linewidth=2, label=f'Regresyon Doğrusu (R2={r2:.2f})')
 
-# Şehir isimlerini noktalara ekleme
-for i in range(len(df)):
-    axes[1].text(df['Issizlik'].iloc[i]+0.2, df['Yasam_Puan'].iloc[i], df['Sehir'].iloc[i], fontsize=8, alpha=0.7)
+# Şehir isimlerini noktalara ekleme (uç puanlı şehirler önce; çakışanlar atlanır)
+etiketle(axes[1], df['Issizlik'], df['Yasam_Puan'], df['Sehir'], oncelik=df['Yasam_Puan'].abs(),
+         fontsize=8, alpha=0.7)
 
 axes[1].set_title('Regresyon: İşsizlik Yaşam Kalitesini Nasıl Etkiliyor?', fontsize=14)
 axes[1].set_xlabel('İşsizlik Oranı (%)')
@@ -122,4 +143,4 @@ axes[1].legend()
 axes[1].grid(True, linestyle='--', alpha=0.5)
 
 plt.tight_layout()
-plt.show()
\ No newline at end of file
+goster('yasam_kalite')
\ No newline at end of file
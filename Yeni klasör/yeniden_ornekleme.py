@@ -0,0 +1,120 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from profil import profillenir
+from sonuc_onbellegi import onbellekli
+
+# ---------------------------------------------------------
+# YENİDEN ÖRNEKLEME MOTORU (PERMÜTASYON + BOOTSTRAP)
+# ---------------------------------------------------------
+# BarınmaYükü.py, yaşam_kalite_endeksi.py ve "4 Bölgeli Karar Matrisi.py"
+# şehirleri ortalamaya göre ikiye ayırıp stats.ttest_ind uyguluyor. Veri
+# normal dağılmadığında t-testi yerine dağılımdan bağımsız iki yöntem:
+#   - Permütasyon testi: grup etiketleri karıştırılarak ortalama farkının
+#     H0 altındaki dağılımı üretilir (çift yönlü p-değeri).
+#   - Bootstrap: her grup kendi içinde yerine koymalı örneklenerek
+#     ortalama farkı için yüzdelik güven aralığı üretilir.
+# Örneklem indeksleri Python döngüsüyle değil, (parti x n) boyutlu NumPy
+# dizileri olarak üretilir. Partiler SeedSequence ile tohumlanır ve
+# isteğe bağlı olarak süreç havuzuna dağıtılır; sonuç işçi sayısından
+# bağımsızdır. Parti boyutu sabit değil, bellek bütçesinden türetilir:
+# örnek başına ~16n bayt (float64 rastgele + int64 indeks) ayrıldığından
+# büyük gruplarda partiler küçülür, küçük gruplarda büyür.
+
+PARTI_BELLEGI = 64 * 2**20     # parti başına ara dizilere ayrılan bayt
+
+
+def _parti_boyutu(n, parti_boyutu=None):
+    """Verilmemişse n gözlem için PARTI_BELLEGI'ne sığan örnek sayısı."""
+    if parti_boyutu is not None:
+        return parti_boyutu
+    return max(1, PARTI_BELLEGI // (16 * n))
+
+
+def _parti_boyutlari(toplam, parti_boyutu):
+    boyutlar = [parti_boyutu] * (toplam // parti_boyutu)
+    if toplam % parti_boyutu:
+        boyutlar.append(toplam % parti_boyutu)
+    return boyutlar
+
+
+def _permutasyon_partisi(is_):
+    birlesik, n_a, adet, tohum = is_
+    rng = np.random.default_rng(tohum)
+    # Her satır birlesik dizinin bağımsız bir permütasyonu; fark için
+    # yalnızca ilk grubun toplamı yeterli (ikincisi toplamdan çıkar)
+    indeksler = rng.random((adet, birlesik.size)).argsort(axis=1)[:, :n_a]
+    toplam_a = birlesik[indeksler].sum(axis=1)
+    n_b = birlesik.size - n_a
+    return toplam_a / n_a - (birlesik.sum() - toplam_a) / n_b
+
+
+def _bootstrap_partisi(is_):
+    a, b, adet, tohum = is_
+    rng = np.random.default_rng(tohum)
+    ort_a = a[rng.integers(0, a.size, size=(adet, a.size))].mean(axis=1)
+    ort_b = b[rng.integers(0, b.size, size=(adet, b.size))].mean(axis=1)
+    return ort_a - ort_b
+
+
+def _partileri_calistir(fonksiyon, isler, isci_sayisi):
+    if isci_sayisi == 1 or len(isler) == 1:
+        return np.concatenate([fonksiyon(i) for i in isler])
+    with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+        return np.concatenate(list(havuz.map(fonksiyon, isler)))
+
+
+def _diziler(a, b):
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    a, b = a[~np.isnan(a)], b[~np.isnan(b)]
+    if a.size < 2 or b.size < 2:
+        raise ValueError("Her grupta en az 2 gözlem olmalı")
+    return a, b
+
+
+@profillenir()
+@onbellekli(yoksay=('isci_sayisi',))
+def permutasyon_testi(a, b, ornek_sayisi=100_000, tohum=42, isci_sayisi=1, parti_boyutu=None):
+    """
+    Ortalama farkı için çift yönlü permütasyon testi.
+    Dönüş: {'fark': gözlenen fark, 'p': p-değeri, 'ornek_sayisi': ...}
+    p-değeri (1 + uç sayısı) / (1 + örnek sayısı) olarak hesaplanır; sıfır çıkmaz.
+    """
+    a, b = _diziler(a, b)
+    gozlenen = a.mean() - b.mean()
+    birlesik = np.concatenate([a, b])
+    boyutlar = _parti_boyutlari(ornek_sayisi, _parti_boyutu(birlesik.size, parti_boyutu))
+    tohumlar = np.random.SeedSequence(tohum).spawn(len(boyutlar))
+    isler = [(birlesik, a.size, adet, t) for adet, t in zip(boyutlar, tohumlar)]
+    farklar = _partileri_calistir(_permutasyon_partisi, isler, isci_sayisi)
+    # Kayan nokta eşitliklerini kaçırmamak için küçük göreli tolerans
+    uc = np.count_nonzero(np.abs(farklar) >= abs(gozlenen) * (1 - 1e-9) - 1e-12)
+    return {'fark': float(gozlenen), 'p': float((uc + 1) / (ornek_sayisi + 1)), 'ornek_sayisi': ornek_sayisi}
+
+
+@profillenir()
+@onbellekli(yoksay=('isci_sayisi',))
+def bootstrap_guven_araligi(a, b, ornek_sayisi=100_000, guven=0.95, tohum=42, isci_sayisi=1,
+                            parti_boyutu=None):
+    """
+    Ortalama farkı (a - b) için yüzdelik bootstrap güven aralığı.
+    Dönüş: {'fark', 'alt', 'ust', 'guven', 'ornek_sayisi'}
+    """
+    a, b = _diziler(a, b)
+    boyutlar = _parti_boyutlari(ornek_sayisi, _parti_boyutu(a.size + b.size, parti_boyutu))
+    tohumlar = np.random.SeedSequence(tohum).spawn(len(boyutlar))
+    isler = [(a, b, adet, t) for adet, t in zip(boyutlar, tohumlar)]
+    farklar = _partileri_calistir(_bootstrap_partisi, isler, isci_sayisi)
+    alfa = (1 - guven) / 2
+    alt, ust = np.quantile(farklar, [alfa, 1 - alfa])
+    return {'fark': float(a.mean() - b.mean()), 'alt': float(alt), 'ust': float(ust),
+            'guven': guven, 'ornek_sayisi': ornek_sayisi}
+
+
+def grup_karsilastir(a, b, ornek_sayisi=100_000, guven=0.95, tohum=42, isci_sayisi=1):
+    """Permütasyon p-değeri ile bootstrap güven aralığını birlikte döndürür."""
+    sonuc = bootstrap_guven_araligi(a, b, ornek_sayisi, guven, tohum, isci_sayisi)
+    sonuc['p'] = permutasyon_testi(a, b, ornek_sayisi, tohum, isci_sayisi)['p']
+    return sonuc
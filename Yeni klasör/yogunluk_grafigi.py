@@ -0,0 +1,230 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from profil import profillenir
+
+# ---------------------------------------------------------
+# BÜYÜK SERPİLME GRAFİKLERİ İÇİN YOĞUNLUK MODU
+# ---------------------------------------------------------
+# sns.scatterplot(size='Nufus', hue=...) her satır için ayrı bir işaretçi
+# çiziyor; ilçe ölçeğinde milyonlarca nokta dakikalarca çizim ve yüzlerce
+# MB'lık SVG demek. dagilim_ciz() satır sayısı eşiğin altındaysa aynı
+# sns.scatterplot çağrısını yapar, üstündeyse:
+#   1. Noktalar NumPy ile kare ya da altıgen kutulara toplanır
+#      (np.bincount; ağırlık = 'size' sütunu, ör. Nufus).
+#   2. Sayısal hue için kutu başına ağırlıklı ortalama, kategorik hue için
+#      kutuda en ağır kategori renk olur; toplam ağırlık saydamlığı belirler.
+#   3. Sonuç tek bir sanatçı olarak çizilir (kare: imshow, altıgen: tek
+#      PolyCollection). Regresyon çizgisi ve aykırı değer katmanları
+#      eskisi gibi üstüne eklenir.
+# Eşik GRAFIK_YOGUNLUK_ESIGI ortam değişkeniyle değiştirilebilir
+# (0 -> her zaman yoğunluk modu).
+
+YOGUNLUK_ESIGI = 50_000
+VARSAYILAN_KUTU = 200
+
+
+def yogunluk_esigi():
+    return int(os.environ.get('GRAFIK_YOGUNLUK_ESIGI', YOGUNLUK_ESIGI))
+
+
+def _aralik(v, aralik):
+    if aralik is not None:
+        return float(aralik[0]), float(aralik[1])
+    alt, ust = float(np.nanmin(v)), float(np.nanmax(v))
+    return (alt, ust) if ust > alt else (alt - 0.5, ust + 0.5)
+
+
+def _kutu_topla(kod, kutu_sayisi, agirlik, renk):
+    """
+    Kutu kodlarına göre toplam ağırlık ve renk özeti.
+    renk sayısal ise ağırlıklı ortalama, tamsayı kategori kodu ise
+    (kategori_sayisi ile birlikte verilir) en ağır kategori döner.
+    """
+    toplam = np.bincount(kod, weights=agirlik, minlength=kutu_sayisi)
+    if renk is None:
+        return toplam, None
+    degerler, kategori_sayisi = renk
+    if kategori_sayisi is None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ortalama = np.bincount(kod, weights=agirlik * degerler, minlength=kutu_sayisi) / toplam
+        return toplam, ortalama
+    # (kutu, kategori) çiftleri tek bincount ile sayılır
+    tablo = np.bincount(kod * kategori_sayisi + degerler, weights=agirlik,
+                        minlength=kutu_sayisi * kategori_sayisi).reshape(kutu_sayisi, kategori_sayisi)
+    return toplam, np.argmax(tablo, axis=1)
+
+
+def kare_kutula(x, y, agirlik=None, renk=None, kutu=VARSAYILAN_KUTU, x_aralik=None, y_aralik=None):
+    """
+    Düzgün 2B ızgara. Dönüş: (toplam [ny x nx], renk özeti [ny x nx] ya da
+    None, (x0, x1, y0, y1) kapsamı). renk: (değerler, kategori_sayısı|None).
+    """
+    nx, ny = (kutu, kutu) if np.isscalar(kutu) else kutu
+    (x0, x1), (y0, y1) = _aralik(x, x_aralik), _aralik(y, y_aralik)
+    ix = np.clip(((x - x0) / (x1 - x0) * nx).astype(np.int64), 0, nx - 1)
+    iy = np.clip(((y - y0) / (y1 - y0) * ny).astype(np.int64), 0, ny - 1)
+    toplam, ozet = _kutu_topla(iy * nx + ix, nx * ny, agirlik, renk)
+    ozet = None if ozet is None else ozet.reshape(ny, nx)
+    return toplam.reshape(ny, nx), ozet, (x0, x1, y0, y1)
+
+
+def altigen_kutula(x, y, agirlik=None, renk=None, kutu=VARSAYILAN_KUTU // 2, x_aralik=None, y_aralik=None):
+    """
+    Altıgen ızgara (plt.hexbin ile aynı iki kaydırılmış kafes yöntemi).
+    Dönüş: (merkezler [m x 2], toplam, renk özeti, (sx, sy) adımları); yalnızca
+    dolu kutular döner.
+    """
+    (x0, x1), (y0, y1) = _aralik(x, x_aralik), _aralik(y, y_aralik)
+    nx = int(kutu)
+    ny = max(1, int(round(nx / np.sqrt(3))))
+    sx, sy = (x1 - x0) / nx, (y1 - y0) / ny
+    u, v = (x - x0) / sx, (y - y0) / sy
+
+    # Kafes 1: tamsayı noktalar, kafes 2: (0.5, 0.5) kaydırılmış noktalar.
+    # Kafes 2'de nx x ny merkez var; u == nx (sağ/üst kenar) floor ile nx'e
+    # düşüp bir üst satırın ilk kutusuna taşmasın diye sınırlara kırpılır.
+    i1, j1 = np.clip(np.round(u), 0, nx), np.clip(np.round(v), 0, ny)
+    i2, j2 = np.clip(np.floor(u), 0, nx - 1), np.clip(np.floor(v), 0, ny - 1)
+    d1 = (u - i1) ** 2 + 3.0 * (v - j1) ** 2
+    d2 = (u - i2 - 0.5) ** 2 + 3.0 * (v - j2 - 0.5) ** 2
+    birinci = d1 <= d2
+    n1x, n1y = nx + 1, ny + 1
+    kod = np.where(birinci, j1 * n1x + i1, n1x * n1y + j2 * nx + i2).astype(np.int64)
+    kutu_sayisi = n1x * n1y + nx * ny
+
+    toplam, ozet = _kutu_topla(kod, kutu_sayisi, agirlik, renk)
+    dolu = np.flatnonzero(toplam > 0)
+    ilk = dolu < n1x * n1y
+    ikinci = dolu - n1x * n1y
+    cx = np.where(ilk, dolu % n1x, ikinci % nx + 0.5)
+    cy = np.where(ilk, dolu // n1x, ikinci // nx + 0.5)
+    merkezler = np.column_stack([x0 + cx * sx, y0 + cy * sy])
+    return merkezler, toplam[dolu], (None if ozet is None else ozet[dolu]), (sx, sy)
+
+
+def _renk_kodla(seri):
+    """hue sütunu -> ((değerler, kategori_sayısı|None), kategoriler|None)."""
+    if pd.api.types.is_numeric_dtype(seri) and not isinstance(seri.dtype, pd.CategoricalDtype):
+        return (seri.to_numpy(dtype=float), None), None
+    # Kategori sırası sns.scatterplot'taki gibi ilk görülme sırasıdır
+    kategorik = seri.astype('category').cat if isinstance(seri.dtype, pd.CategoricalDtype) else None
+    kategorik = pd.Categorical(seri, categories=kategorik.categories if kategorik is not None
+                               else pd.unique(seri.dropna()))
+    return (kategorik.codes.astype(np.int64), len(kategorik.categories)), list(kategorik.categories)
+
+
+def _saydamlik(toplam, en_fazla):
+    """Toplam ağırlığı log ölçekte [0.15, en_fazla] saydamlığına eşler."""
+    log = np.log1p(toplam)
+    ust = log.max() if log.size and log.max() > 0 else 1.0
+    return np.where(toplam > 0, 0.15 + (en_fazla - 0.15) * log / ust, 0.0)
+
+
+def yogunluk_ciz(df, x, y, boyut=None, renk=None, ax=None, palette=None, alpha=1.0,
+                 bicim='kare', kutu=None):
+    """
+    Yoğunluk görünümünü tek sanatçıyla çizer. boyut sütunu ağırlık olur
+    (yoksa her satır 1), renk sütunu kutu rengini belirler. Sayısal renkte
+    bir renk çubuğu, kategorik renkte kategori lejantı eklenir.
+    Dönüş: çizilen sanatçı (AxesImage ya da PolyCollection).
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import Normalize
+
+    ax = ax if ax is not None else plt.gca()
+    xv, yv = df[x].to_numpy(dtype=float), df[y].to_numpy(dtype=float)
+    gecerli = np.isfinite(xv) & np.isfinite(yv)
+    agirlik = df[boyut].to_numpy(dtype=float) if boyut is not None else np.ones(len(df))
+    gecerli &= np.isfinite(agirlik)
+
+    renk_kodu, kategoriler = (None, None)
+    if renk is not None:
+        renk_kodu, kategoriler = _renk_kodla(df[renk])
+        degerler, kategori_sayisi = renk_kodu
+        if kategori_sayisi is None:
+            gecerli &= np.isfinite(degerler)
+        else:
+            gecerli &= degerler >= 0
+        renk_kodu = (degerler[gecerli], kategori_sayisi)
+    xv, yv, agirlik = xv[gecerli], yv[gecerli], agirlik[gecerli]
+
+    if bicim == 'altigen':
+        merkezler, toplam, ozet, (sx, sy) = altigen_kutula(xv, yv, agirlik, renk_kodu,
+                                                           kutu or VARSAYILAN_KUTU // 2)
+    elif bicim == 'kare':
+        toplam, ozet, kapsam = kare_kutula(xv, yv, agirlik, renk_kodu, kutu or VARSAYILAN_KUTU)
+    else:
+        raise ValueError(f"Bilinmeyen biçim: {bicim}")
+
+    # Renkler: sayısal -> renk haritası, kategorik -> palet, yok -> sabit
+    norm = cmap = None
+    if kategoriler is not None:
+        paletim = np.array(sns.color_palette(palette, len(kategoriler)))
+        rgb = paletim[np.asarray(ozet, dtype=np.int64)]
+    elif renk is not None:
+        cmap = sns.color_palette(palette or 'viridis', as_cmap=True)
+        norm = Normalize(np.nanmin(renk_kodu[0]), np.nanmax(renk_kodu[0]))
+        rgb = cmap(norm(np.nan_to_num(ozet, nan=norm.vmin)))[..., :3]
+    else:
+        rgb = np.broadcast_to(np.array(sns.color_palette(palette, 1)[0]), toplam.shape + (3,))
+    rgba = np.concatenate([rgb, _saydamlik(toplam, alpha)[..., None]], axis=-1)
+
+    if bicim == 'kare':
+        sanatci = ax.imshow(rgba, extent=kapsam, origin='lower', aspect='auto', interpolation='nearest')
+    else:
+        # Tek altıgen şablonu (plt.hexbin ile aynı), her dolu kutuya kaydırılarak çizilir
+        sablon = [sx, sy / 3] * np.array([[.5, -.5], [.5, .5], [0., 1.], [-.5, .5], [-.5, -.5], [0., -1.]])
+        sanatci = PolyCollection([sablon], offsets=merkezler, offset_transform=ax.transData,
+                                 facecolors=rgba, edgecolors='none')
+        ax.add_collection(sanatci)
+        ax.autoscale_view()
+
+    if norm is not None:
+        plt.colorbar(plt.cm.ScalarMappable(norm=norm, cmap=cmap), ax=ax,
+                     label=f"{renk} (kutu ortalaması)" if boyut is None else f"{renk} ({boyut} ağırlıklı ort.)")
+    elif kategoriler is not None:
+        # Boş vekil noktalar: scriptte sonradan çağrılan plt.legend() de bunları bulur
+        for k, ad in enumerate(kategoriler):
+            ax.scatter([], [], marker='s', color=paletim[k], label=str(ad))
+        ax.legend(title=renk)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    return sanatci
+
+
+def _seaborn_tipleri(df, sutunlar):
+    """
+    Boş değer taşıyabilen sayı sütunlarını (veri_yukleyici.SEMA: Int32 ...)
+    seaborn'un lejant hesabının anladığı numpy tiplerine çevirir: boşsuz
+    tamsayılar aynı genişlikte tamsayı, geri kalanı float64 olur. Yalnızca
+    çizilen sütunlar seçilir.
+    """
+    sutunlar = list(dict.fromkeys(s for s in sutunlar if isinstance(s, str) and s in df.columns))
+    tipler = {s: (df[s].dtype.numpy_dtype if pd.api.types.is_integer_dtype(df[s].dtype) and not df[s].hasnans
+                  else 'float64') for s in sutunlar
+              if pd.api.types.is_extension_array_dtype(df[s].dtype) and pd.api.types.is_numeric_dtype(df[s].dtype)
+              and not isinstance(df[s].dtype, pd.CategoricalDtype)}
+    return df[sutunlar].astype(tipler) if tipler else df
+
+
+@profillenir()
+def dagilim_ciz(df, x, y, boyut=None, renk=None, ax=None, esik=None, bicim='kare', kutu=None, **scatter_kws):
+    """
+    sns.scatterplot(data=df, x=x, y=y, size=boyut, hue=renk, **scatter_kws)
+    yerine geçer: satır sayısı eşiği aşmıyorsa birebir aynı çağrıyı yapar,
+    aşıyorsa yoğunluk_ciz() ile kutulanmış görünüm çizer (sizes, edgecolor
+    gibi işaretçi ayarları bu modda yok sayılır).
+    """
+    import seaborn as sns
+
+    esik = yogunluk_esigi() if esik is None else esik
+    if len(df) <= esik:
+        df = _seaborn_tipleri(df, [x, y, boyut, renk, scatter_kws.get('style')])
+        return sns.scatterplot(data=df, x=x, y=y, size=boyut, hue=renk, ax=ax, **scatter_kws)
+    return yogunluk_ciz(df, x, y, boyut=boyut, renk=renk, ax=ax, palette=scatter_kws.get('palette'),
+                        alpha=scatter_kws.get('alpha', 1.0), bicim=bicim, kutu=kutu)
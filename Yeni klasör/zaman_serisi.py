@@ -0,0 +1,158 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from istatistik_cekirdek import f_p_degeri, t_p_degerleri
+from profil import profillenir
+from sonuc_onbellegi import onbellekli
+
+# ---------------------------------------------------------
+# YILLIK SERİLER: KAYAN PENCERE REGRESYONU VE YAPISAL KIRILMA
+# ---------------------------------------------------------
+# Seri bir kez zamana göre sıralanır ve n, Σx, Σy, Σx², Σy², Σxy için önek
+# (kümülatif) toplamlar alınır. Herhangi bir [i, j) aralığının regresyonu
+# bu toplamların farkından O(1)'de çıkar; böylece:
+#   - Kayan pencere: her adım için yeniden uydurma yok, bütün pencereler
+#     tek vektörel işlemle hesaplanır.
+#   - Tek kırılma: her aday bölme noktasının SSE(0,k) + SSE(k,n) değeri
+#     aynı anda hesaplanır; en iyisi için Chow F-testi raporlanır.
+#   - Çoklu kırılma: bütün [i, j) aralıklarının SSE matrisi üzerinde
+#     dinamik programlama (Bai-Perron), kırılma sayısı BIC ile seçilir.
+# Pencereler gözlem sayısıyla değil yıl farkıyla tanımlanır, bu yüzden
+# su_verisi.csv'deki gibi düzensiz yıl aralıkları sorun olmaz.
+
+
+def _hazirla(zaman, y, x=None):
+    zaman = np.asarray(zaman, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x = zaman if x is None else np.asarray(x, dtype=float)
+    gecerli = ~(np.isnan(zaman) | np.isnan(x) | np.isnan(y))
+    zaman, x, y = zaman[gecerli], x[gecerli], y[gecerli]
+    sira = np.argsort(zaman, kind='stable')
+    return zaman[sira], x[sira], y[sira]
+
+
+class _OnekToplamlar:
+    """[i, j) aralıklarının eş-moment toplamları için önek toplamlar."""
+
+    def __init__(self, x, y):
+        # Sayısal iptali azaltmak için genel ortalamalara göre kaydır
+        self.kx, self.ky = x.mean(), y.mean()
+        dx, dy = x - self.kx, y - self.ky
+        sifir = lambda v: np.concatenate([[0.0], np.cumsum(v)])
+        self.sx, self.sy = sifir(dx), sifir(dy)
+        self.sxx, self.syy, self.sxy = sifir(dx * dx), sifir(dy * dy), sifir(dx * dy)
+
+    def aralik(self, i, j):
+        """i, j dizileri (yarı açık aralık) için n, ortalamalar ve merkezî momentler."""
+        n = (np.asarray(j) - np.asarray(i)).astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sx, sy = self.sx[j] - self.sx[i], self.sy[j] - self.sy[i]
+            ort_x, ort_y = sx / n, sy / n
+            cxx = self.sxx[j] - self.sxx[i] - sx * ort_x
+            cyy = self.syy[j] - self.syy[i] - sy * ort_y
+            cxy = self.sxy[j] - self.sxy[i] - sx * ort_y
+        return n, ort_x + self.kx, ort_y + self.ky, cxx, cyy, cxy
+
+    def sse(self, i, j):
+        """Aralıktaki basit regresyonun artık kareler toplamı."""
+        n, _, _, cxx, cyy, cxy = self.aralik(i, j)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sse = np.where(cxx > 0, cyy - cxy * cxy / cxx, cyy)
+        return np.maximum(sse, 0.0)
+
+
+def kayan_regresyon(zaman, y, x=None, pencere=10, en_az=3):
+    """
+    Her gözlemde biten ve son `pencere` yılı (zaman[i] - pencere, zaman[i]]
+    kapsayan pencerenin regresyonu (x verilmezse y ~ zaman).
+    Dönüş: bitiş yılı başına DataFrame (bas, bit, n, egim, kesisim, r, p).
+    """
+    zaman, x, y = _hazirla(zaman, y, x)
+    toplam = _OnekToplamlar(x, y)
+    j = np.arange(1, zaman.size + 1)
+    i = np.searchsorted(zaman, zaman - pencere, side='right')
+    n, ort_x, ort_y, cxx, cyy, cxy = toplam.aralik(i, j)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        egim = cxy / cxx
+        r = np.clip(cxy / np.sqrt(cxx * cyy), -1.0, 1.0)
+        t = r * np.sqrt((n - 2) / (1 - r * r))
+    p = t_p_degerleri(t, n - 2)
+    yetersiz = n < en_az
+    for dizi in (egim, r, p):
+        dizi[yetersiz] = np.nan
+
+    return pd.DataFrame({'bas': zaman[i], 'bit': zaman, 'n': n.astype(int),
+                         'egim': egim, 'kesisim': ort_y - egim * ort_x, 'r': r, 'p': p})
+
+
+def kirilma_noktasi(zaman, y, x=None, en_az=3):
+    """
+    Tek yapısal kırılma: her bölme noktası k için SSE(0,k) + SSE(k,n) aynı
+    anda hesaplanır. Dönüş: {'yil' (yeni rejimin ilk yılı), 'sse', 'chow_f',
+    'p', 'adaylar' (yil -> toplam SSE)}. p-değeri seçilen nokta için nominal
+    Chow testidir; nokta veriden seçildiği için iyimserdir.
+    """
+    zaman, x, y = _hazirla(zaman, y, x)
+    n = zaman.size
+    if n < 2 * en_az:
+        raise ValueError(f"Kırılma araması için en az {2 * en_az} gözlem gerekli (n={n})")
+    toplam = _OnekToplamlar(x, y)
+    k = np.arange(en_az, n - en_az + 1)
+    sse = toplam.sse(np.zeros_like(k), k) + toplam.sse(k, np.full_like(k, n))
+    en_iyi = int(np.argmin(sse))
+    sse_tek = float(toplam.sse(np.array([0]), np.array([n]))[0])
+    sse_iki = float(sse[en_iyi])
+    sd = n - 4
+    f = ((sse_tek - sse_iki) / 2) / (sse_iki / sd) if sse_iki > 0 and sd > 0 else math.inf
+    return {'yil': float(zaman[k[en_iyi]]), 'sse': sse_iki, 'chow_f': float(f), 'p': f_p_degeri(float(f), 2, sd),
+            'adaylar': pd.Series(sse, index=zaman[k], name='sse')}
+
+
+@profillenir()
+@onbellekli()
+def kirilma_noktalari(zaman, y, x=None, en_fazla=3, en_az=3):
+    """
+    0..en_fazla kırılma için en iyi bölmeler (dinamik programlama) ve BIC'e
+    göre seçilen kırılma sayısı. Her segment kendi eğim ve kesişimine sahiptir.
+    Dönüş: {'yillar': seçilen kırılma yılları, 'bic': kırılma sayısı -> BIC,
+    'segmentler': DataFrame (bas, bit, n, egim, kesisim)}
+    """
+    zaman, x, y = _hazirla(zaman, y, x)
+    n = zaman.size
+    toplam = _OnekToplamlar(x, y)
+
+    # maliyet[i, j]: [i, j) segmentinin SSE'si; en_az'dan kısa segmentler yasak
+    i, j = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij')
+    maliyet = np.full((n + 1, n + 1), np.inf)
+    izinli = j - i >= en_az
+    maliyet[izinli] = toplam.sse(i[izinli], j[izinli])
+
+    en_fazla = min(en_fazla, n // en_az - 1)
+    enk = [maliyet[0]]              # enk[m][j]: ilk j gözlem, m kırılma
+    geri = []
+    for _ in range(en_fazla):
+        aday = enk[-1][:, None] + maliyet     # önceki bitiş i -> yeni segment [i, j)
+        geri.append(np.argmin(aday, axis=0))
+        enk.append(aday[geri[-1], np.arange(n + 1)])
+
+    bic = {}
+    for m in range(en_fazla + 1):
+        sse = enk[m][n]
+        if np.isfinite(sse):
+            bic[m] = n * math.log(max(sse, 1e-300) / n) + math.log(n) * (3 * m + 2)
+    m = min(bic, key=bic.get)
+
+    sinirlar = [n]
+    for g in reversed(geri[:m]):
+        sinirlar.append(int(g[sinirlar[-1]]))
+    sinirlar = [0] + sinirlar[::-1]
+
+    bas, bit = np.array(sinirlar[:-1]), np.array(sinirlar[1:])
+    sn, ort_x, ort_y, cxx, _, cxy = toplam.aralik(bas, bit)
+    egim = cxy / cxx
+    segmentler = pd.DataFrame({'bas': zaman[bas], 'bit': zaman[bit - 1], 'n': sn.astype(int),
+                               'egim': egim, 'kesisim': ort_y - egim * ort_x})
+    return {'yillar': [float(v) for v in zaman[bas[1:]]], 'bic': bic, 'segmentler': segmentler}